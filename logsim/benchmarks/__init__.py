@@ -0,0 +1,12 @@
+"""Measure the performance of the Logic Simulator.
+
+Used in the Logic Simulator project to generate definition files of any
+size and shape and time each stage of simulating them.
+
+Modules
+-------
+generators - writes synthetic circuit definition files.
+bench - times scanning, parsing, elaboration, simulation and monitors.
+golden - checks alternative engines give the same traces as the reference.
+fuzz - checks malformed definition files are parsed in bounded time.
+"""
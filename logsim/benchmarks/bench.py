@@ -0,0 +1,246 @@
+"""Time each stage of simulating synthetic circuits.
+
+Used in the Logic Simulator benchmarks to measure, separately, how long it
+takes to scan, parse and elaborate a definition file, how many cycles per
+second the network executes, and how much memory the monitors use. The
+results are written as JSON so that runs can be compared for regressions.
+
+Run from the logsim directory:
+
+    python -m benchmarks.bench [-o <output file>] [-c <cycles>]
+                               [-r <seed>] [-d <directory>]
+                               [-s <circuit>=<size>] ...
+
+Functions
+---------
+time_scan(path, mapped=False): Returns the time taken to scan a file and
+                               its symbols.
+
+time_circuit(name, text, cycles, seed, directory): Returns the benchmark
+                                                   results of one circuit.
+
+run_benchmarks(sizes, cycles, seed, directory): Returns the benchmark
+                                                results of every circuit.
+
+main(arg_list): Parses the command line options and runs the benchmarks.
+"""
+import contextlib
+import getopt
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+from error_handling import ErrorHandler
+
+from benchmarks import generators
+
+# Circuit name: (generator, default size)
+CIRCUITS = {
+    "ripple_adder": (generators.ripple_adder, 64),
+    "shift_register": (generators.shift_register, 256),
+    "random_dag": (generators.random_dag, 1000),
+    "nand_latches": (generators.nand_latches, 64),
+    "not_chain": (generators.not_chain, 500),
+}
+
+
+def time_scan(path, mapped=False):
+    """Return the time taken to scan the file and the number of symbols.
+
+    If mapped is True, the file is memory-mapped.
+    """
+    names = Names()
+    start = time.perf_counter()
+    scanner = Scanner(path, names, mapped)
+    symbols = 1
+    while scanner.get_symbol().type != scanner.EOF:
+        symbols += 1
+    return time.perf_counter() - start, symbols
+
+
+def _build(path):
+    """Return the network objects and the time taken to parse the file."""
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    # The parser prints every symbol, which would dominate the timing
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            scanner = Scanner(path, names)
+            parser = Parser(names, devices, network, monitors, scanner,
+                            error_handler)
+            parsed = parser.parse_network()
+            parse_time = time.perf_counter() - start
+    if not parsed:
+        raise ValueError("".join(["Could not parse the generated file ",
+                                  path]))
+    return devices, network, monitors, parse_time
+
+
+def time_circuit(name, text, cycles, seed, directory):
+    """Return a dictionary of the benchmark results of one circuit.
+
+    The circuit text is written to a .vi file in directory, then scanned,
+    parsed, elaborated and run for the given number of cycles. The monitor
+    memory is measured on a separate run with every output monitored.
+    """
+    path = os.path.join(directory, name + ".vi")
+    with open(path, "w") as definition_file:
+        definition_file.write(text)
+    results = {"name": name}
+
+    results["scan_seconds"], results["symbols"] = time_scan(path)
+    results["mapped_scan_seconds"], _ = time_scan(path, mapped=True)
+
+    devices, network, monitors, results["parse_seconds"] = _build(path)
+    results["devices"] = len(devices.devices_list)
+
+    start = time.perf_counter()
+    network.elaborate()
+    results["elaborate_seconds"] = time.perf_counter() - start
+    results["logic_depth"] = network.logic_depth
+
+    devices.cold_startup(seed)
+    network.reset_clocks()
+    completed = 0
+    start = time.perf_counter()
+    while completed < cycles and network.execute_network():
+        completed += 1
+    elapsed = time.perf_counter() - start
+    results["cycles"] = completed
+    results["oscillating"] = completed < cycles
+    results["execute_seconds"] = elapsed
+    results["cycles_per_second"] = completed / elapsed if elapsed else None
+    results["metrics"] = network.metrics.get_summary()
+
+    # Monitor every output and measure the memory the traces take
+    devices, network, monitors, _ = _build(path)
+    network.elaborate()
+    devices.cold_startup(seed)
+    network.reset_clocks()
+    monitors.make_monitors([signal for signal in monitors.find_signals("*")
+                            if tuple(signal) not in
+                            monitors.monitors_dictionary])
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(completed):
+        network.execute_network()
+        monitors.record_signals()
+    monitor_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    results["monitors"] = len(monitors.monitors_dictionary)
+    results["monitor_bytes"] = monitor_bytes
+    if completed and monitors.monitors_dictionary:
+        results["monitor_bytes_per_sample"] = monitor_bytes / (
+            completed * len(monitors.monitors_dictionary))
+    else:
+        results["monitor_bytes_per_sample"] = None
+    return results
+
+
+def run_benchmarks(sizes, cycles, seed, directory):
+    """Return a dictionary of the benchmark results of every circuit.
+
+    sizes maps each circuit name in CIRCUITS to its size.
+    """
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cycles": cycles,
+        "seed": seed,
+        "circuits": [],
+    }
+    for name, size in sizes.items():
+        generator = CIRCUITS[name][0]
+        circuit = time_circuit(name, generator(size), cycles, seed,
+                               directory)
+        circuit["size"] = size
+        results["circuits"].append(circuit)
+    return results
+
+
+def main(arg_list):
+    """Parse the command line options and run the benchmarks."""
+    usage_message = ("Usage:\n"
+                     "python -m benchmarks.bench [-o <output file>] "
+                     "[-c <cycles>] [-r <seed>] [-d <directory>] "
+                     "[-s <circuit>=<size>] ...\n"
+                     "Circuits: " + ", ".join(CIRCUITS))
+    try:
+        options, arguments = getopt.getopt(arg_list, "ho:c:r:d:s:")
+    except getopt.GetoptError:
+        print("Error: invalid command line arguments\n")
+        print(usage_message)
+        sys.exit()
+
+    output_path = "benchmark_results.json"
+    cycles = 200
+    seed = 0
+    directory = None
+    sizes = {name: size for name, (_, size) in CIRCUITS.items()}
+    chosen = {}
+    try:
+        for option, value in options:
+            if option == "-h":
+                print(usage_message)
+                sys.exit()
+            elif option == "-o":
+                output_path = value
+            elif option == "-c":
+                cycles = int(value)
+            elif option == "-r":
+                seed = int(value)
+            elif option == "-d":
+                directory = value
+            elif option == "-s":
+                name, size = value.split("=")
+                if name not in CIRCUITS:
+                    raise ValueError(name)
+                chosen[name] = int(size)
+    except ValueError:
+        print("Error: invalid command line arguments\n")
+        print(usage_message)
+        sys.exit()
+    if chosen:  # only run the circuits asked for
+        sizes = chosen
+
+    if directory is None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            results = run_benchmarks(sizes, cycles, seed,
+                                     temporary_directory)
+    else:
+        results = run_benchmarks(sizes, cycles, seed, directory)
+
+    with open(output_path, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    row = "{:<16}{:>8}{:>10}{:>10}{:>10}{:>10}{:>12}{:>12}"
+    print(row.format("circuit", "devices", "scan s", "mmap s", "parse s",
+                     "elab s", "cycles/s", "mon bytes"))
+    for circuit in results["circuits"]:
+        print(row.format(
+            circuit["name"], circuit["devices"],
+            "{:.4f}".format(circuit["scan_seconds"]),
+            "{:.4f}".format(circuit["mapped_scan_seconds"]),
+            "{:.4f}".format(circuit["parse_seconds"]),
+            "{:.4f}".format(circuit["elaborate_seconds"]),
+            "{:.1f}".format(circuit["cycles_per_second"] or 0),
+            circuit["monitor_bytes"]))
+    print("Results written to", output_path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,229 @@
+"""Fuzz the scanner and parser with malformed definition files.
+
+Used in the Logic Simulator benchmarks to check that bad input is handled
+in bounded time. Random files are generated by mutating the example
+definition files and by stringing together random symbols of the
+language. Each file is scanned and parsed, and the harness checks that:
+
+- parsing finishes, within a time limit;
+- the parse time per symbol stays under a bound, so error recovery is
+  never quadratic;
+- the number of errors reported is at most the number of symbols, so
+  every error consumes input.
+
+Python exceptions raised while parsing are counted and reported too.
+
+Run from the logsim directory:
+
+    python -m benchmarks.fuzz [-n <files>] [-r <seed>] [-t <us per symbol>]
+
+The exit status is 1 if any file breaks a bound.
+
+Functions
+---------
+mutate(text, generator): Returns a randomly damaged copy of text.
+
+random_symbols(generator): Returns random text made of language symbols.
+
+edge_cases(): Returns files at the edges of the scanner, such as files
+              ending in a comment.
+
+check_file(path, time_per_symbol): Returns the result of scanning and
+                                   parsing a file.
+
+fuzz(count, seed, time_per_symbol, directory): Returns the results of
+                                               checking count random files.
+
+main(arg_list): Parses the command line options and runs the fuzzer.
+"""
+import contextlib
+import getopt
+import os
+import random
+import sys
+import tempfile
+import time
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+from error_handling import ErrorHandler
+
+from benchmarks import generators
+from benchmarks.golden import ParseTimeout, _time_limit, find_definition_files
+
+FILE_TIME_LIMIT = 10  # seconds allowed to scan and parse one file
+TIME_PER_SYMBOL = 2000  # default bound on the parse time per symbol, in us
+FIXED_TIME = 0.05  # parse time allowed on top of the bound per symbol
+
+VOCABULARY = ["SWITCH", "CLOCK", "AND", "OR", "NAND", "NOR", "XOR", "NOT",
+              "DTYPE", "CONNECT", "MONITOR", "CIRCUIT", "INPUT", "OUTPUT",
+              "IN", "OUT", "PERIOD", "TO", "a", "b1", "sw", "d", "Q", "QBAR",
+              "DATA", "CLK", "SET", "CLEAR", "I1", "I2", "0", "1", "2", "16",
+              "99", ",", ";", "=", ".", "(", ")", "[", "]", "{", "}", "*",
+              "->", "-", ">", "#", "# comment\n", "\n", " ", "\t", "$", "\r"]
+
+
+def mutate(text, generator):
+    """Return a copy of text with random characters or lines damaged."""
+    characters = list(text)
+    for _ in range(generator.randint(1, 8)):
+        if not characters:
+            break
+        position = generator.randrange(len(characters))
+        action = generator.choice(["delete", "insert", "replace",
+                                   "duplicate", "truncate"])
+        if action == "delete":
+            del characters[position:position + generator.randint(1, 5)]
+        elif action == "insert":
+            characters[position:position] = list(
+                generator.choice(VOCABULARY))
+        elif action == "replace":
+            characters[position] = generator.choice("#;,.()[]{}=->*$ \n0a")
+        elif action == "duplicate":
+            end = position + generator.randint(1, 40)
+            characters[position:position] = characters[position:end]
+        else:
+            del characters[position:]
+    return "".join(characters)
+
+
+def random_symbols(generator):
+    """Return random text made of symbols of the language."""
+    return " ".join(generator.choice(VOCABULARY)
+                    for _ in range(generator.randint(0, 400)))
+
+
+def edge_cases():
+    """Return files at the edges of the scanner and parser."""
+    return ["", "#", "# only a comment", "\n\n#\n#", "SWITCH a = 0; #",
+            "SWITCH a = 0;\n# comment without a newline", "SWITCH",
+            "SWITCH a", "}", "};};", "INPUT a = b;", "OUTPUT", "->", "-",
+            "$$$", "CIRCUIT c {", "CIRCUIT c { NAND n(IN = 2); ",
+            "NAND n[1 TO", "NAND n[5 TO 1](IN = 2);", "MONITOR a*",
+            "\r\n\r\n", "SWITCH a = 0;\r\n# comment\r"]
+
+
+def check_file(path, time_per_symbol):
+    """Return a dictionary describing how the scanner and parser did.
+
+    The status is "ok", "timeout" (the file took too long), "slow" (the
+    parse time per symbol was over the bound), "errors" (more errors than
+    symbols) or "exception" (Python raised an exception).
+    """
+    result = {"file": path}
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    try:
+        with open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                with _time_limit(FILE_TIME_LIMIT):
+                    scanner = Scanner(path, names)
+                    symbols = 1
+                    while scanner.get_symbol().type != scanner.EOF:
+                        symbols += 1
+                    result["symbols"] = symbols
+
+                    start = time.perf_counter()
+                    scanner = Scanner(path, names)
+                    parser = Parser(names, devices, network, monitors,
+                                    scanner, error_handler)
+                    parser.parse_network()
+                    seconds = time.perf_counter() - start
+    except ParseTimeout:
+        result["status"] = "timeout"
+        return result
+    except Exception as exception:  # any crash is reported, not raised
+        result["status"] = "exception"
+        result["exception"] = repr(exception)
+        return result
+
+    result["seconds"] = seconds
+    result["errors"] = error_handler.error_count
+    if seconds > FIXED_TIME + symbols * time_per_symbol / 1e6:
+        result["status"] = "slow"
+    elif error_handler.error_count > symbols:
+        result["status"] = "errors"
+    else:
+        result["status"] = "ok"
+    return result
+
+
+def fuzz(count, seed, time_per_symbol, directory):
+    """Return the results of checking count random files and edge cases.
+
+    The files are written to directory.
+    """
+    generator = random.Random(seed)
+    examples = []
+    for path in find_definition_files():
+        with open(path) as definition_file:
+            examples.append(definition_file.read())
+    examples.append(generators.random_netlist(20, seed=seed))
+    examples.append(generators.nand_latches(2))
+
+    texts = edge_cases()
+    for _ in range(count):
+        if generator.random() < 0.7:
+            texts.append(mutate(generator.choice(examples), generator))
+        else:
+            texts.append(random_symbols(generator))
+
+    results = []
+    for index, text in enumerate(texts):
+        path = os.path.join(directory, "fuzz{}.vi".format(index))
+        with open(path, "w") as fuzz_file:
+            fuzz_file.write(text)
+        results.append(check_file(path, time_per_symbol))
+    return results
+
+
+def main(arg_list):
+    """Parse the command line options and run the fuzzer."""
+    usage_message = ("Usage:\n"
+                     "python -m benchmarks.fuzz [-n <files>] [-r <seed>] "
+                     "[-t <us per symbol>]")
+    try:
+        options, arguments = getopt.getopt(arg_list, "hn:r:t:")
+        count = 500
+        seed = 0
+        time_per_symbol = TIME_PER_SYMBOL
+        for option, value in options:
+            if option == "-h":
+                print(usage_message)
+                sys.exit()
+            elif option == "-n":
+                count = int(value)
+            elif option == "-r":
+                seed = int(value)
+            elif option == "-t":
+                time_per_symbol = float(value)
+    except (getopt.GetoptError, ValueError):
+        print("Error: invalid command line arguments\n")
+        print(usage_message)
+        sys.exit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = fuzz(count, seed, time_per_symbol, directory)
+        statuses = {}
+        for result in results:
+            statuses[result["status"]] = statuses.get(result["status"],
+                                                      0) + 1
+            if result["status"] != "ok":
+                print(result["status"], result.get("exception", ""),
+                      repr(open(result["file"]).read()[:200]))
+
+    print(len(results), "files:", ", ".join(
+        "{} {}".format(count, status) for status, count in statuses.items()))
+    if any(status in statuses for status in ["timeout", "slow", "errors"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,286 @@
+"""Write synthetic circuit definition files.
+
+Used in the Logic Simulator benchmarks to build circuits of a chosen size
+in the logic description language, so that performance can be measured on
+designs much larger than the hand-written examples.
+
+Every generator takes the size of the circuit and returns the text of a
+.vi file. Device names are a letter followed by a number, and the files
+use ranges such as d[1 TO 8] where they can.
+
+Functions
+---------
+ripple_adder(bits): Returns an N-bit ripple carry adder.
+
+shift_register(length): Returns a shift register of D-types.
+
+random_dag(size, seed=0): Returns a random acyclic network of gates.
+
+random_netlist(size, seed=0, feedback=0.2, buses=0, width=16): Returns a
+               random network of every kind of device, with loops.
+
+nand_latches(count): Returns an array of master-slave JK flip-flops built
+                     from NAND gates.
+
+not_chain(length): Returns a chain of NOT gates.
+"""
+import random
+
+
+def ripple_adder(bits):
+    """Return the definition of a ripple carry adder of the given bits.
+
+    Each bit is a full adder of two XOR, two AND and one OR gate, and the
+    carry out of each bit feeds the next. The carry ripples through all
+    the bits, so the logic depth grows with the width.
+    """
+    lines = ["SWITCH a[1 TO {0}] = 1, b[1 TO {0}] = 0, cin = 1;".format(bits),
+             "XOR x[1 TO {0}], s[1 TO {0}];".format(bits),
+             "AND g[1 TO {0}](IN = 2), h[1 TO {0}](IN = 2);".format(bits),
+             "OR c[1 TO {0}](IN = 2);".format(bits)]
+    for bit in range(1, bits + 1):
+        carry = "cin" if bit == 1 else "c{}".format(bit - 1)
+        lines.append(
+            "CONNECT a{0} -> x{0}.I1, b{0} -> x{0}.I2, "
+            "x{0} -> s{0}.I1, {1} -> s{0}.I2, "
+            "a{0} -> h{0}.I1, b{0} -> h{0}.I2, "
+            "x{0} -> g{0}.I1, {1} -> g{0}.I2, "
+            "g{0} -> c{0}.I1, h{0} -> c{0}.I2;".format(bit, carry))
+    lines.append("MONITOR s[1 TO {0}], c{0};".format(bits))
+    return "\n".join(lines) + "\n"
+
+
+def shift_register(length):
+    """Return the definition of a shift register of the given length.
+
+    A switch feeds the first D-type, every D-type feeds the next, and all
+    are clocked by a single clock.
+    """
+    lines = ["SWITCH data = 1, zero = 0;",
+             "CLOCK clk(PERIOD = 1);",
+             "DTYPE d[1 TO {}];".format(length),
+             "CONNECT data -> d1.DATA;"]
+    for stage in range(1, length + 1):
+        connections = ["clk -> d{}.CLK".format(stage),
+                       "zero -> d{}.SET".format(stage),
+                       "zero -> d{}.CLEAR".format(stage)]
+        if stage < length:
+            connections.append("d{0}.Q -> d{1}.DATA".format(stage,
+                                                            stage + 1))
+        lines.append("CONNECT " + ", ".join(connections) + ";")
+    lines.append("MONITOR d1.Q, d{}.Q;".format(length))
+    return "\n".join(lines) + "\n"
+
+
+def random_dag(size, seed=0):
+    """Return the definition of a random acyclic network of gates.
+
+    The network has size gates of random kinds. Each gate input is driven
+    by a switch or an earlier gate, so there are no loops. The same seed
+    always gives the same network.
+    """
+    generator = random.Random(seed)
+    switches = max(2, size // 10)
+    lines = ["SWITCH s[1 TO {}] = 0;".format(switches)]
+    for switch in range(1, switches + 1, 2):
+        lines.append("SWITCH t{} = 1;".format(switch))
+    sources = (["s{}".format(switch) for switch in range(1, switches + 1)] +
+               ["t{}".format(switch) for switch in range(1, switches + 1, 2)])
+    for gate in range(1, size + 1):
+        name = "g{}".format(gate)
+        kind = generator.choice(["AND", "OR", "NAND", "NOR", "XOR", "NOT"])
+        if kind == "XOR":
+            inputs = 2
+            lines.append("XOR {};".format(name))
+        elif kind == "NOT":
+            inputs = 1
+            lines.append("NOT {};".format(name))
+        else:
+            inputs = generator.randint(1, 4)
+            lines.append("{} {}(IN = {});".format(kind, name, inputs))
+        connections = ["{} -> {}.I{}".format(generator.choice(sources), name,
+                                             pin)
+                       for pin in range(1, inputs + 1)]
+        lines.append("CONNECT " + ", ".join(connections) + ";")
+        sources.append(name)
+    lines.append("MONITOR g{};".format(size))
+    return "\n".join(lines) + "\n"
+
+
+def random_netlist(size, seed=0, feedback=0.2, buses=0, width=16):
+    """Return the definition of a random network of every kind of device.
+
+    The network has switches, clocks of random periods, D-types and gates.
+    A fraction feedback of the inputs may be driven by any device, including
+    later ones and the device itself, so the network can have loops and may
+    oscillate. The same seed always gives the same network.
+
+    If buses is given, that many ranges of gates or D-types of up to width
+    devices are added after the single devices. Each input of a range is
+    driven by the outputs of another range in order, from any start and
+    wrapping round, or in reverse order, or by one output for the whole
+    range, or by a random output for every device, so both the slices and
+    the single inputs of vectorized buses are covered.
+    """
+    generator = random.Random(seed)
+    lines = []
+    devices = []  # (name, list of input ports, list of output signals)
+    for index in range(1, size + 1):
+        name = "r{}".format(index)
+        if index <= 3:
+            lines.append("SWITCH {} = {};".format(name,
+                                                  generator.randint(0, 1)))
+            devices.append((name, [], [name]))
+            continue
+        if index <= 5:
+            lines.append("CLOCK {}(PERIOD = {});".format(
+                name, generator.randint(1, 5)))
+            devices.append((name, [], [name]))
+            continue
+        kind, inputs, suffixes = _random_kind(generator)
+        if kind in ["AND", "OR", "NAND", "NOR"]:
+            lines.append("{} {}(IN = {});".format(kind, name, len(inputs)))
+        else:
+            lines.append("{} {};".format(kind, name))
+        devices.append((name, inputs,
+                        [name + suffix for suffix in suffixes]))
+
+    ranges = []  # (prefix, width, list of input ports, output suffixes)
+    for index in range(1, buses + 1):
+        prefix = "q{}x".format(index)
+        range_width = generator.randint(2, width)
+        kind, inputs, suffixes = _random_kind(generator)
+        declaration = "{} {}[1 TO {}]".format(kind, prefix, range_width)
+        if kind in ["AND", "OR", "NAND", "NOR"]:
+            declaration += "(IN = {})".format(len(inputs))
+        lines.append(declaration + ";")
+        ranges.append((prefix, range_width, inputs, suffixes))
+
+    all_outputs = [output for _, _, outputs in devices for output in outputs]
+    for prefix, range_width, _, suffixes in ranges:
+        all_outputs.extend(["{}{}{}".format(prefix, device, suffix)
+                            for suffix in suffixes
+                            for device in range(1, range_width + 1)])
+    earlier_outputs = []  # outputs of the devices connected so far
+    for name, inputs, outputs in devices:
+        connections = []
+        for port in inputs:
+            if generator.random() < feedback or not earlier_outputs:
+                source = generator.choice(all_outputs)
+            else:
+                source = generator.choice(earlier_outputs)
+            connections.append("{} -> {}.{}".format(source, name, port))
+        if connections:
+            lines.append("CONNECT " + ", ".join(connections) + ";")
+        earlier_outputs.extend(outputs)
+
+    for position, (prefix, range_width, inputs, suffixes) in enumerate(
+            ranges):
+        connections = []
+        for port in inputs:
+            if generator.random() < feedback:
+                source_ranges = ranges
+            else:
+                source_ranges = ranges[:position]
+            connections.extend(_random_range_sources(
+                generator, prefix, range_width, port, source_ranges,
+                earlier_outputs, all_outputs, feedback))
+        lines.append("CONNECT " + ", ".join(connections) + ";")
+        earlier_outputs.extend(["{}{}{}".format(prefix, device, suffix)
+                                for suffix in suffixes
+                                for device in range(1, range_width + 1)])
+    lines.append("MONITOR " + ", ".join(all_outputs[:8]) + ";")
+    return "\n".join(lines) + "\n"
+
+
+def _random_kind(generator):
+    """Return a random device kind, its input ports and output suffixes."""
+    kind = generator.choice(["AND", "OR", "NAND", "NOR", "XOR", "NOT",
+                             "DTYPE"])
+    if kind == "DTYPE":
+        return kind, ["DATA", "CLK", "SET", "CLEAR"], [".Q", ".QBAR"]
+    elif kind == "XOR":
+        return kind, ["I1", "I2"], [""]
+    elif kind == "NOT":
+        return kind, ["I1"], [""]
+    pins = generator.randint(1, 3)
+    return kind, ["I{}".format(pin) for pin in range(1, pins + 1)], [""]
+
+
+def _random_range_sources(generator, prefix, range_width, port, ranges,
+                          earlier_outputs, all_outputs, feedback):
+    """Return the connections driving one input port of a range.
+
+    The sources are the outputs of one of ranges, in order from a random
+    start or in reverse order, wrapping round at the end, or a single
+    output for every device, or a random output for each device.
+    """
+    inputs = "{}[1 TO {}].{}".format(prefix, range_width, port)
+    pattern = generator.choice(["in order", "reversed", "single",
+                                "random"])
+    if pattern in ["in order", "reversed"] and ranges:
+        source_prefix, source_width, _, suffixes = generator.choice(ranges)
+        suffix = generator.choice(suffixes)
+        start = generator.randrange(source_width)
+        if pattern == "in order" and start + range_width <= source_width:
+            # Written as a range, as it needs no wrapping round
+            return ["{}[{} TO {}]{} -> {}".format(
+                source_prefix, start + 1, start + range_width, suffix,
+                inputs)]
+        step = 1 if pattern == "in order" else -1
+        sources = ["{}{}{}".format(
+            source_prefix, (start + step * device) % source_width + 1,
+            suffix) for device in range(range_width)]
+    elif pattern == "single" or not earlier_outputs:
+        return ["{} -> {}".format(
+            generator.choice(earlier_outputs or all_outputs), inputs)]
+    else:
+        sources = [generator.choice(all_outputs)
+                   if generator.random() < feedback else
+                   generator.choice(earlier_outputs)
+                   for _ in range(range_width)]
+    return ["{} -> {}{}.{}".format(source, prefix, device, port)
+            for device, source in enumerate(sources, 1)]
+
+
+def nand_latches(count):
+    """Return the definition of an array of NAND flip-flops.
+
+    Each flip-flop is the master-slave JK flip-flop of masterslave.vi,
+    built from nine NAND gates, with its own J and K switches and a shared
+    clock. The cross-coupled NAND pairs make every flip-flop a feedback
+    loop.
+    """
+    lines = ["CLOCK clk(PERIOD = 2);"]
+    for latch in range(1, count + 1):
+        lines.extend([
+            "SWITCH j{0} = 1, k{0} = 1;".format(latch),
+            "NAND m{0}n[1 TO 2](IN = 3), m{0}n[3 TO 8](IN = 2), "
+            "m{0}c(IN = 2);".format(latch),
+            "CONNECT clk -> m{0}n1.I3, clk -> m{0}n2.I1, "
+            "j{0} -> m{0}n1.I2, k{0} -> m{0}n2.I2;".format(latch),
+            "CONNECT m{0}n1 -> m{0}n3.I1, m{0}n2 -> m{0}n4.I2, "
+            "m{0}n3 -> m{0}n4.I1, m{0}n4 -> m{0}n3.I2;".format(latch),
+            "CONNECT m{0}n3 -> m{0}n5.I1, m{0}n4 -> m{0}n6.I2, "
+            "clk -> m{0}c.I1, clk -> m{0}c.I2, "
+            "m{0}c -> m{0}n5.I2, m{0}c -> m{0}n6.I1;".format(latch),
+            "CONNECT m{0}n5 -> m{0}n7.I1, m{0}n6 -> m{0}n8.I2, "
+            "m{0}n7 -> m{0}n8.I1, m{0}n8 -> m{0}n7.I2, "
+            "m{0}n7 -> m{0}n2.I3, m{0}n8 -> m{0}n1.I1;".format(latch)])
+    lines.append("MONITOR clk, m1n7, m1n8;")
+    return "\n".join(lines) + "\n"
+
+
+def not_chain(length):
+    """Return the definition of a chain of NOT gates.
+
+    A switch drives the first gate and each gate drives the next, giving a
+    network as deep as it is long.
+    """
+    lines = ["SWITCH s = 1;",
+             "NOT n[1 TO {}];".format(length),
+             "CONNECT s -> n1.I1;"]
+    for gate in range(1, length):
+        lines.append("CONNECT n{0} -> n{1}.I1;".format(gate, gate + 1))
+    lines.append("MONITOR n{};".format(length))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,307 @@
+"""Check that alternative simulation engines match the reference engine.
+
+Used in the Logic Simulator benchmarks to run every definition file, and
+random netlists with and without ranges of devices, under the reference
+engine (Network.execute_network called once per cycle, with every device
+executed on its own) and under each alternative engine, with the same
+start-up seed. Every output is monitored and the traces are compared
+cycle by cycle, RISING and FALLING states included. The time each engine
+takes is reported as a speedup over the reference.
+
+Run from the logsim directory:
+
+    python -m benchmarks.golden [-c <cycles>] [-r <seed>]
+                                [-n <random netlists>] [-b <ranges>]
+                                [-o <output file>]
+
+The exit status is 1 if any engine differs from the reference.
+
+Functions
+---------
+run_reference(network, monitors, cycles): Runs the reference engine.
+
+run_vectorized(network, monitors, cycles): Runs the reference engine with
+                                          buses executed at once.
+
+run_execute_cycles(network, monitors, cycles): Runs Network.execute_cycles.
+
+compare_engines(path, engine, cycles, seed): Returns how an engine compares
+                                             with the reference on a file.
+
+find_definition_files(): Returns the paths of the example definition files.
+
+main(arg_list): Parses the command line options and compares the engines.
+"""
+import contextlib
+import getopt
+import glob
+import json
+import os
+import signal
+import sys
+import tempfile
+import time
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+from error_handling import ErrorHandler
+
+from benchmarks import generators
+
+PARSE_TIME_LIMIT = 10  # seconds allowed to parse a definition file
+
+
+def run_reference(network, monitors, cycles):
+    """Execute and record every cycle in turn. Return True if successful.
+
+    The devices of a bus are executed one by one like any other device.
+    """
+    network.vectorize_buses = False
+    return run_vectorized(network, monitors, cycles)
+
+
+def run_vectorized(network, monitors, cycles):
+    """Execute and record every cycle in turn, executing buses at once.
+
+    Return True if successful.
+    """
+    for _ in range(cycles):
+        if not network.execute_network():
+            return False
+        monitors.record_signals()
+    return True
+
+
+def run_execute_cycles(network, monitors, cycles):
+    """Run Network.execute_cycles. Return True if successful."""
+    return network.execute_cycles(cycles, monitors)
+
+
+# Engine name: function running the engine, as run_reference
+ENGINES = {
+    "vectorized": run_vectorized,
+    "execute_cycles": run_execute_cycles,
+}
+
+
+class ParseTimeout(Exception):
+    """Raised when a definition file takes too long to parse."""
+
+
+@contextlib.contextmanager
+def _time_limit(seconds):
+    """Raise ParseTimeout if the body runs for longer than seconds.
+
+    The limit is only applied where SIGALRM is available.
+    """
+    if not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def on_alarm(signal_number, frame):
+        raise ParseTimeout()
+
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _build(path, seed):
+    """Return the network and monitors of a file, ready to run.
+
+    Every output is monitored. Return None, None if the file has errors.
+    """
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            with _time_limit(PARSE_TIME_LIMIT):
+                scanner = Scanner(path, names)
+                parser = Parser(names, devices, network, monitors, scanner,
+                                error_handler)
+                parser.parse_network()
+    if error_handler.error_count:
+        return None, None
+    monitors.make_monitors([signal for signal in monitors.find_signals("*")
+                            if tuple(signal) not in
+                            monitors.monitors_dictionary])
+    devices.cold_startup(seed)
+    network.reset_clocks()
+    return network, monitors
+
+
+def _first_difference(reference, traces):
+    """Return (cycle, signal, reference level, engine level) or None.
+
+    The first cycle at which any trace differs is returned.
+    """
+    first = None
+    for signal, reference_trace in reference.items():
+        trace = traces[signal]
+        for cycle, (expected, level) in enumerate(zip(reference_trace,
+                                                      trace)):
+            if expected != level:
+                break
+        else:
+            if len(reference_trace) == len(trace):
+                continue
+            cycle = min(len(reference_trace), len(trace))
+            expected = (reference_trace[cycle]
+                        if cycle < len(reference_trace) else None)
+            level = trace[cycle] if cycle < len(trace) else None
+        if first is None or cycle < first[0]:
+            first = (cycle, signal, expected, level)
+    return first
+
+
+def compare_engines(path, engine, cycles, seed):
+    """Return a dictionary comparing an engine with the reference on a file.
+
+    engine is a function like run_reference. The result has a status of
+    "match", "mismatch", "errors" (the file does not parse) or "timeout"
+    (the file takes too long to parse).
+    """
+    result = {"file": path}
+    try:
+        network, monitors = _build(path, seed)
+    except ParseTimeout:
+        result["status"] = "timeout"
+        return result
+    if network is None:
+        result["status"] = "errors"
+        return result
+    start = time.perf_counter()
+    reference_ok = run_reference(network, monitors, cycles)
+    result["reference_seconds"] = time.perf_counter() - start
+    reference = dict(monitors.monitors_dictionary)
+    names = monitors.names
+
+    network, monitors = _build(path, seed)
+    start = time.perf_counter()
+    engine_ok = engine(network, monitors, cycles)
+    result["engine_seconds"] = time.perf_counter() - start
+    if result["engine_seconds"]:
+        result["speedup"] = (result["reference_seconds"] /
+                             result["engine_seconds"])
+    else:
+        result["speedup"] = None
+
+    difference = _first_difference(reference, monitors.monitors_dictionary)
+    result["reference_settled"] = reference_ok
+    result["engine_settled"] = engine_ok
+    if reference_ok == engine_ok and difference is None:
+        result["status"] = "match"
+    else:
+        result["status"] = "mismatch"
+    if difference is not None:
+        cycle, (device_id, output_id), expected, level = difference
+        result["first_difference"] = {
+            "cycle": cycle,
+            "signal": monitors.get_signal_name(device_id, output_id) or
+            names.get_name_string(device_id),
+            "reference": expected,
+            "engine": level,
+        }
+    return result
+
+
+def find_definition_files():
+    """Return the paths of the .vi files in logsim and definition_files."""
+    return sorted(glob.glob("*.vi")) + sorted(
+        glob.glob(os.path.join("definition_files", "*.vi")))
+
+
+def main(arg_list):
+    """Parse the command line options and compare the engines."""
+    usage_message = ("Usage:\n"
+                     "python -m benchmarks.golden [-c <cycles>] "
+                     "[-r <seed>] [-n <random netlists>] "
+                     "[-b <ranges>] [-o <output file>]")
+    try:
+        options, arguments = getopt.getopt(arg_list, "hc:r:n:b:o:")
+        cycles = 300
+        seed = 0
+        netlists = 50
+        buses = 4  # ranges in each random netlist with ranges
+        output_path = None
+        for option, value in options:
+            if option == "-h":
+                print(usage_message)
+                sys.exit()
+            elif option == "-c":
+                cycles = int(value)
+            elif option == "-r":
+                seed = int(value)
+            elif option == "-n":
+                netlists = int(value)
+            elif option == "-b":
+                buses = int(value)
+            elif option == "-o":
+                output_path = value
+    except (getopt.GetoptError, ValueError):
+        print("Error: invalid command line arguments\n")
+        print(usage_message)
+        sys.exit()
+
+    results = []
+    row = "{:<36}{:<16}{:<10}{:>10}{:>10}{:>9}"
+    print(row.format("circuit", "engine", "status", "ref s", "engine s",
+                     "speedup"))
+    with tempfile.TemporaryDirectory() as directory:
+        paths = find_definition_files()
+        for index in range(netlists):
+            path = os.path.join(directory, "random{}.vi".format(index))
+            with open(path, "w") as definition_file:
+                definition_file.write(generators.random_netlist(
+                    30, seed=seed + index))
+            paths.append(path)
+        # Wide ranges fed in and out of order exercise the vectorized buses
+        for index in range(netlists):
+            path = os.path.join(directory, "ranges{}.vi".format(index))
+            with open(path, "w") as definition_file:
+                definition_file.write(generators.random_netlist(
+                    30, seed=seed + index, buses=buses, width=16))
+            paths.append(path)
+
+        for path in paths:
+            for name, engine in ENGINES.items():
+                result = compare_engines(path, engine, cycles, seed)
+                result["engine"] = name
+                if path.startswith(directory):
+                    result["file"] = os.path.basename(path)
+                results.append(result)
+                if "speedup" in result:
+                    timings = ["{:.4f}".format(result["reference_seconds"]),
+                               "{:.4f}".format(result["engine_seconds"]),
+                               "{:.1f}".format(result["speedup"] or 0)]
+                else:
+                    timings = ["", "", ""]
+                print(row.format(result["file"], name, result["status"],
+                                 *timings))
+                if "first_difference" in result:
+                    print("    first difference:", result["first_difference"])
+
+    if output_path is not None:
+        with open(output_path, "w") as output_file:
+            json.dump({"cycles": cycles, "seed": seed, "results": results},
+                      output_file, indent=2)
+    mismatches = [result for result in results
+                  if result["status"] == "mismatch"]
+    print(len(mismatches), "mismatches in", len(results), "comparisons")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,1358 +1,1951 @@
-"""Implement the graphical user interface for the Logic Simulator.
-
-Used in the Logic Simulator project to enable the user to run the simulation
-or adjust the network properties.
-
-Classes:
---------
-MyGLCanvas - handles all canvas drawing operations.
-Gui - configures the main window and all the widgets.
-SwitchFrame - configures popup window for switch control.
-MonitorFrame - configures popup window for monitor control.
-ErrorFrame - configures popup window for error display.
-"""
-import sys
-import os
-from cgi import print_environ
-import wx
-import wx.glcanvas as wxcanvas
-from OpenGL import GL, GLUT
-
-
-import builtins
-
-from wx.lib.mixins.inspection import InspectionMixin
-
-# Set "_" to call translation
-builtins.__dict__["_"] = wx.GetTranslation
-
-# Languages available in code
-sup_lang = [wx.LANGUAGE_ENGLISH,
-            wx.LANGUAGE_GREEK]
-
-
-class MyGLCanvas(wxcanvas.GLCanvas):
-    """Handle all drawing operations.
-
-    This class contains functions for drawing onto the canvas. It
-    also contains handlers for events relating to the canvas.
-
-    Parameters
-    ----------
-    parent: parent window.
-    size: canvas size.
-    devices: instance of the devices.Devices() class.
-    monitors: instance of the monitors.Monitors() class.
-
-    Public methods
-    --------------
-    init_gl(self): Configure the OpenGL context.
-
-    render(self, text): Handle all drawing operations.
-
-    on_paint(self, event): Handle the canvas paint event.
-
-    on_size(self, event): Handle the canvas resize event.
-
-    on_mouse(self, event): Handle mouse events.
-
-    on_key(self, event): Handle key press events.
-
-    Non-public methods
-    -------------
-
-    _render_text(self, text, x_pos, y_pos): Handle text drawing
-                                           operations.
-
-    _render_trace(self, trace, label=None): Draw new signal trace.
-
-    _update_max_xy(self, x, y): Update max_x and max_y values.
-    """
-
-    def __init__(self, parent, size):
-        """Initialise canvas properties and useful variables."""
-        super().__init__(parent, -1, size=size,
-                         attribList=[wxcanvas.WX_GL_RGBA,
-                                     wxcanvas.WX_GL_DOUBLEBUFFER,
-                                     wxcanvas.WX_GL_DEPTH_SIZE, 16, 0])
-        GLUT.glutInit()
-        self.init = False
-        self.context = wxcanvas.GLContext(self)
-        self.parent = parent
-
-        # Initialise variables for panning
-        self.pan_x = 0
-        self.pan_y = 0
-        self.last_mouse_x = 0  # Previous mouse x position
-        self.last_mouse_y = 0  # Previous mouse y position
-
-        # Initialise variables for zooming and scrolling
-        self.zoom = 2.0
-        self.max_y = 0
-        self.max_x = 0
-
-        # Update variables for panning
-        self.pan_y -= (self.zoom - 1.0) * size.height/2
-
-        # Initialise display variables for signal sketch
-        self.traces = {}
-        self.periods = 0
-        self.trace_num = 0
-        self.shift_px = 50
-        self.period_px = 20
-        self.colours = [(1.0, 0.0, 0.0),
-                        (0.0, 1.0, 0.0)]  # Red and Green
-
-        # Bind events to the canvas
-        self.Bind(wx.EVT_SIZE, self.on_size)
-        self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
-        self.Bind(wx.EVT_CHAR_HOOK, self.on_key)
-        self.Bind(wx.EVT_PAINT, self.on_paint)
-
-    def init_gl(self):
-        """Configure and initialise the OpenGL context."""
-        size = self.GetClientSize()
-        self.SetCurrent(self.context)
-        GL.glDrawBuffer(GL.GL_BACK)
-        GL.glClearColor(1.0, 1.0, 1.0, 0.0)
-        GL.glViewport(0, 0, size.width, size.height)
-        GL.glMatrixMode(GL.GL_PROJECTION)
-        GL.glLoadIdentity()
-        GL.glOrtho(0, size.width, 0, size.height, -1, 1)
-        GL.glMatrixMode(GL.GL_MODELVIEW)
-        GL.glLoadIdentity()
-        GL.glTranslated(self.pan_x, self.pan_y, 0.0)
-        GL.glScaled(self.zoom, self.zoom, self.zoom)
-
-    def render(self):
-        """Handle all drawing operations."""
-        self.max_x, self.max_y = 0, 0  # Reset max values
-        size = self.GetClientSize()
-        self.SetCurrent(self.context)
-        if not self.init:
-            # Configure the viewport, modelview and projection matrices
-            self.init_gl()
-            self.init = True
-
-        # Clear everything
-        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
-
-        for label, trace in self.traces.items():
-            self._render_trace(trace, label=label)
-
-        # Draw mesh to indicate periods
-        if len(self.traces) > 0:
-            GL.glPushAttrib(GL.GL_ENABLE_BIT)
-            GL.glLineStipple(1, 0xAAAA)
-            GL.glColor3f(0.0, 0.0, 0.0)
-            GL.glEnable(GL.GL_BLEND)
-            GL.glEnable(GL.GL_LINE_STIPPLE)
-            GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
-            GL.glColor4f(0.0, 0.0, 0.0, 0.25)
-            GL.glBegin(GL.GL_LINES)
-            for i in range(self.periods):
-                GL.glVertex2f(self.shift_px + self.period_px*(i+1),
-                              size.height - 20)
-                GL.glVertex2f(self.shift_px + self.period_px*(i+1),
-                              size.height - self.max_y - 5)
-            GL.glEnd()
-            GL.glPopAttrib()
-
-        # Reset number of traces for next render
-        self.trace_num = 0
-
-        # We have been drawing to the back buffer, flush the graphics pipeline
-        # and swap the back buffer to the front
-        GL.glFlush()
-        self.SwapBuffers()
-
-    def on_paint(self, event):
-        """Handle the paint event."""
-        self.render()
-
-    def on_size(self, event):
-        """Handle the canvas resize event."""
-        # Reset view on resize
-        size = self.GetClientSize()
-        self.pan_x = 0
-        self.pan_y = -(self.zoom - 1.0) * size.height
-
-        # Forces reconfiguration of the viewport, modelview and projection
-        # matrices on the next paint event
-        self.init = False
-
-    def on_mouse(self, event):
-        """Handle mouse events."""
-        text = ""
-
-        # Calculate object coordinates of the mouse position
-        size = self.GetClientSize()
-        if event.ButtonDown():
-            self.SetFocus()
-            self.last_mouse_x = event.GetX()
-            self.last_mouse_y = event.GetY()
-            text = "".join([_("Mouse button pressed at: "), str(event.GetX()),
-                            ", ", str(event.GetY())])
-        if event.ButtonUp():
-            text = "".join([_("Mouse button released at: "), str(event.GetX()),
-                            ", ", str(event.GetY())])
-        if event.Leaving():
-            text = "".join([_("Mouse left canvas at: "), str(event.GetX()),
-                            ", ", str(event.GetY())])
-        if (event.GetWheelRotation() < 0 and
-                self.pan_y + size.height * self.zoom
-                - 20 * self.zoom < self.max_y * self.zoom):
-            self.pan_y -= 0.1*event.GetWheelRotation()
-            self.init = False
-            string = _("Negative mouse wheel rotation. Scrolling down: ")
-            text = "".join([string, str(self.pan_y)])
-        if (event.GetWheelRotation() > 0 and
-                self.pan_y > -((self.zoom - 1.0) * size.height)):
-            self.pan_y -= 0.1*event.GetWheelRotation()
-            self.init = False
-            text = "".join([_("Positive mouse wheel rotation. Scrolling up: "),
-                            str(self.pan_y)])
-
-        if text:
-            self.render()
-            self.parent.update_info(text)
-        else:
-            self.Refresh()  # Triggers the paint event
-
-    def on_key(self, event):
-        """Handle key press events."""
-        key = event.GetKeyCode()
-        size = self.GetClientSize()
-        text = None
-        if (key == wx.WXK_UP and self.pan_y
-                > -((self.zoom - 1.0) * size.height)):
-            self.pan_y -= 20
-            self.init = False
-            text = "".join([_("Up arrow press. Scrolling up: "),
-                            str(self.pan_y)])
-        if (key == wx.WXK_DOWN and self.pan_y + size.height * self.zoom
-                - 20 * self.zoom < self.max_y * self.zoom):
-            self.pan_y += 20
-            self.init = False
-            text = "".join([_("Down arrow press. Scrolling down: "),
-                            str(self.pan_y)])
-        if key == wx.WXK_LEFT and self.pan_x < 0:
-            self.pan_x += 20
-            self.init = False
-            text = "".join([_("Left arrow press. Scrolling left: "),
-                            str(self.pan_x)])
-        if (key == wx.WXK_RIGHT and self.pan_x - size.width + 20 * self.zoom
-                > - self.max_x * self.zoom):
-            self.pan_x -= 20
-            self.init = False
-            text = "".join([_("Right arrow press. Scrolling right: "),
-                            str(self.pan_x)])
-
-        if text:
-            self.render()
-            self.parent.update_info(text)
-        else:
-            self.Refresh()  # Triggers the paint event
-
-    def _render_text(self, text, x_pos, y_pos):
-        """Handle text drawing operations."""
-        GL.glColor3f(0.0, 0.0, 0.0)  # text is black
-        GL.glRasterPos2f(x_pos, y_pos)
-        font = GLUT.GLUT_BITMAP_HELVETICA_12
-
-        for character in text:
-            if character == "\n":
-                y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
-
-    def _render_trace(self, trace, label=None):
-        """Draw new signal trace."""
-        size = self.GetClientSize()
-
-        # Draw trace
-        GL.glColor3f(*self.colours[0])
-        GL.glBegin(GL.GL_LINE_STRIP)
-        for i in range(len(trace)):
-            x = (i * self.period_px) + self.shift_px
-            x_next = (i+1) * self.period_px + self.shift_px
-            if trace[i] == 1:
-                y = size.height - 25 - 50*(self.trace_num)
-            else:
-                y = size.height - 50*(self.trace_num+1)
-            self._update_max_xy(x, y)
-            GL.glVertex2f(x, y)
-            GL.glVertex2f(x_next, y)
-        GL.glEnd()
-
-        # Draw axes
-        GL.glColor3f(0.0, 0.0, 0.0)
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex2f(self.shift_px, size.height - 50*(self.trace_num+1) + 30)
-        GL.glVertex2f(self.shift_px, size.height - 50*(self.trace_num+1) - 10)
-        GL.glVertex2f(self.shift_px-5, size.height - 50*(self.trace_num+1) - 5)
-        GL.glVertex2f(x_next + 10, size.height - 50*(self.trace_num+1) - 5)
-        GL.glEnd()
-        self._update_max_xy(x_next + 10,
-                            size.height - 50 * (self.trace_num+1) - 10)
-
-        # Draw numbers in axis
-        for num in range(self.periods+1):
-            shift_x = 5  # Shift label in x direction
-            shift_x += (len(str(num)) - 1)*3
-            self._render_text(str(num),
-                              self.shift_px + self.period_px*(num) - shift_x,
-                              size.height - 50*(self.trace_num+1) - 12)
-
-        # Draw label
-        if label is None:
-            label = _("Trace {}").format(self.trace_num + 1)
-        self._render_text(label, self.shift_px - 40 - self.pan_x / self.zoom,
-                          size.height - 50 * (self.trace_num + 1) + 10)
-
-        # Update trace number
-        self.trace_num += 1
-
-    def _update_max_xy(self, x, y):
-        """Update max_x and max_y values."""
-        if self.GetVirtualSize().GetHeight() - y > self.max_y:
-            # y is measured from the top - change in coordinates
-            self.max_y = self.GetVirtualSize().GetHeight() - y
-        if x > self.max_x:
-            # x is measured from the left
-            self.max_x = x
-
-
-class SwitchFrame(wx.Frame):
-    """Configure the popup switch menu frame window.
-
-    Parameters
-    ----------
-    parent: parent of the window.
-    style: styling of window, including borders
-    button: switch button object assigned to event
-    devices: devices object in simulator
-    canvas: canvas window frame
-
-    Public methods
-    --------------
-    on_close(self, event): Event handler for closing window
-
-    on_listbox(self, event): Event handler for updating listbox selection
-
-    on_check(self, event): Event handler for updating checkbox value
-    """
-
-    def __init__(self, parent, style, button, devices, canvas):
-        """Initialise instance of class."""
-        wx.Frame.__init__(self, parent, title=_("Edit Switches"), style=style)
-
-        self.button = button
-        self.devices = devices
-        self.canvas = canvas
-        self.parent = parent
-
-        # Set switch choices from devices - IMPLEMENT
-        switch_id = devices.find_devices(self.devices.SWITCH)
-        self.switch_values = {}
-        for i in switch_id:
-            device = self.devices.get_device(i)
-            name = self.devices.get_signal_name(i, None)
-            self.switch_values[name] = [i, device.switch_state]
-        choices = list(self.switch_values)
-
-        # Set widgets
-        self.listbox = wx.ListBox(self, wx.ID_ANY, choices=choices)
-        self.check = wx.CheckBox(self, wx.ID_ANY, _("Switch ON"))
-
-        # Set sizers
-        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        main_sizer.Add(self.listbox, 1, wx.ALIGN_LEFT | wx.ALL, 2)
-        main_sizer.Add(self.check, 1, wx.ALIGN_RIGHT | wx.ALL, 2)
-
-        self.listbox.SetMinSize((125, 200))
-        self.SetSize((250, 250))
-        self.SetSizeHints(250, 250)
-        self.SetMaxSize((250, 250))
-
-        # Bind events
-        self.Bind(wx.EVT_CLOSE, self.on_close)
-        self.Bind(wx.EVT_LISTBOX, self.on_listbox)
-        self.Bind(wx.EVT_CHECKBOX, self.on_check)
-
-        # Set initial selection
-        self.listbox.SetSelection(0)
-        self.on_listbox(None)
-
-        self.SetSizer(main_sizer)
-        wx.CallAfter(self.Refresh)
-
-    def on_close(self, event):
-        """Close window on pressing close button."""
-        self.Show(False)
-        self.Destroy()
-        self.button.Enable(True)
-
-    def on_listbox(self, event):
-        """Update screen depending on switch selection."""
-        index = self.listbox.GetSelection()
-        string = self.listbox.GetString(index)
-        value = self.switch_values[string][1]
-        self.check.SetValue(value)
-
-    def on_check(self, event):
-        """Update switch values depending on check state."""
-        value = self.check.GetValue()
-        index = self.listbox.GetSelection()
-        string = self.listbox.GetString(index)
-        self.switch_values[string][1] = value
-        switch_id = self.switch_values[string][0]
-
-        if self.devices.set_switch(switch_id, value):
-            text = _("Switch {} set to {}.").format(string, value)
-        else:
-            text = _("Could not change switch state.")
-        self.canvas.render()
-        self.parent.update_info(text)
-
-
-class MonitorFrame(wx.Frame):
-    """Configure the popup monitors menu frame window.
-
-    Parameters
-    ----------
-    parent: parent of the window.
-    style: styling of window, including borders
-    button: monitors button object assigned to event
-    canvas: canvas window frame
-    monitors: monitors object in simulator
-
-    Public methods
-    --------------
-    on_close(self, event): Event handler for
-                           closing window
-
-    on_add_button(self, event): Add a new monitor by
-                                reading textCtrl
-
-    on_remove_button(self, event): Remove a new selected monitor,
-                                   or from textCtrls
-
-    on_mon_selection(self, event): Unselect unmonitored listbox
-
-    on_unmon_selection(self, event): Unselect monitored listbox
-
-    """
-
-    def __init__(self, parent, style, button, canvas, monitors):
-        """Initiate instance of class."""
-        wx.Frame.__init__(self, parent, title=_("Edit Monitors"), style=style)
-
-        self.button = button
-        self.monitors = monitors
-        self.canvas = canvas
-        self.names = self.monitors.names
-
-        # Set monitor information
-        sig_names = self.monitors.get_signal_names()
-        self.monitor_dictionary = {"monitored": sig_names[0],
-                                   "unmonitored": sig_names[1]}
-        choices_mon = self.monitor_dictionary["monitored"]
-        choices_unmon = self.monitor_dictionary["unmonitored"]
-
-        # Set widgets
-        mon_title = wx.StaticText(self, wx.ID_ANY, _("Monitored"))
-        unmon_title = wx.StaticText(self, wx.ID_ANY, _("Unmonitored"))
-        mon_title.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
-                                  wx.FONTSTYLE_NORMAL,
-                                  wx.FONTWEIGHT_BOLD,
-                                  True))
-        unmon_title.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
-                                    wx.FONTSTYLE_NORMAL,
-                                    wx.FONTWEIGHT_BOLD,
-                                    True))
-        self.add_button = wx.Button(self, wx.ID_ANY,
-                                    _("◀ Add"), size=(100, 50))
-        self.listbox_mon = wx.ListBox(self, wx.ID_ANY,
-                                      choices=choices_mon)
-        self.listbox_unmon = wx.ListBox(self, wx.ID_ANY,
-                                        choices=choices_unmon)
-        self.remove_button = wx.Button(self, wx.ID_ANY, _("Remove ▶"),
-                                       size=(100, 50))
-        self.info_text = wx.StaticText(self, wx.ID_ANY, "")
-
-        # Set sizers
-        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        left_sizer = wx.BoxSizer(wx.VERTICAL)
-        right_sizer = wx.BoxSizer(wx.VERTICAL)
-        central_sizer = wx.BoxSizer(wx.VERTICAL)
-        main_sizer.Add(left_sizer, 1, wx.ALL | wx.ALIGN_LEFT, 4)
-        main_sizer.Add(central_sizer, 1, wx.TOP | wx.ALIGN_CENTER, 40)
-        main_sizer.Add(right_sizer, 5, wx.ALL | wx.ALIGN_RIGHT, 3)
-
-        # Add widgets to sizers
-        left_sizer.Add(mon_title, 4, wx.ALL | wx.ALIGN_LEFT, 10)
-        left_sizer.Add(self.listbox_mon, 4, wx.ALL | wx.ALIGN_LEFT, 10)
-        central_sizer.Add(self.add_button, 1, wx.ALL | wx.ALIGN_CENTER, 15)
-        central_sizer.Add(self.remove_button, 1, wx.ALL | wx.ALIGN_CENTER, 15)
-        central_sizer.Add(self.info_text, 1, wx.RIGHT | wx.ALIGN_LEFT, 15)
-        right_sizer.Add(unmon_title, 4, wx.ALL | wx.ALIGN_RIGHT, 10)
-        right_sizer.Add(self.listbox_unmon, 4, wx.ALL | wx.ALIGN_RIGHT, 10)
-
-        self.listbox_mon.SetMinSize((100, 200))
-        self.listbox_unmon.SetMinSize((100, 200))
-        self.SetSize((430, 300))
-        self.SetSizeHints(430, 300)
-        self.SetMaxSize((430, 300))
-
-        # Bind events
-        self.Bind(wx.EVT_CLOSE, self.on_close)
-        self.add_button.Bind(wx.EVT_BUTTON, self.on_add_button)
-        self.remove_button.Bind(wx.EVT_BUTTON, self.on_remove_button)
-        self.listbox_mon.Bind(wx.EVT_LISTBOX, self.on_mon_selection)
-        self.listbox_unmon.Bind(wx.EVT_LISTBOX, self.on_unmon_selection)
-
-        # Initialise buttons
-        self.remove_button.Enable(False)
-        self.add_button.Enable(False)
-
-        # Colours
-        self.colours = [(255, 0, 0),
-                        (0, 255, 0)]
-
-        self.SetSizer(main_sizer)
-        wx.CallAfter(self.Refresh)
-
-    def on_close(self, event):
-        """Close window on pressing close button."""
-        self.Show(False)
-        self.Destroy()
-        self.button.Enable(True)
-
-    def on_add_button(self, event):
-        """Add a new monitor by reading textCtrl."""
-        index = self.listbox_unmon.GetSelection()
-        text = self.info_text
-        if index != wx.NOT_FOUND:
-            string = self.listbox_unmon.GetString(index)
-            text.SetLabel(_("Device {} \nnow monitored.").format(string))
-            self.monitor_dictionary["unmonitored"].remove(string)
-            self.monitor_dictionary["monitored"].append(string)
-            device_id = self.names.query(string)
-            port_id = None
-            if "." in string:
-                ind = string.index(".") + 1
-                port_id = self.names.query(string[ind:])
-                device_id = self.names.query(string[:ind-1])
-            [device, port] = device_id, port_id
-            self.monitors.make_monitor(device, port)
-            self.listbox_mon.Append(string)
-            self.listbox_unmon.Delete(index)
-            text.SetForegroundColour((0, 0, 0))
-
-    def on_remove_button(self, event):
-        """Remove a new selected monitor, or from textCtrl."""
-        index = self.listbox_mon.GetSelection()
-        text = self.info_text
-        if index != wx.NOT_FOUND:
-            string = self.listbox_mon.GetString(index)
-            text.SetLabel(_("Device {} \nnow unmonitored.").format(string))
-            self.monitor_dictionary["monitored"].remove(string)
-            self.monitor_dictionary["unmonitored"].append(string)
-
-            device_id = self.names.query(string)
-            port_id = None
-            if "." in string:
-                ind = string.index(".") + 1
-                port_id = self.names.query(string[ind:])
-                device_id = self.names.query(string[:ind-1])
-            [device, port] = device_id, port_id
-            self.monitors.remove_monitor(device, port)
-            self.listbox_mon.Delete(index)
-            self.listbox_unmon.Append(string)
-            text.SetForegroundColour((0, 0, 0))
-
-    def on_mon_selection(self, event):
-        """Unselect unmonitored listbox, enable add."""
-        self.listbox_unmon.SetSelection(-1)
-        self.add_button.Enable(False)
-        self.remove_button.Enable(True)
-
-    def on_unmon_selection(self, event):
-        """Unselect monitored listbox, enable remove."""
-        self.listbox_mon.SetSelection(-1)
-        self.remove_button.Enable(False)
-        self.add_button.Enable(True)
-
-
-class ConnectionFrame(wx.Frame):
-    """Configure the popup connection menu frame window.
-
-    Parameters
-    ----------
-    parent: parent of the window.
-    style: styling of window, including borders
-    button: monitors button object assigned to event
-    canvas: canvas window frame
-    network: network of connections in logsim
-
-    Public methods
-    --------------
-    on_close(self, event): Event handler for
-                           closing window
-
-    on_add(self, event): Event handler for
-                         add check box
-
-    on_remove(self, event): Event handler for
-                            remove check box
-
-    on_list_sel(self, event): Event handler for
-                              any list selection
-
-    on_con_button(self, event): Event handler for
-                                connect button
-
-    Non-public methods
-    ------------------
-    _remove_connection(
-        self, id1, port1,
-        id2, port2): Removes connection between the
-                     provided devices and ports
-
-    """
-
-    def __init__(self, parent, style, button, canvas, network):
-        """Initiate instance of class."""
-        wx.Frame.__init__(self, parent,
-                          title=_("Edit Connections"), style=style)
-
-        self.button = button
-        self.network = network
-        self.canvas = canvas
-        self.devices = network.devices
-        self.parent = parent
-
-        # Set inputs and outputs in network
-        self.dev_ID = self.devices.find_devices()
-        self.con_inp = []  # Connected inputs
-        self.disc_inp = []  # Disconnected inputs
-        self.switch_id = self.devices.find_devices(self.devices.SWITCH)
-        self.out = []
-        for id in self.dev_ID:
-            if id not in self.switch_id:
-                device = self.devices.get_device(id)
-                for port_id in device.inputs:
-                    # Append inputs
-                    name = self.devices.get_signal_name(id, port_id)
-                    con = self.network.get_connected_output(id, port_id)
-                    if con is not None:
-                        self.con_inp.append(name)
-                    else:
-                        self.disc_inp.append(name)
-                for port_id in device.outputs:
-                    # Append output ports
-                    name = self.devices.get_signal_name(id, port_id)
-                    self.out.append(name)
-            else:
-                # Append switches
-                name = self.devices.get_signal_name(id, None)
-                self.out.append(name)
-
-        # Set widgets
-        output_text = wx.StaticText(self, wx.ID_ANY, _("Outputs"))
-        input_text = wx.StaticText(self, wx.ID_ANY, _("Inputs"))
-        output_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
-                                    wx.FONTSTYLE_NORMAL,
-                                    wx.FONTWEIGHT_BOLD,
-                                    True))
-        input_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
-                                   wx.FONTSTYLE_NORMAL,
-                                   wx.FONTWEIGHT_BOLD,
-                                   True))
-
-        self.input_box = wx.ListBox(self, wx.ID_ANY, choices=self.con_inp)
-        self.output_box = wx.ListBox(self, wx.ID_ANY, choices=[])
-        self.add_check = wx.CheckBox(self, wx.ID_ANY, _("Add"))
-        self.remove_check = wx.CheckBox(self, wx.ID_ANY, _("Remove"))
-        self.con_button = wx.Button(self, wx.ID_ANY, _("Disconnect"))
-        self.text = wx.StaticText(self, wx.ID_ANY, "")
-
-        # Set sizers
-        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        left_sizer = wx.BoxSizer(wx.VERTICAL)
-        right_sizer = wx.BoxSizer(wx.VERTICAL)
-        central_sizer = wx.BoxSizer(wx.VERTICAL)
-        main_sizer.Add(left_sizer, 1, wx.ALL | wx.ALIGN_LEFT, 4)
-        main_sizer.Add(central_sizer, 1, wx.TOP | wx.ALIGN_CENTER, 40)
-        main_sizer.Add(right_sizer, 5, wx.ALL | wx.ALIGN_RIGHT, 3)
-
-        # Add widgets to sizers
-        left_sizer.Add(input_text, 4, wx.ALL | wx.ALIGN_CENTER, 10)
-        left_sizer.Add(self.input_box, 40, wx.EXPAND, 10)
-        central_sizer.Add(self.add_check, 1, wx.ALL | wx.ALIGN_CENTER, 15)
-        central_sizer.Add(self.remove_check, 1, wx.ALL | wx.ALIGN_CENTER, 15)
-        central_sizer.Add(self.con_button, 1, wx.ALL | wx.ALIGN_CENTER, 15)
-        central_sizer.Add(self.text, 1, wx.LEFT, 10)
-        right_sizer.Add(output_text, 4, wx.ALL, 10)
-        right_sizer.Add(self.output_box, 40, wx.EXPAND, 10)
-
-        self.input_box.SetSizeHints((100, 300))
-        self.output_box.SetSizeHints((100, 300))
-        self.SetSize((340, 300))
-        self.SetSizeHints(340, 300)
-        self.SetMaxSize((340, 300))
-
-        # Bind events
-        self.Bind(wx.EVT_CLOSE, self.on_close)
-        self.add_check.Bind(wx.EVT_CHECKBOX, self.on_add)
-        self.remove_check.Bind(wx.EVT_CHECKBOX, self.on_remove)
-        self.input_box.Bind(wx.EVT_LISTBOX, self.on_list_sel)
-        self.output_box.Bind(wx.EVT_LISTBOX, self.on_list_sel)
-        self.con_button.Bind(wx.EVT_BUTTON, self.on_con_button)
-
-        # Colours
-        self.colours = [(255, 0, 0),
-                        (0, 255, 0)]
-
-        # Initialise connection mode
-        self.remove_check.SetValue(1)
-        self.add_check.Enable(True)
-        self.remove_check.Enable(False)
-        self.con_button.Enable(False)
-
-        # Initialise attributes
-        self.id1, self.port_id1 = None, None
-        self.id2, self.port_id2 = None, None
-
-        self.SetSizer(main_sizer)
-        wx.CallAfter(self.Refresh)
-
-    def on_close(self, event):
-        """Close window on pressing close button."""
-        self.Show(False)
-        self.Destroy()
-        self.button.Enable(True)
-        # If inputs left unconnected, notify on close
-        if len(self.disc_inp) > 0:
-            text = _("Some inputs were left disconnected. "
-                     "System may oscillate.")
-            self.parent.update_info(text, False,
-                                    self.parent.colours[0])
-
-    def on_add(self, event):
-        """Change mode to add connections."""
-        self.input_box.Clear()
-        self.input_box.Append(self.disc_inp)
-        self.output_box.Clear()
-        self.output_box.Append(self.out)
-        self.remove_check.SetValue(0)
-        self.add_check.Enable(False)
-        self.remove_check.Enable(True)
-        self.con_button.SetLabel(_("Connect"))
-        self.con_button.Enable(False)
-        self.text.SetLabel("")
-
-    def on_remove(self, event):
-        """Change mode to remove connections."""
-        self.input_box.Clear()
-        self.input_box.Append(self.con_inp)
-        self.output_box.Clear()
-        self.add_check.SetValue(0)
-        self.add_check.Enable(True)
-        self.remove_check.Enable(False)
-        self.con_button.SetLabel(_("Disconnect"))
-        self.con_button.Enable(False)
-        self.text.SetLabel("")
-
-    def on_list_sel(self, event):
-        """Handle event when input is selected."""
-        inp = self.input_box.GetSelection()
-        out = self.output_box.GetSelection()
-        if self.remove_check.GetValue() is True:
-            # Remove mode
-            name = self.input_box.GetString(inp)
-            id1, port_id1 = self.devices.get_signal_ids(name)
-            id2, port_id2 = self.network.get_connected_output(id1,
-                                                              port_id1)
-            out = self.devices.get_signal_name(id2, port_id2)
-            self.output_box.Clear()
-            self.output_box.Append(out)
-            self.output_box.SetSelection(0)
-            self.con_button.Enable(True)
-
-            # Set attribute variables - memory
-            self.id1, self.port_id1 = id1, port_id1
-            self.id2, self.port_id2 = id2, port_id2
-        elif (inp != wx.NOT_FOUND and out != wx.NOT_FOUND):
-            # Add mode
-            inp_name = self.input_box.GetString(inp)
-            out_name = self.output_box.GetString(out)
-            id1, port_id1 = self.devices.get_signal_ids(inp_name)
-            id2, port_id2 = self.devices.get_signal_ids(out_name)
-            self.con_button.Enable(True)
-
-            # Set attribute variables - memory
-            self.id1, self.port_id1 = id1, port_id1
-            self.id2, self.port_id2 = id2, port_id2
-        self.text.SetLabel("")
-
-    def on_con_button(self, event):
-        """Handle event for button presses."""
-        inp = self.input_box.GetSelection()
-        name = self.input_box.GetString(inp)
-        if self.remove_check.GetValue() is True:
-            # Remove mode
-            self._remove_connection(self.id1, self.port_id1,
-                                    self.id2, self.port_id2)
-            self.con_inp.remove(name)
-            self.disc_inp.append(name)
-            ind = self.input_box.GetSelection()
-            self.input_box.Delete(ind)
-            self.input_box.SetSelection(-1)
-            self.output_box.Clear()
-            self.con_button.Enable(False)
-            self.text.SetLabel(_("Input {}\ndisconnected").format(name))
-        else:
-            # Add mode
-            self.network.make_connection(self.id2,
-                                         self.port_id2,
-                                         self.id1,
-                                         self.port_id1)
-            self.disc_inp.remove(name)
-            self.con_inp.append(name)
-            ind = self.input_box.GetSelection()
-            out_ind = self.output_box.GetSelection()
-            out_name = self.output_box.GetString(out_ind)
-
-            self.input_box.Delete(ind)
-            self.input_box.SetSelection(-1)
-            self.output_box.SetSelection(-1)
-            self.con_button.Enable(False)
-            label = _("Input {}\nconnected to\n{}")
-            self.text.SetLabel(label.format(name, out_name))
-
-    def _remove_connection(self, id1, port1, id2, port2):
-        """Remove connection from 1 (input) to 2 (output)."""
-        first_device = self.devices.get_device(id1)
-        first_device.inputs[port1] = None
-
-
-class ErrorFrame(wx.Frame):
-    """Configure the popup error display frame window.
-
-    Parameters
-    ----------
-    parent: parent of the window.
-    style: styling of window, including borders
-    errorHandler: errorHandler object from logsim
-    run_button: button object assigned to the running
-                of the simulation
-
-    Public methods
-    --------------
-    on_close(self, event): Event handler for closing window
-    """
-
-    def __init__(self, parent, style, error_handler, run_button):
-        """Initialise instance of the SwitchPopup class."""
-        wx.Frame.__init__(self, parent, title=_("Error display"), style=style)
-
-        self.run = run_button
-
-        # Set widgets
-        string = ""
-        string = _("> Errors in definition file. Code cannot be "
-                   "compiled. Fix errors, then re-open file.\n\n")
-        string += _("> Number of errors detected:{}\n\n").format(
-                  error_handler.error_count)
-        for error in error_handler.error_list:
-            # Error must be split into each of its lines for translation
-            error_msg = error_handler.error_builder(error).split("\n")
-            error_msg[0] = _(error_msg[0])
-            error_msg[3] = _(error_msg[3])
-            error_string = "\n".join(error_msg)
-            string += _("> ERROR: {}\n").format(error_string)
-        scroll_win = wx.ScrolledWindow(self, wx.ID_ANY, style=wx.SUNKEN_BORDER
-                                       | wx.HSCROLL | wx.VSCROLL)
-        text = wx.TextCtrl(scroll_win, wx.ID_ANY, style=wx.TE_MULTILINE
-                           | wx.TE_READONLY)
-        text.SetValue(string)
-        text.SetFont(wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL,
-                             wx.FONTWEIGHT_NORMAL, False))
-
-        # Set sizers
-        main_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        # Add widgets to sizers
-        main_sizer.Add(text, 1, wx.TOP | wx.LEFT | wx.EXPAND, 10)
-
-        self.SetSize((500, 500))
-        self.SetSizeHints(500, 500)
-        self.SetMaxSize((500, 500))
-
-        # Bind events
-        self.Bind(wx.EVT_CLOSE, self.on_close)
-
-        text.ShowPosition(0)
-
-        self.SetSizer(main_sizer)
-        wx.CallAfter(self.Refresh)
-
-    def on_close(self, event):
-        """Close window on pressing close button, enable run button."""
-        self.Show(False)
-        self.run.Enable(True)
-        self.Destroy()
-
-
-class Gui(wx.Frame):
-    """Configure the main window and all the widgets.
-
-    This class provides a graphical user interface for the Logic Simulator and
-    enables the user to change the circuit properties and run simulations.
-
-    Parameters
-    ----------
-    title: title of the window.
-    names: Names class object
-    devices: Devices class object
-    network: Network class object
-    monitors: Monitors class object
-    error_handler: ErrorHandler class object
-
-    Public methods
-    --------------
-    run_network(self, cycles): Run the network for the specified
-                               number of simulation cycles.
-
-    update_traces(self): Update traces displayed on canvas.
-
-    update_info(self, text,
-                dev=True, col=(0,0,0)): Update info text.
-
-    on_menu(self, event): Event handler for the file menu.
-
-    on_spin_cycle(self, event): Event handler for when the user changes
-                                the number of cycles spin control.
-
-    on_spin(self, event): Event handler for when the user changes the spin
-                           control value.
-
-    on_run_button(self, event): Event handler for when the user clicks the run
-                                button.
-
-    on_continue_button(self, event): Event handler for when the user clicks
-                                     the continue button.
-
-    on_switches_button(self, event): Event handler for when the user clicks
-                                     the switches button.
-
-    on_monitors_button(self, event): Event handler for when the user clicks
-                                     the monitors button.
-
-    on_connection_button(self, event): Event handler for when the user clicks
-                                        the connections button.
-
-    on_right_button(self, event): Event handler for when the user clicks
-                                  the right button.
-
-    on_left_button(self, event): Event handler for when the user clicks
-                                  the left button.
-
-    on_home_button(self, event): Event handler for when the user clicks
-                                  the home button.
-    """
-
-    def __init__(self, title, names, devices,
-                 network, monitors, error_handler):
-        """Initialise widgets and layout."""
-        super().__init__(parent=None, title=_(title), size=(800, 600))
-
-        # Logic simulator details
-        self.names = names
-        self.devices = devices
-        self.monitors = monitors
-        self.network = network
-        self.error_handler = error_handler
-
-        # Configure the menu bar
-        fileMenu = wx.Menu()
-        viewMenu = wx.Menu()
-        colourMenu = wx.Menu()
-        helpMenu = wx.Menu()
-        menuBar = wx.MenuBar()
-        fileMenu.Append(wx.ID_OPEN, _("&Open"))
-        fileMenu.Append(wx.ID_EXIT, _("&Exit"))
-        viewMenu.Append(wx.ID_INFO, _("&Dev Info"))
-        helpMenu.Append(wx.ID_ABOUT, _("&About"))
-        viewMenu.Append(wx.ID_SELECT_COLOR, _("&Colour"), colourMenu)
-        menuBar.Append(fileMenu, _("&File"))
-        menuBar.Append(viewMenu, _("&View"))
-        menuBar.Append(helpMenu, _("&Help"))
-        self.SetMenuBar(menuBar)
-
-        # Configure sub menus for colour options
-        self.monochrome_ID = 999
-        self.red_ID = 998
-        self.magenta_ID = 997
-        self.purple_ID = 996
-        colourMenu.Append(self.monochrome_ID, _("&Monochrome"))
-        colourMenu.Append(self.red_ID, _("&Red"))
-        colourMenu.Append(self.magenta_ID, _("&Magenta"))
-        colourMenu.Append(self.purple_ID, _("&Purple"))
-
-        # Configure the widgets
-        self.cycles = 10
-        self.text_cycle = wx.StaticText(self, wx.ID_ANY, _("Cycles:"))
-        self.spin_cycle = wx.SpinCtrl(self, wx.ID_ANY, str(self.cycles), min=1)
-        self.run_button = wx.Button(self, wx.ID_ANY, _("Compile"),
-                                    size=(130, 50))
-        self.continue_button = wx.Button(self, wx.ID_ANY,
-                                         _("Continue"), size=(130, 50))
-        self.switches_button = wx.Button(self, wx.ID_ANY,
-                                         _("Edit Switches"), size=(130, 50))
-        self.monitors_button = wx.Button(self, wx.ID_ANY,
-                                         _("Edit Monitors"), size=(130, 50))
-        self.connection_button = wx.Button(self, wx.ID_ANY,
-                                           _("Edit Connections"),
-                                           size=(130, 50))
-        self.right_button = wx.Button(self, wx.ID_ANY, "▶", size=(50, 50))
-        self.left_button = wx.Button(self, wx.ID_ANY, "◀", size=(50, 50))
-        self.home_button = wx.Button(self, wx.ID_ANY, "🏠", size=(50, 50))
-        self.simulation_text = wx.StaticText(self, wx.ID_ANY,
-                                             _("Simulated Signals"))
-        self.simulation_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
-                                             wx.FONTSTYLE_NORMAL,
-                                             wx.FONTWEIGHT_BOLD,
-                                             True))
-        self.dev_text = wx.StaticText(self, wx.ID_ANY, "")
-        self.dev_text.SetFont(wx.Font(10, wx.FONTFAMILY_MODERN,
-                                      wx.FONTSTYLE_NORMAL,
-                                      wx.FONTWEIGHT_NORMAL,
-                                      False))
-
-        # Canvas for drawing signals
-        self.canvas = MyGLCanvas(self, wx.Size(300, 1000))
-        self.canvas.SetSizeHints(300, 1100)
-
-        # Bind events to widgets
-        self.Bind(wx.EVT_MENU, self.on_menu)
-        self.spin_cycle.Bind(wx.EVT_SPINCTRL, self.on_spin_cycle)
-        self.run_button.Bind(wx.EVT_BUTTON, self.on_run_button)
-        self.continue_button.Bind(wx.EVT_BUTTON, self.on_continue_button)
-        self.switches_button.Bind(wx.EVT_BUTTON, self.on_switches_button)
-        self.monitors_button.Bind(wx.EVT_BUTTON, self.on_monitors_button)
-        self.connection_button.Bind(wx.EVT_BUTTON, self.on_connection_button)
-        self.right_button.Bind(wx.EVT_BUTTON, self.on_right_button)
-        self.left_button.Bind(wx.EVT_BUTTON, self.on_left_button)
-        self.home_button.Bind(wx.EVT_BUTTON, self.on_home_button)
-
-        # Configure sizers for layout
-        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        right_sizer = wx.BoxSizer(wx.VERTICAL)
-        left_sizer = wx.BoxSizer(wx.VERTICAL)
-        arrow_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        main_sizer.Add(left_sizer, 10, wx.EXPAND, 5)
-        main_sizer.Add(right_sizer, 1, wx.ALL, 5)
-
-        left_sizer.Add(self.simulation_text, 1, wx.TOP | wx.ALIGN_CENTER, 2)
-        left_sizer.Add(self.dev_text, 1, wx.BOTTOM | wx.ALIGN_BOTTOM, 2)
-        left_sizer.Add(self.canvas, 50, wx.EXPAND | wx.ALL, 5)
-
-        right_sizer.Add(self.text_cycle, 1,
-                        wx.ALIGN_CENTER | wx.ALIGN_BOTTOM | wx.TOP, 30)
-        right_sizer.Add(self.spin_cycle, 1, wx.ALIGN_CENTER)
-        right_sizer.Add(self.run_button, 1, wx.ALL | wx.ALIGN_CENTER, 5)
-        right_sizer.Add(self.continue_button, 1,
-                        wx.ALL | wx.ALIGN_CENTER, 5)
-        right_sizer.Add(self.switches_button, 1,
-                        wx.ALL | wx.ALIGN_CENTER, 5)
-        right_sizer.Add(self.monitors_button, 1,
-                        wx.ALL | wx.ALIGN_CENTER, 5)
-        right_sizer.Add(self.connection_button, 1,
-                        wx.ALL | wx.ALIGN_CENTER, 5)
-        right_sizer.Add(arrow_sizer, 1,
-                        wx.ALIGN_BOTTOM | wx.ALIGN_CENTER | wx.TOP, 30)
-        right_sizer.Add(self.home_button, 1, wx.ALIGN_CENTER)
-
-        arrow_sizer.Add(self.left_button, 1, wx.ALIGN_LEFT)
-        arrow_sizer.Add(self.right_button, 1, wx.ALIGN_RIGHT)
-
-        # Disable continue button if first run not performed
-        self.continue_button.Enable(False)
-
-        self.SetSizeHints(600, 600)
-        self.SetMinSize((600, 600))
-        self.SetSizer(main_sizer)
-
-        # Colours
-        self.colours = [(255, 0, 0), (0, 255, 0)]
-
-        # Boolean determining if simulation has compiled
-        self.compiled = False
-
-        # Disable developer mode (displaying info text) by default
-        self.info_text_true = False
-
-    def run_network(self, cycles):
-        """Run the network for the specified number of simulation cycles.
-
-        Return True if successful.
-        """
-        for i in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
-            else:
-                self.update_info(_("Error! Network oscillating. "
-                                   "Verify connections."), False,
-                                 self.colours[0])
-                return False
-
-        return True
-
-    def update_traces(self):
-        """Update traces displayed on canvas."""
-        traces = {}
-        for device_id, output_id in self.monitors.monitors_dictionary:
-            new_trace = []
-            signal_list = self.monitors.monitors_dictionary[
-                          (device_id, output_id)]
-            for signal in signal_list:
-                new_trace.append(signal)
-            name = self.devices.get_signal_name(device_id, output_id)
-            traces[name] = new_trace
-        self.canvas.traces = traces
-
-    def update_info(self, text, dev=True, col=(0, 0, 0)):
-        """Update information text."""
-        self.dev_text.SetLabel("")
-        if self.info_text_true and dev:
-            self.dev_text.SetForegroundColour((0, 0, 0))
-            self.dev_text.SetLabel(" > " + text)
-        elif not dev:
-            self.dev_text.SetForegroundColour(col)
-            self.dev_text.SetLabel(" " + text)
-
-    def on_menu(self, event):
-        """Handle the event when the user selects a menu item."""
-        event_id = event.GetId()
-        if event_id == wx.ID_EXIT:
-            self.Close(True)
-        if event_id == wx.ID_ABOUT:
-            wx.MessageBox(_("Logic Simulator, Team 17"),
-                          _("About Logsim"), wx.ICON_INFORMATION | wx.OK)
-        if event_id == wx.ID_OPEN:
-            file_name = _("Open vi file")
-            open_file_dialog = wx.FileDialog(self, file_name, "definition_files/", "",
-                                             wildcard="VI files (*.vi)|*.vi",
-                                             style=wx.FD_OPEN
-                                             + wx.FD_FILE_MUST_EXIST)
-            if open_file_dialog.ShowModal() == wx.ID_CANCEL:
-                self.update_info(_("Open file cancelled."))
-                return     # the user changed idea...
-
-            # Open file, restart program
-            path = open_file_dialog.GetPath()
-            print(_("Opening file="), path)
-            sys.stdout.flush()
-            os.execv(sys.executable, ["python3"] + [sys.argv[0]] + [path])
-        if event_id == wx.ID_INFO:
-            if self.info_text_true:
-                self.dev_text.Hide()
-            else:
-                self.dev_text.Show()
-            self.info_text_true = not self.info_text_true
-            self.update_info(_("Developer mode toggled."))
-        if event_id == self.monochrome_ID:
-            self.canvas.colours = [(0.1, 0.1, 0.1), (0.1, 0.1, 0.1)]
-            self.colours = [(25, 25, 25), (25, 25, 25)]
-            self.update_info(_("Changing colour scheme to Monochrome"))
-        if event_id == self.red_ID:
-            self.canvas.colours = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
-            self.colours = [(255, 0, 0), (0, 255, 0)]
-            self.update_info(_("Changing colour scheme to Red"))
-        if event_id == self.magenta_ID:
-            self.canvas.colours = [(0.83, 0.07, 0.35), (0.10, 0.52, 1.0)]
-            self.colours = [(212, 17, 89), (26, 133, 255)]
-            self.update_info(_("Changing colour scheme to Magenta"))
-        if event_id == self.purple_ID:
-            self.canvas.colours = [(0.29, 0.0, 0.57), (0.10, 1.0, 0.10)]
-            self.colours = [(75, 0, 146), (26, 255, 26)]
-            self.update_info(_("Changing colour scheme to Purple"))
-        self.canvas.render()
-
-    def on_spin_cycle(self, event):
-        """Handle the event when the user updates spin control."""
-        spin_value = self.spin_cycle.GetValue()
-        self.cycles = spin_value
-        text = "".join([_("New number of cycles per execution: "),
-                       str(spin_value)])
-        self.canvas.render()
-        self.update_info(text)
-
-    def on_run_button(self, event):
-        """Handle the event when the user clicks the run button."""
-        if not self.compiled:
-            # Disable run button if errors exist
-            if self.error_handler.error_count > 0:
-                self.run_button.Enable(False)
-                error_window = ErrorFrame(self.GetTopLevelParent(),
-                                          wx.DEFAULT_FRAME_STYLE,
-                                          self.error_handler,
-                                          self.run_button)
-                error_window.Show(True)
-                text = _("Errors in definition file. Code cannot be compiled."
-                         "Fix errors, then re-open file.")
-                self.update_info(text, False, self.colours[0])
-                self.run_button.SetLabel(_("Error"))
-            else:
-                text = _("Definition file compiled.")
-                self.run_button.SetLabel(_("Run"))
-                self.compiled = True
-                self.canvas.render()
-                self.update_info(text)
-        else:
-            self.monitors.reset_monitors()
-            self.devices.cold_startup()
-            cycles = self.spin_cycle.GetValue()
-            self.canvas.periods = cycles
-            if self.run_network(cycles):
-                self.update_traces()
-                self.update_info(_("Simulation running for {} cycles").format(
-                                   cycles))
-                self.canvas.render()
-                self.continue_button.Enable(True)
-            self.on_home_button(None, False)  # Send to home
-
-    def on_continue_button(self, event):
-        """Handle the event when the user clicks the continue button."""
-        cycles = self.spin_cycle.GetValue()
-        canvas = self.canvas
-        size = canvas.GetClientSize()
-
-        if self.run_network(cycles):
-            canvas.periods += cycles
-
-            self.update_traces()
-            translation = _("Continuing for {} cycles. Total: {} cycles.")
-            text = translation.format(cycles, canvas.periods)
-            canvas.render()
-            self.update_info(text)
-
-    def on_switches_button(self, event):
-        """Handle the event when the user clicks the switches button."""
-        pop = SwitchFrame(self.GetTopLevelParent(), wx.DEFAULT_FRAME_STYLE,
-                          self.switches_button, self.devices, self.canvas)
-
-        width, height = self.GetSize()
-        pos = self.ClientToScreen(int(width/4), int(height / 4))
-        pop.SetPosition(pos)
-        pop.Show(True)
-        self.switches_button.Enable(False)
-        text = _("Switches button pressed.")
-        self.canvas.render()
-        self.update_info(text)
-
-    def on_monitors_button(self, event):
-        """Handle the event when the user clicks the monitors button."""
-        pop = MonitorFrame(self.GetTopLevelParent(), wx.DEFAULT_FRAME_STYLE,
-                           self.monitors_button, self.canvas, self.monitors)
-
-        pop.colours = self.colours
-        width, height = self.GetSize()
-        pos = self.ClientToScreen(int(width/4), int(height / 4))
-        pop.SetPosition(pos)
-        pop.Show(True)
-        self.monitors_button.Enable(False)
-        text = _("Monitors button pressed.")
-        self.canvas.render()
-        self.update_info(text)
-
-    def on_connection_button(self, event):
-        """Handle the event when the user clicks the connections button."""
-        pop = ConnectionFrame(self.GetTopLevelParent(),
-                              wx.DEFAULT_FRAME_STYLE,
-                              self.connection_button,
-                              self.canvas, self.network)
-        pop.colours = self.colours
-        width, height = self.GetSize()
-        pos = self.ClientToScreen(int(width/4), int(height / 4))
-        pop.SetPosition(pos)
-        pop.Show(True)
-        self.connection_button.Enable(False)
-        text = _("Connection button pressed.")
-        self.canvas.render()
-        self.update_info(text)
-
-    def on_right_button(self, event):
-        """Handle event where right button is pressed."""
-        canvas = self.canvas
-        size = canvas.GetClientSize()
-        if (canvas.pan_x - size.width
-                > - canvas.max_x * canvas.zoom):
-            # Do not move pan more than necessary
-            if (canvas.pan_x - 2 * size.width
-                    > - canvas.max_x * canvas.zoom):
-                canvas.pan_x -= size.width
-            else:
-                canvas.pan_x = (- canvas.max_x * canvas.zoom
-                                + size.width)
-            canvas.init = False
-            self.update_info(_("Scrolling right: {}.").format(
-                          canvas.pan_x))
-            canvas.render()
-
-    def on_left_button(self, event):
-        """Handle event where left button is pressed."""
-        canvas = self.canvas
-        size = canvas.GetClientSize()
-        if canvas.pan_x < 0:
-            if canvas.pan_x > -size.width:
-                canvas.pan_x = 0
-            else:
-                canvas.pan_x += size.width
-            canvas.init = False
-            self.update_info(_("Scrolling left: {}.").format(
-                             canvas.pan_x))
-            canvas.render()
-
-    def on_home_button(self, event, show_text=True):
-        """Handle event where home button is pressed."""
-        canvas = self.canvas
-        size = canvas.GetClientSize()
-        canvas.pan_x = 0
-        canvas.pan_y = -(canvas.zoom - 1.0) * size.height
-        canvas.init = False
-        if show_text:
-            self.update_info(_("Resetting view"))
-        canvas.render()
-
-
-class MyApp(wx.App, InspectionMixin):
-    """Configure main app and its language."""
-
-    def OnInit(self):
-        """Initialise app, set default language."""
-        self.Init()
-
-        lang = wx.Locale.GetSystemLanguage()
-        # If lang not supported, default to english
-        if lang in sup_lang:
-            wx_lang = lang
-        else:
-            wx_lang = wx.LANGUAGE_ENGLISH
-
-        # Create locale
-        self.locale = wx.Locale(wx_lang)
-        if self.locale.IsOk():
-            base_path = os.path.abspath(os.path.dirname(sys.argv[0]))
-            sys.path.append(base_path)
-            self.locale.AddCatalogLookupPathPrefix("locale")
-            self.locale.AddCatalog("logsim")
-        else:
-            self.locale = None
-
-        return True
+"""Implement the graphical user interface for the Logic Simulator.
+
+Used in the Logic Simulator project to enable the user to run the simulation
+or adjust the network properties.
+
+Classes:
+--------
+MyGLCanvas - handles all canvas drawing operations.
+Gui - configures the main window and all the widgets.
+SignalList - shows a filterable virtual list of signal names.
+SwitchFrame - configures popup window for switch control.
+MonitorFrame - configures popup window for monitor control.
+ErrorFrame - configures popup window for error display.
+"""
+import sys
+import os
+import threading
+import time
+from cgi import print_environ
+import numpy
+import wx
+import wx.glcanvas as wxcanvas
+from OpenGL import GL, GLUT
+
+
+import builtins
+
+from wx.lib.mixins.inspection import InspectionMixin
+
+# Set "_" to call translation
+builtins.__dict__["_"] = wx.GetTranslation
+
+# Languages available in code
+sup_lang = [wx.LANGUAGE_ENGLISH,
+            wx.LANGUAGE_GREEK]
+
+
+class MyGLCanvas(wxcanvas.GLCanvas):
+    """Handle all drawing operations.
+
+    This class contains functions for drawing onto the canvas. It
+    also contains handlers for events relating to the canvas.
+
+    Parameters
+    ----------
+    parent: parent window.
+    size: canvas size.
+    devices: instance of the devices.Devices() class.
+    monitors: instance of the monitors.Monitors() class.
+
+    Public methods
+    --------------
+    init_gl(self): Configure the OpenGL context.
+
+    render(self, text): Handle all drawing operations.
+
+    request_render(self): Schedule a repaint of the canvas.
+
+    set_traces(self, traces): Set the traces to draw and update their
+                              vertex arrays.
+
+    on_paint(self, event): Handle the canvas paint event.
+
+    on_size(self, event): Handle the canvas resize event.
+
+    on_mouse(self, event): Handle mouse events.
+
+    on_key(self, event): Handle key press events.
+
+    Non-public methods
+    -------------
+
+    _render_text(self, text, x_pos, y_pos): Handle text drawing
+                                           operations.
+
+    _get_tick_step(self, min_px): Return the number of cycles between
+                                  ticks at least min_px apart.
+
+    _update_vertices(self, label, trace): Return the vertex array of a
+                                          trace, adding any new cycles.
+
+    _build_vertices(self, trace, first_cycle=0): Return the vertex array of
+                                                 a trace.
+
+    _get_visible_cycles(self): Return the first and last cycles in view.
+
+    _render_trace(self, trace, label=None): Draw new signal trace.
+
+    _update_max_xy(self, x, y): Update max_x and max_y values.
+    """
+
+    def __init__(self, parent, size):
+        """Initialise canvas properties and useful variables."""
+        super().__init__(parent, -1, size=size,
+                         attribList=[wxcanvas.WX_GL_RGBA,
+                                     wxcanvas.WX_GL_DOUBLEBUFFER,
+                                     wxcanvas.WX_GL_DEPTH_SIZE, 16, 0])
+        GLUT.glutInit()
+        self.init = False
+        self.context = wxcanvas.GLContext(self)
+        self.parent = parent
+
+        # Initialise variables for panning
+        self.pan_x = 0
+        self.pan_y = 0
+        self.last_mouse_x = 0  # Previous mouse x position
+        self.last_mouse_y = 0  # Previous mouse y position
+
+        # Initialise variables for zooming and scrolling
+        self.zoom = 2.0
+        self.max_y = 0
+        self.max_x = 0
+
+        # Update variables for panning
+        self.pan_y -= (self.zoom - 1.0) * size.height/2
+
+        # Initialise display variables for signal sketch
+        self.traces = {}
+        # Vertex array of every trace by label, as a view onto a buffer with
+        # room to grow, and the monitor signal list it was built from
+        self.trace_vertices = {}
+        self.trace_buffers = {}
+        self.trace_sources = {}
+        self.visible_cycles = (0, 0)  # cycle window in view
+        self.label_step = 1  # cycles between numbers on the axes
+        self.font_base = None  # display list of the first cached glyph
+        self.periods = 0
+        self.trace_num = 0
+        self.shift_px = 50
+        self.period_px = 20
+        self.colours = [(1.0, 0.0, 0.0),
+                        (0.0, 1.0, 0.0)]  # Red and Green
+
+        # Bind events to the canvas
+        self.Bind(wx.EVT_SIZE, self.on_size)
+        self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
+        self.Bind(wx.EVT_CHAR_HOOK, self.on_key)
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+
+    def init_gl(self):
+        """Configure and initialise the OpenGL context.
+
+        Only the viewport and projection depend on the canvas size. Pan and
+        zoom are applied to the modelview matrix on every render.
+        """
+        size = self.GetClientSize()
+        self.SetCurrent(self.context)
+        GL.glDrawBuffer(GL.GL_BACK)
+        GL.glClearColor(1.0, 1.0, 1.0, 0.0)
+        GL.glViewport(0, 0, size.width, size.height)
+        GL.glMatrixMode(GL.GL_PROJECTION)
+        GL.glLoadIdentity()
+        GL.glOrtho(0, size.width, 0, size.height, -1, 1)
+        GL.glMatrixMode(GL.GL_MODELVIEW)
+
+    def render(self):
+        """Handle all drawing operations."""
+        self.max_x, self.max_y = 0, 0  # Reset max values
+        size = self.GetClientSize()
+        self.SetCurrent(self.context)
+        if not self.init:
+            # Configure the viewport and projection matrices
+            self.init_gl()
+            self.init = True
+
+        # Apply the current pan and zoom
+        GL.glLoadIdentity()
+        GL.glTranslated(self.pan_x, self.pan_y, 0.0)
+        GL.glScaled(self.zoom, self.zoom, self.zoom)
+
+        # Clear everything
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+
+        # Only the cycles in view are drawn, with as many numbers and grid
+        # lines as fit without overlapping
+        self.visible_cycles = self._get_visible_cycles()
+        first, last = self.visible_cycles
+        self.label_step = self._get_tick_step(7 * len(str(last)) + 8)
+        grid_step = self._get_tick_step(4)
+
+        for label, trace in self.traces.items():
+            self._render_trace(trace, label=label)
+
+        # Draw mesh to indicate periods
+        if len(self.traces) > 0:
+            GL.glPushAttrib(GL.GL_ENABLE_BIT)
+            GL.glLineStipple(1, 0xAAAA)
+            GL.glColor3f(0.0, 0.0, 0.0)
+            GL.glEnable(GL.GL_BLEND)
+            GL.glEnable(GL.GL_LINE_STIPPLE)
+            GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+            GL.glColor4f(0.0, 0.0, 0.0, 0.25)
+            GL.glBegin(GL.GL_LINES)
+            for i in range(-(-max(first, 1) // grid_step) * grid_step,
+                           min(last, self.periods) + 1, grid_step):
+                GL.glVertex2f(self.shift_px + self.period_px*i,
+                              size.height - 20)
+                GL.glVertex2f(self.shift_px + self.period_px*i,
+                              size.height - self.max_y - 5)
+            GL.glEnd()
+            GL.glPopAttrib()
+
+        # Reset number of traces for next render
+        self.trace_num = 0
+
+        # We have been drawing to the back buffer, flush the graphics pipeline
+        # and swap the back buffer to the front
+        GL.glFlush()
+        self.SwapBuffers()
+
+    def on_paint(self, event):
+        """Handle the paint event."""
+        wx.PaintDC(self)  # the paint event is only handled once a DC exists
+        self.render()
+
+    def request_render(self):
+        """Schedule a repaint of the canvas.
+
+        wx merges every refresh requested before the next paint event into
+        one, so a burst of mouse or key events only redraws once.
+        """
+        self.Refresh(False)
+
+    def on_size(self, event):
+        """Handle the canvas resize event."""
+        # Reset view on resize
+        size = self.GetClientSize()
+        self.pan_x = 0
+        self.pan_y = -(self.zoom - 1.0) * size.height
+
+        # Forces reconfiguration of the viewport and projection matrices on
+        # the next paint event
+        self.init = False
+
+    def on_mouse(self, event):
+        """Handle mouse events.
+
+        Events only update the pan, and a single repaint is scheduled for
+        any number of them.
+        """
+        text = ""
+        pan = (self.pan_x, self.pan_y)
+
+        # Calculate object coordinates of the mouse position
+        size = self.GetClientSize()
+        if event.ButtonDown():
+            self.SetFocus()
+            self.last_mouse_x = event.GetX()
+            self.last_mouse_y = event.GetY()
+            text = "".join([_("Mouse button pressed at: "), str(event.GetX()),
+                            ", ", str(event.GetY())])
+        if event.ButtonUp():
+            text = "".join([_("Mouse button released at: "), str(event.GetX()),
+                            ", ", str(event.GetY())])
+        if event.Leaving():
+            text = "".join([_("Mouse left canvas at: "), str(event.GetX()),
+                            ", ", str(event.GetY())])
+        if (event.GetWheelRotation() < 0 and
+                self.pan_y + size.height * self.zoom
+                - 20 * self.zoom < self.max_y * self.zoom):
+            self.pan_y -= 0.1*event.GetWheelRotation()
+            string = _("Negative mouse wheel rotation. Scrolling down: ")
+            text = "".join([string, str(self.pan_y)])
+        if (event.GetWheelRotation() > 0 and
+                self.pan_y > -((self.zoom - 1.0) * size.height)):
+            self.pan_y -= 0.1*event.GetWheelRotation()
+            text = "".join([_("Positive mouse wheel rotation. Scrolling up: "),
+                            str(self.pan_y)])
+
+        if (self.pan_x, self.pan_y) != pan:
+            self.request_render()
+        if text:
+            self.parent.update_info(text)
+
+    def on_key(self, event):
+        """Handle key press events."""
+        key = event.GetKeyCode()
+        size = self.GetClientSize()
+        text = None
+        pan = (self.pan_x, self.pan_y)
+        if (key == wx.WXK_UP and self.pan_y
+                > -((self.zoom - 1.0) * size.height)):
+            self.pan_y -= 20
+            text = "".join([_("Up arrow press. Scrolling up: "),
+                            str(self.pan_y)])
+        if (key == wx.WXK_DOWN and self.pan_y + size.height * self.zoom
+                - 20 * self.zoom < self.max_y * self.zoom):
+            self.pan_y += 20
+            text = "".join([_("Down arrow press. Scrolling down: "),
+                            str(self.pan_y)])
+        if key == wx.WXK_LEFT and self.pan_x < 0:
+            self.pan_x += 20
+            text = "".join([_("Left arrow press. Scrolling left: "),
+                            str(self.pan_x)])
+        if (key == wx.WXK_RIGHT and self.pan_x - size.width + 20 * self.zoom
+                > - self.max_x * self.zoom):
+            self.pan_x -= 20
+            text = "".join([_("Right arrow press. Scrolling right: "),
+                            str(self.pan_x)])
+
+        if (self.pan_x, self.pan_y) != pan:
+            self.request_render()
+        if text:
+            self.parent.update_info(text)
+
+    def _render_text(self, text, x_pos, y_pos):
+        """Handle text drawing operations.
+
+        Every glyph is compiled into a display list the first time text is
+        drawn, so each line of text takes a single glCallLists call.
+        """
+        if self.font_base is None:
+            font = GLUT.GLUT_BITMAP_HELVETICA_12
+            self.font_base = GL.glGenLists(256)
+            for code in range(256):
+                GL.glNewList(self.font_base + code, GL.GL_COMPILE)
+                GLUT.glutBitmapCharacter(font, code)
+                GL.glEndList()
+
+        GL.glColor3f(0.0, 0.0, 0.0)  # text is black
+        GL.glListBase(self.font_base)
+        for line in text.split("\n"):
+            GL.glRasterPos2f(x_pos, y_pos)
+            GL.glCallLists(line.encode("latin-1", "replace"))
+            y_pos = y_pos - 20
+
+    def _get_tick_step(self, min_px):
+        """Return the number of cycles between ticks at least min_px apart.
+
+        Steps follow 1, 2, 5, 10, 20, 50... cycles.
+        """
+        cycle_px = self.period_px * self.zoom
+        step = 1
+        while step * cycle_px < min_px:
+            if str(step)[0] == "2":
+                step = step * 5 // 2
+            else:
+                step = step * 2
+        return step
+
+    def set_traces(self, traces):
+        """Set the traces to draw and update their vertex arrays.
+
+        traces maps every label to its monitor signal list. The geometry
+        only changes when the simulation does, so it is updated here instead
+        of on every paint, pan or zoom.
+        """
+        self.traces = traces
+        for label in list(self.trace_vertices):
+            if label not in traces:
+                del self.trace_vertices[label]
+                del self.trace_buffers[label]
+                del self.trace_sources[label]
+        for label, trace in traces.items():
+            self._update_vertices(label, trace)
+
+    def _update_vertices(self, label, trace):
+        """Return the vertex array of a trace, updated to its current length.
+
+        If the trace is the same list the array was built from and it has
+        only grown since, just the vertices of the new cycles are added.
+        The buffer grows geometrically, so continuing a simulation costs
+        time proportional to the new cycles. Otherwise the array is rebuilt.
+        """
+        # The trace may still be growing in the simulation thread, so its
+        # length is read once
+        cycles = len(trace)
+        vertices = self.trace_vertices.get(label)
+        built = 0
+        if vertices is not None and self.trace_sources[label] is trace:
+            built = len(vertices) // 2
+            if built == cycles:
+                return vertices
+        if built == 0 or built > cycles:
+            built = 0
+            buffer = numpy.empty((2 * cycles, 2), dtype=numpy.float32)
+        else:
+            buffer = self.trace_buffers[label]
+            if len(buffer) < 2 * cycles:
+                grown = numpy.empty((max(2 * cycles, 2 * len(buffer)), 2),
+                                    dtype=numpy.float32)
+                grown[:2 * built] = buffer[:2 * built]
+                buffer = grown
+
+        buffer[2 * built:2 * cycles] = self._build_vertices(
+            trace[built:cycles], built)
+        self.trace_buffers[label] = buffer
+        self.trace_sources[label] = trace
+        self.trace_vertices[label] = buffer[:2 * cycles]
+        return self.trace_vertices[label]
+
+    def _build_vertices(self, trace, first_cycle=0):
+        """Return the vertex array of a trace starting at first_cycle.
+
+        Each cycle is a horizontal segment, at 25 pixels for HIGH and 0
+        otherwise, relative to the axis of the trace. Joining consecutive
+        segments as a line strip draws the vertical edges.
+        """
+        cycles = len(trace)
+        levels = (numpy.asarray(trace) == 1) * 25.0  # 1 is HIGH
+        x_positions = (numpy.arange(first_cycle, first_cycle + cycles + 1,
+                                    dtype=numpy.float32)
+                       * self.period_px + self.shift_px)
+        vertices = numpy.empty((2 * cycles, 2), dtype=numpy.float32)
+        vertices[0::2, 0] = x_positions[:-1]
+        vertices[1::2, 0] = x_positions[1:]
+        vertices[0::2, 1] = levels
+        vertices[1::2, 1] = levels
+        return vertices
+
+    def _get_visible_cycles(self):
+        """Return the first and last cycles in view.
+
+        The window is found by mapping the canvas edges back through the pan
+        and zoom, with a cycle of margin on each side for the labels.
+        """
+        size = self.GetClientSize()
+        left = -self.pan_x / self.zoom - self.shift_px
+        right = (size.width - self.pan_x) / self.zoom - self.shift_px
+        first = max(int(left // self.period_px) - 1, 0)
+        last = max(int(-(-right // self.period_px)) + 1, first)
+        return first, last
+
+    def _render_trace(self, trace, label=None):
+        """Draw new signal trace."""
+        size = self.GetClientSize()
+        vertices = self._update_vertices(label, trace)
+        cycles = len(vertices) // 2
+        x_next = cycles * self.period_px + self.shift_px
+        last = min(self.visible_cycles[1], cycles)
+        first = min(self.visible_cycles[0], last)
+
+        # Draw trace from its vertex array, moved up to its axis
+        GL.glColor3f(*self.colours[0])
+        GL.glPushMatrix()
+        GL.glTranslatef(0.0, size.height - 50*(self.trace_num+1), 0.0)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glVertexPointer(2, GL.GL_FLOAT, 0, vertices)
+        GL.glDrawArrays(GL.GL_LINE_STRIP, 2 * first, 2 * (last - first))
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glPopMatrix()
+
+        # Draw axes
+        GL.glColor3f(0.0, 0.0, 0.0)
+        GL.glBegin(GL.GL_LINES)
+        GL.glVertex2f(self.shift_px, size.height - 50*(self.trace_num+1) + 30)
+        GL.glVertex2f(self.shift_px, size.height - 50*(self.trace_num+1) - 10)
+        GL.glVertex2f(self.shift_px-5, size.height - 50*(self.trace_num+1) - 5)
+        GL.glVertex2f(x_next + 10, size.height - 50*(self.trace_num+1) - 5)
+        GL.glEnd()
+        self._update_max_xy(x_next + 10,
+                            size.height - 50 * (self.trace_num+1) - 10)
+
+        # Draw numbers in axis
+        step = self.label_step
+        for num in range(-(-self.visible_cycles[0] // step) * step,
+                         min(self.visible_cycles[1], self.periods) + 1, step):
+            shift_x = 5  # Shift label in x direction
+            shift_x += (len(str(num)) - 1)*3
+            self._render_text(str(num),
+                              self.shift_px + self.period_px*(num) - shift_x,
+                              size.height - 50*(self.trace_num+1) - 12)
+
+        # Draw label
+        if label is None:
+            label = _("Trace {}").format(self.trace_num + 1)
+        self._render_text(label, self.shift_px - 40 - self.pan_x / self.zoom,
+                          size.height - 50 * (self.trace_num + 1) + 10)
+
+        # Update trace number
+        self.trace_num += 1
+
+    def _update_max_xy(self, x, y):
+        """Update max_x and max_y values."""
+        if self.GetVirtualSize().GetHeight() - y > self.max_y:
+            # y is measured from the top - change in coordinates
+            self.max_y = self.GetVirtualSize().GetHeight() - y
+        if x > self.max_x:
+            # x is measured from the left
+            self.max_x = x
+
+
+class SignalList(wx.ListCtrl):
+    """Show a list of signal names that can be filtered as the user types.
+
+    This is a virtual list control: it only asks for the rows in view, so
+    it opens as quickly with fifty thousand signals as with five. Glob
+    filters are looked up in the signal index of the monitors.
+
+    Parameters
+    ----------
+    parent: parent of the window.
+    names: signal names to show.
+    find: function returning the indexed names matching a glob pattern,
+          such as monitors.find_signal_names.
+
+    Public methods
+    --------------
+    OnGetItemText(self, item, column): Return the name shown in a row.
+
+    on_size(self, event): Event handler for resizing the list.
+
+    set_names(self, names): Replace the names in the list.
+
+    set_filter(self, text): Show only the names containing text, or matching
+                            it if it is a glob pattern.
+
+    add_name(self, name): Add a name at the end of the list.
+
+    remove_name(self, name): Remove a name from the list.
+
+    add_names(self, names): Add names at the end of the list.
+
+    remove_names(self, names): Remove names from the list.
+
+    get_selection(self): Return the selected name, or None.
+
+    get_shown(self): Return the names shown in the list.
+
+    clear_selection(self): Unselect the selected name.
+
+    Non-public methods
+    ------------------
+    _matches(self, name): Return True if name passes the current filter.
+
+    _update_rows(self): Update the control after the shown names change.
+    """
+
+    def __init__(self, parent, names, find):
+        """Initialise the virtual list control."""
+        super().__init__(parent, wx.ID_ANY,
+                         style=wx.LC_REPORT | wx.LC_VIRTUAL
+                         | wx.LC_SINGLE_SEL | wx.LC_NO_HEADER)
+        self.InsertColumn(0, "")
+        self.find = find
+        self.filter_text = ""
+        self.filter_glob = None  # names matching a glob filter_text
+        self.names = []
+        self.shown = []  # names matching filter_text, in list order
+        self.Bind(wx.EVT_SIZE, self.on_size)
+        self.set_names(names)
+
+    def OnGetItemText(self, item, column):
+        """Return the name shown in a row."""
+        return self.shown[item]
+
+    def on_size(self, event):
+        """Make the single column as wide as the list."""
+        self.SetColumnWidth(0, self.GetClientSize().width)
+        event.Skip()
+
+    def set_names(self, names):
+        """Replace the names in the list, keeping the current filter."""
+        self.names = list(names)
+        self.shown = [name for name in self.names if self._matches(name)]
+        self._update_rows()
+
+    def set_filter(self, text):
+        """Show only the names containing text, ignoring case.
+
+        While the user keeps typing, each new filter is a longer version of
+        the last one, so only the names already shown need checking. Text
+        with a *, ? or [ is a glob pattern, such as nand* or d?.Q, that the
+        whole name must match; the matching names are found in the signal
+        index rather than by checking every name in the list.
+        """
+        if any(character in "*?[" for character in text):
+            glob = set(self.find(text))
+            candidates = self.names
+        else:
+            text = text.lower()
+            glob = None
+            if (self.filter_glob is None and
+                    text.startswith(self.filter_text)):
+                candidates = self.shown
+            else:
+                candidates = self.names
+        self.filter_text = text
+        self.filter_glob = glob
+        self.shown = [name for name in candidates if self._matches(name)]
+        self._update_rows()
+
+    def add_name(self, name):
+        """Add a name at the end of the list."""
+        self.names.append(name)
+        if self._matches(name):
+            self.shown.append(name)
+            self._update_rows()
+
+    def remove_name(self, name):
+        """Remove a name from the list."""
+        self.names.remove(name)
+        if name in self.shown:
+            self.shown.remove(name)
+            self._update_rows()
+
+    def add_names(self, names):
+        """Add names at the end of the list."""
+        self.names.extend(names)
+        self.shown.extend([name for name in names if self._matches(name)])
+        self._update_rows()
+
+    def remove_names(self, names):
+        """Remove names from the list."""
+        names = set(names)
+        self.names = [name for name in self.names if name not in names]
+        self.shown = [name for name in self.shown if name not in names]
+        self._update_rows()
+
+    def get_selection(self):
+        """Return the selected name, or None if nothing is selected."""
+        item = self.GetFirstSelected()
+        if item == -1 or item >= len(self.shown):
+            return None
+        return self.shown[item]
+
+    def get_shown(self):
+        """Return a copy of the names shown in the list."""
+        return list(self.shown)
+
+    def clear_selection(self):
+        """Unselect the selected name."""
+        item = self.GetFirstSelected()
+        if item != -1:
+            self.Select(item, False)
+
+    def _matches(self, name):
+        """Return True if name passes the current filter."""
+        if self.filter_glob is not None:
+            return name in self.filter_glob
+        return self.filter_text in name.lower()
+
+    def _update_rows(self):
+        """Update the control after the shown names change."""
+        self.clear_selection()
+        self.SetItemCount(len(self.shown))
+        self.Refresh()
+
+
+class SwitchFrame(wx.Frame):
+    """Configure the popup switch menu frame window.
+
+    Parameters
+    ----------
+    parent: parent of the window.
+    style: styling of window, including borders
+    button: switch button object assigned to event
+    devices: devices object in simulator
+    canvas: canvas window frame
+    monitors: monitors object in simulator
+
+    Public methods
+    --------------
+    on_close(self, event): Event handler for closing window
+
+    on_search(self, event): Event handler for filtering the switches
+
+    on_listbox(self, event): Event handler for updating listbox selection
+
+    on_check(self, event): Event handler for updating checkbox value
+    """
+
+    def __init__(self, parent, style, button, devices, canvas, monitors):
+        """Initialise instance of class."""
+        wx.Frame.__init__(self, parent, title=_("Edit Switches"), style=style)
+
+        self.button = button
+        self.devices = devices
+        self.canvas = canvas
+        self.parent = parent
+
+        # Switch choices come from the signal index of the monitors
+        self.switches = {}  # switch name: switch ID
+        for switch_id in devices.find_devices(devices.SWITCH):
+            self.switches[monitors.get_signal_name(switch_id,
+                                                   None)] = switch_id
+
+        # Set widgets
+        self.search = wx.SearchCtrl(self, wx.ID_ANY)
+        self.listbox = SignalList(self, self.switches,
+                                  monitors.find_signal_names)
+        self.check = wx.CheckBox(self, wx.ID_ANY, _("Switch ON"))
+
+        # Set sizers
+        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(left_sizer, 1, wx.ALIGN_LEFT | wx.ALL, 2)
+        main_sizer.Add(self.check, 1, wx.ALIGN_RIGHT | wx.ALL, 2)
+        left_sizer.Add(self.search, 0, wx.EXPAND | wx.BOTTOM, 2)
+        left_sizer.Add(self.listbox, 1, wx.EXPAND)
+
+        self.listbox.SetMinSize((125, 200))
+        self.SetSize((250, 280))
+        self.SetSizeHints(250, 280)
+        self.SetMaxSize((250, 280))
+
+        # Bind events
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.search.Bind(wx.EVT_TEXT, self.on_search)
+        self.listbox.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_listbox)
+        self.Bind(wx.EVT_CHECKBOX, self.on_check)
+
+        # Set initial selection
+        if self.listbox.GetItemCount() > 0:
+            self.listbox.Select(0)
+        self.on_listbox(None)
+
+        self.SetSizer(main_sizer)
+        wx.CallAfter(self.Refresh)
+
+    def on_close(self, event):
+        """Close window on pressing close button."""
+        self.Show(False)
+        self.Destroy()
+        self.button.Enable(True)
+
+    def on_search(self, event):
+        """Show only the switches matching the search text."""
+        self.listbox.set_filter(self.search.GetValue())
+        self.on_listbox(None)
+
+    def on_listbox(self, event):
+        """Update screen depending on switch selection."""
+        string = self.listbox.get_selection()
+        self.check.Enable(string is not None)
+        if string is not None:
+            switch = self.devices.get_device(self.switches[string])
+            self.check.SetValue(switch.switch_state)
+
+    def on_check(self, event):
+        """Update switch values depending on check state."""
+        value = self.check.GetValue()
+        string = self.listbox.get_selection()
+        if string is None:
+            return
+        switch_id = self.switches[string]
+
+        if self.devices.set_switch(switch_id, value):
+            text = _("Switch {} set to {}.").format(string, value)
+        else:
+            text = _("Could not change switch state.")
+        self.canvas.render()
+        self.parent.update_info(text)
+
+
+class MonitorFrame(wx.Frame):
+    """Configure the popup monitors menu frame window.
+
+    Parameters
+    ----------
+    parent: parent of the window.
+    style: styling of window, including borders
+    button: monitors button object assigned to event
+    canvas: canvas window frame
+    monitors: monitors object in simulator
+
+    Public methods
+    --------------
+    on_close(self, event): Event handler for
+                           closing window
+
+    on_search(self, event): Filter both lists by
+                            the search text
+
+    on_add_button(self, event): Add a new monitor by
+                                reading textCtrl
+
+    on_remove_button(self, event): Remove a new selected monitor,
+                                   or from textCtrls
+
+    on_add_all_button(self, event): Monitor every signal shown
+                                    in the unmonitored listbox
+
+    on_remove_all_button(self, event): Unmonitor every signal shown
+                                       in the monitored listbox
+
+    on_mon_selection(self, event): Unselect unmonitored listbox
+
+    on_unmon_selection(self, event): Unselect monitored listbox
+
+    """
+
+    def __init__(self, parent, style, button, canvas, monitors):
+        """Initiate instance of class."""
+        wx.Frame.__init__(self, parent, title=_("Edit Monitors"), style=style)
+
+        self.button = button
+        self.monitors = monitors
+        self.canvas = canvas
+        self.names = self.monitors.names
+
+        # Set monitor information
+        [choices_mon, choices_unmon] = self.monitors.get_signal_names()
+
+        # Set widgets
+        mon_title = wx.StaticText(self, wx.ID_ANY, _("Monitored"))
+        unmon_title = wx.StaticText(self, wx.ID_ANY, _("Unmonitored"))
+        mon_title.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
+                                  wx.FONTSTYLE_NORMAL,
+                                  wx.FONTWEIGHT_BOLD,
+                                  True))
+        unmon_title.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
+                                    wx.FONTSTYLE_NORMAL,
+                                    wx.FONTWEIGHT_BOLD,
+                                    True))
+        self.search = wx.SearchCtrl(self, wx.ID_ANY)
+        self.add_button = wx.Button(self, wx.ID_ANY,
+                                    _("◀ Add"), size=(100, 50))
+        self.listbox_mon = SignalList(self, choices_mon,
+                                      self.monitors.find_signal_names)
+        self.listbox_unmon = SignalList(self, choices_unmon,
+                                        self.monitors.find_signal_names)
+        self.remove_button = wx.Button(self, wx.ID_ANY, _("Remove ▶"),
+                                       size=(100, 50))
+        self.add_all_button = wx.Button(self, wx.ID_ANY, _("◀ Add all"),
+                                        size=(100, 30))
+        self.remove_all_button = wx.Button(self, wx.ID_ANY,
+                                           _("Remove all ▶"), size=(100, 30))
+        self.search.SetDescriptiveText(_("Search, e.g. nand* or d?.Q"))
+        self.info_text = wx.StaticText(self, wx.ID_ANY, "")
+
+        # Set sizers
+        outer_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        right_sizer = wx.BoxSizer(wx.VERTICAL)
+        central_sizer = wx.BoxSizer(wx.VERTICAL)
+        outer_sizer.Add(self.search, 0, wx.EXPAND | wx.ALL, 4)
+        outer_sizer.Add(main_sizer, 1, wx.EXPAND)
+        main_sizer.Add(left_sizer, 1, wx.ALL | wx.ALIGN_LEFT, 4)
+        main_sizer.Add(central_sizer, 1, wx.TOP | wx.ALIGN_CENTER, 40)
+        main_sizer.Add(right_sizer, 5, wx.ALL | wx.ALIGN_RIGHT, 3)
+
+        # Add widgets to sizers
+        left_sizer.Add(mon_title, 4, wx.ALL | wx.ALIGN_LEFT, 10)
+        left_sizer.Add(self.listbox_mon, 4, wx.ALL | wx.ALIGN_LEFT, 10)
+        central_sizer.Add(self.add_button, 1, wx.ALL | wx.ALIGN_CENTER, 8)
+        central_sizer.Add(self.add_all_button, 1,
+                          wx.ALL | wx.ALIGN_CENTER, 8)
+        central_sizer.Add(self.remove_button, 1, wx.ALL | wx.ALIGN_CENTER, 8)
+        central_sizer.Add(self.remove_all_button, 1,
+                          wx.ALL | wx.ALIGN_CENTER, 8)
+        central_sizer.Add(self.info_text, 1, wx.RIGHT | wx.ALIGN_LEFT, 15)
+        right_sizer.Add(unmon_title, 4, wx.ALL | wx.ALIGN_RIGHT, 10)
+        right_sizer.Add(self.listbox_unmon, 4, wx.ALL | wx.ALIGN_RIGHT, 10)
+
+        self.listbox_mon.SetMinSize((100, 200))
+        self.listbox_unmon.SetMinSize((100, 200))
+        self.SetSize((430, 400))
+        self.SetSizeHints(430, 400)
+        self.SetMaxSize((430, 400))
+
+        # Bind events
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.search.Bind(wx.EVT_TEXT, self.on_search)
+        self.add_button.Bind(wx.EVT_BUTTON, self.on_add_button)
+        self.remove_button.Bind(wx.EVT_BUTTON, self.on_remove_button)
+        self.add_all_button.Bind(wx.EVT_BUTTON, self.on_add_all_button)
+        self.remove_all_button.Bind(wx.EVT_BUTTON, self.on_remove_all_button)
+        self.listbox_mon.Bind(wx.EVT_LIST_ITEM_SELECTED,
+                              self.on_mon_selection)
+        self.listbox_unmon.Bind(wx.EVT_LIST_ITEM_SELECTED,
+                                self.on_unmon_selection)
+
+        # Initialise buttons
+        self.remove_button.Enable(False)
+        self.add_button.Enable(False)
+
+        # Colours
+        self.colours = [(255, 0, 0),
+                        (0, 255, 0)]
+
+        self.SetSizer(outer_sizer)
+        wx.CallAfter(self.Refresh)
+
+    def on_close(self, event):
+        """Close window on pressing close button."""
+        self.Show(False)
+        self.Destroy()
+        self.button.Enable(True)
+
+    def on_search(self, event):
+        """Filter both lists by the search text."""
+        text = self.search.GetValue()
+        self.listbox_mon.set_filter(text)
+        self.listbox_unmon.set_filter(text)
+        self.add_button.Enable(False)
+        self.remove_button.Enable(False)
+
+    def on_add_button(self, event):
+        """Add a new monitor by reading textCtrl."""
+        string = self.listbox_unmon.get_selection()
+        text = self.info_text
+        if string is not None:
+            text.SetLabel(_("Device {} \nnow monitored.").format(string))
+            [device, port] = self.monitors.get_signal_ids(string)
+            self.monitors.make_monitor(device, port)
+            self.listbox_unmon.remove_name(string)
+            self.listbox_mon.add_name(string)
+            self.add_button.Enable(False)
+            text.SetForegroundColour((0, 0, 0))
+
+    def on_remove_button(self, event):
+        """Remove a new selected monitor, or from textCtrl."""
+        string = self.listbox_mon.get_selection()
+        text = self.info_text
+        if string is not None:
+            text.SetLabel(_("Device {} \nnow unmonitored.").format(string))
+            [device, port] = self.monitors.get_signal_ids(string)
+            self.monitors.remove_monitor(device, port)
+            self.listbox_mon.remove_name(string)
+            self.listbox_unmon.add_name(string)
+            self.remove_button.Enable(False)
+            text.SetForegroundColour((0, 0, 0))
+
+    def on_add_all_button(self, event):
+        """Monitor every signal shown in the unmonitored listbox."""
+        shown = self.listbox_unmon.get_shown()
+        if shown:
+            self.monitors.make_monitors(
+                [self.monitors.get_signal_ids(string) for string in shown])
+            self.listbox_unmon.remove_names(shown)
+            self.listbox_mon.add_names(shown)
+            self.add_button.Enable(False)
+            self.info_text.SetLabel(
+                _("{} signals \nnow monitored.").format(len(shown)))
+            self.info_text.SetForegroundColour((0, 0, 0))
+
+    def on_remove_all_button(self, event):
+        """Unmonitor every signal shown in the monitored listbox."""
+        shown = self.listbox_mon.get_shown()
+        if shown:
+            self.monitors.remove_monitors(
+                [self.monitors.get_signal_ids(string) for string in shown])
+            self.listbox_mon.remove_names(shown)
+            self.listbox_unmon.add_names(shown)
+            self.remove_button.Enable(False)
+            self.info_text.SetLabel(
+                _("{} signals \nnow unmonitored.").format(len(shown)))
+            self.info_text.SetForegroundColour((0, 0, 0))
+
+    def on_mon_selection(self, event):
+        """Unselect unmonitored listbox, enable add."""
+        self.listbox_unmon.clear_selection()
+        self.add_button.Enable(False)
+        self.remove_button.Enable(True)
+
+    def on_unmon_selection(self, event):
+        """Unselect monitored listbox, enable remove."""
+        self.listbox_mon.clear_selection()
+        self.remove_button.Enable(False)
+        self.add_button.Enable(True)
+
+
+class ConnectionFrame(wx.Frame):
+    """Configure the popup connection menu frame window.
+
+    Parameters
+    ----------
+    parent: parent of the window.
+    style: styling of window, including borders
+    button: monitors button object assigned to event
+    canvas: canvas window frame
+    network: network of connections in logsim
+    monitors: monitors object in simulator
+
+    Public methods
+    --------------
+    on_close(self, event): Event handler for
+                           closing window
+
+    on_input_search(self, event): Event handler for
+                                  filtering the inputs
+
+    on_output_search(self, event): Event handler for
+                                   filtering the outputs
+
+    on_add(self, event): Event handler for
+                         add check box
+
+    on_remove(self, event): Event handler for
+                            remove check box
+
+    on_list_sel(self, event): Event handler for
+                              any list selection
+
+    on_con_button(self, event): Event handler for
+                                connect button
+
+    Non-public methods
+    ------------------
+    _remove_connection(
+        self, id1, port1,
+        id2, port2): Removes connection between the
+                     provided devices and ports
+
+    """
+
+    def __init__(self, parent, style, button, canvas, network, monitors):
+        """Initiate instance of class."""
+        wx.Frame.__init__(self, parent,
+                          title=_("Edit Connections"), style=style)
+
+        self.button = button
+        self.network = network
+        self.canvas = canvas
+        self.devices = network.devices
+        self.parent = parent
+        self.monitors = monitors
+
+        # Set inputs and outputs in network
+        self.con_inp = []  # Connected inputs
+        self.disc_inp = []  # Disconnected inputs
+        for name in monitors.get_input_names():
+            id, port_id = monitors.get_input_ids(name)
+            if self.devices.get_device(id).inputs[port_id] is not None:
+                self.con_inp.append(name)
+            else:
+                self.disc_inp.append(name)
+        [monitored, unmonitored] = monitors.get_signal_names()
+        self.out = monitored + unmonitored
+
+        # Set widgets
+        output_text = wx.StaticText(self, wx.ID_ANY, _("Outputs"))
+        input_text = wx.StaticText(self, wx.ID_ANY, _("Inputs"))
+        output_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
+                                    wx.FONTSTYLE_NORMAL,
+                                    wx.FONTWEIGHT_BOLD,
+                                    True))
+        input_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
+                                   wx.FONTSTYLE_NORMAL,
+                                   wx.FONTWEIGHT_BOLD,
+                                   True))
+
+        self.input_search = wx.SearchCtrl(self, wx.ID_ANY)
+        self.output_search = wx.SearchCtrl(self, wx.ID_ANY)
+        self.input_box = SignalList(self, self.con_inp,
+                                    monitors.find_input_names)
+        self.output_box = SignalList(self, [], monitors.find_signal_names)
+        self.add_check = wx.CheckBox(self, wx.ID_ANY, _("Add"))
+        self.remove_check = wx.CheckBox(self, wx.ID_ANY, _("Remove"))
+        self.con_button = wx.Button(self, wx.ID_ANY, _("Disconnect"))
+        self.text = wx.StaticText(self, wx.ID_ANY, "")
+
+        # Set sizers
+        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        right_sizer = wx.BoxSizer(wx.VERTICAL)
+        central_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(left_sizer, 1, wx.ALL | wx.ALIGN_LEFT, 4)
+        main_sizer.Add(central_sizer, 1, wx.TOP | wx.ALIGN_CENTER, 40)
+        main_sizer.Add(right_sizer, 5, wx.ALL | wx.ALIGN_RIGHT, 3)
+
+        # Add widgets to sizers
+        left_sizer.Add(input_text, 4, wx.ALL | wx.ALIGN_CENTER, 10)
+        left_sizer.Add(self.input_search, 0, wx.EXPAND | wx.BOTTOM, 2)
+        left_sizer.Add(self.input_box, 40, wx.EXPAND, 10)
+        central_sizer.Add(self.add_check, 1, wx.ALL | wx.ALIGN_CENTER, 15)
+        central_sizer.Add(self.remove_check, 1, wx.ALL | wx.ALIGN_CENTER, 15)
+        central_sizer.Add(self.con_button, 1, wx.ALL | wx.ALIGN_CENTER, 15)
+        central_sizer.Add(self.text, 1, wx.LEFT, 10)
+        right_sizer.Add(output_text, 4, wx.ALL, 10)
+        right_sizer.Add(self.output_search, 0, wx.EXPAND | wx.BOTTOM, 2)
+        right_sizer.Add(self.output_box, 40, wx.EXPAND, 10)
+
+        self.input_box.SetSizeHints((100, 300))
+        self.output_box.SetSizeHints((100, 300))
+        self.SetSize((340, 330))
+        self.SetSizeHints(340, 330)
+        self.SetMaxSize((340, 330))
+
+        # Bind events
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.input_search.Bind(wx.EVT_TEXT, self.on_input_search)
+        self.output_search.Bind(wx.EVT_TEXT, self.on_output_search)
+        self.add_check.Bind(wx.EVT_CHECKBOX, self.on_add)
+        self.remove_check.Bind(wx.EVT_CHECKBOX, self.on_remove)
+        self.input_box.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_list_sel)
+        self.output_box.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_list_sel)
+        self.con_button.Bind(wx.EVT_BUTTON, self.on_con_button)
+
+        # Colours
+        self.colours = [(255, 0, 0),
+                        (0, 255, 0)]
+
+        # Initialise connection mode
+        self.remove_check.SetValue(1)
+        self.add_check.Enable(True)
+        self.remove_check.Enable(False)
+        self.con_button.Enable(False)
+        self.output_search.Enable(False)
+
+        # Initialise attributes
+        self.id1, self.port_id1 = None, None
+        self.id2, self.port_id2 = None, None
+
+        self.SetSizer(main_sizer)
+        wx.CallAfter(self.Refresh)
+
+    def on_close(self, event):
+        """Close window on pressing close button."""
+        self.Show(False)
+        self.Destroy()
+        self.button.Enable(True)
+        # If inputs left unconnected, notify on close
+        if len(self.disc_inp) > 0:
+            text = _("Some inputs were left disconnected. "
+                     "System may oscillate.")
+            self.parent.update_info(text, False,
+                                    self.parent.colours[0])
+
+    def on_input_search(self, event):
+        """Show only the inputs matching the search text."""
+        self.input_box.set_filter(self.input_search.GetValue())
+        if self.remove_check.GetValue() is True:
+            self.output_box.set_names([])
+        self.con_button.Enable(False)
+
+    def on_output_search(self, event):
+        """Show only the outputs matching the search text."""
+        self.output_box.set_filter(self.output_search.GetValue())
+        self.con_button.Enable(False)
+
+    def on_add(self, event):
+        """Change mode to add connections."""
+        self.input_box.set_names(self.disc_inp)
+        self.output_box.set_names(self.out)
+        self.output_search.Enable(True)
+        self.remove_check.SetValue(0)
+        self.add_check.Enable(False)
+        self.remove_check.Enable(True)
+        self.con_button.SetLabel(_("Connect"))
+        self.con_button.Enable(False)
+        self.text.SetLabel("")
+
+    def on_remove(self, event):
+        """Change mode to remove connections."""
+        self.input_box.set_names(self.con_inp)
+        # Only the connected output is shown, so it must not be filtered
+        self.output_search.ChangeValue("")
+        self.output_box.set_filter("")
+        self.output_box.set_names([])
+        self.output_search.Enable(False)
+        self.add_check.SetValue(0)
+        self.add_check.Enable(True)
+        self.remove_check.Enable(False)
+        self.con_button.SetLabel(_("Disconnect"))
+        self.con_button.Enable(False)
+        self.text.SetLabel("")
+
+    def on_list_sel(self, event):
+        """Handle event when input is selected."""
+        inp = self.input_box.get_selection()
+        out = self.output_box.get_selection()
+        if self.remove_check.GetValue() is True:
+            # Remove mode
+            if inp is None or event.GetEventObject() is self.output_box:
+                return
+            id1, port_id1 = self.monitors.get_input_ids(inp)
+            id2, port_id2 = self.network.get_connected_output(id1,
+                                                              port_id1)
+            out = self.monitors.get_signal_name(id2, port_id2)
+            self.output_box.set_names([out])
+            self.con_button.Enable(True)
+
+            # Set attribute variables - memory
+            self.id1, self.port_id1 = id1, port_id1
+            self.id2, self.port_id2 = id2, port_id2
+        elif inp is not None and out is not None:
+            # Add mode
+            id1, port_id1 = self.monitors.get_input_ids(inp)
+            id2, port_id2 = self.monitors.get_signal_ids(out)
+            self.con_button.Enable(True)
+
+            # Set attribute variables - memory
+            self.id1, self.port_id1 = id1, port_id1
+            self.id2, self.port_id2 = id2, port_id2
+        self.text.SetLabel("")
+
+    def on_con_button(self, event):
+        """Handle event for button presses."""
+        name = self.input_box.get_selection()
+        if name is None:
+            return
+        if self.remove_check.GetValue() is True:
+            # Remove mode
+            self._remove_connection(self.id1, self.port_id1,
+                                    self.id2, self.port_id2)
+            self.con_inp.remove(name)
+            self.disc_inp.append(name)
+            self.input_box.remove_name(name)
+            self.output_box.set_names([])
+            self.con_button.Enable(False)
+            self.text.SetLabel(_("Input {}\ndisconnected").format(name))
+        else:
+            # Add mode
+            out_name = self.output_box.get_selection()
+            self.network.make_connection(self.id2,
+                                         self.port_id2,
+                                         self.id1,
+                                         self.port_id1)
+            self.disc_inp.remove(name)
+            self.con_inp.append(name)
+
+            self.input_box.remove_name(name)
+            self.output_box.clear_selection()
+            self.con_button.Enable(False)
+            label = _("Input {}\nconnected to\n{}")
+            self.text.SetLabel(label.format(name, out_name))
+
+    def _remove_connection(self, id1, port1, id2, port2):
+        """Remove connection from 1 (input) to 2 (output)."""
+        first_device = self.devices.get_device(id1)
+        first_device.inputs[port1] = None
+
+
+class ErrorFrame(wx.Frame):
+    """Configure the popup error display frame window.
+
+    Parameters
+    ----------
+    parent: parent of the window.
+    style: styling of window, including borders
+    errorHandler: errorHandler object from logsim
+    run_button: button object assigned to the running
+                of the simulation
+
+    Public methods
+    --------------
+    on_close(self, event): Event handler for closing window
+    """
+
+    def __init__(self, parent, style, error_handler, run_button):
+        """Initialise instance of the SwitchPopup class."""
+        wx.Frame.__init__(self, parent, title=_("Error display"), style=style)
+
+        self.run = run_button
+
+        # Set widgets
+        string = ""
+        string = _("> Errors in definition file. Code cannot be "
+                   "compiled. Fix errors, then re-open file.\n\n")
+        string += _("> Number of errors detected:{}\n\n").format(
+                  error_handler.error_count)
+        for error in error_handler.error_list:
+            # Error must be split into each of its lines for translation
+            error_msg = error_handler.error_builder(error).split("\n")
+            error_msg[0] = _(error_msg[0])
+            error_msg[3] = _(error_msg[3])
+            error_string = "\n".join(error_msg)
+            string += _("> ERROR: {}\n").format(error_string)
+        scroll_win = wx.ScrolledWindow(self, wx.ID_ANY, style=wx.SUNKEN_BORDER
+                                       | wx.HSCROLL | wx.VSCROLL)
+        text = wx.TextCtrl(scroll_win, wx.ID_ANY, style=wx.TE_MULTILINE
+                           | wx.TE_READONLY)
+        text.SetValue(string)
+        text.SetFont(wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL,
+                             wx.FONTWEIGHT_NORMAL, False))
+
+        # Set sizers
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Add widgets to sizers
+        main_sizer.Add(text, 1, wx.TOP | wx.LEFT | wx.EXPAND, 10)
+
+        self.SetSize((500, 500))
+        self.SetSizeHints(500, 500)
+        self.SetMaxSize((500, 500))
+
+        # Bind events
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        text.ShowPosition(0)
+
+        self.SetSizer(main_sizer)
+        wx.CallAfter(self.Refresh)
+
+    def on_close(self, event):
+        """Close window on pressing close button, enable run button."""
+        self.Show(False)
+        self.run.Enable(True)
+        self.Destroy()
+
+
+class Gui(wx.Frame):
+    """Configure the main window and all the widgets.
+
+    This class provides a graphical user interface for the Logic Simulator and
+    enables the user to change the circuit properties and run simulations.
+
+    Parameters
+    ----------
+    title: title of the window.
+    names: Names class object
+    devices: Devices class object
+    network: Network class object
+    monitors: Monitors class object
+    error_handler: ErrorHandler class object
+    seed: seed for the cold start-up of D-types and clocks, or None for a
+          different random start-up on every run.
+    iteration_limit: number of iterations allowed for a cycle to settle, or
+                     None to derive it from the logic depth.
+
+    Public methods
+    --------------
+    run_network(self, cycles, on_finished): Run the network for the
+                                            specified number of simulation
+                                            cycles in a background thread.
+
+    show_progress(self, completed, cycles): Show the partial traces and
+                                            progress of a running simulation.
+
+    set_running(self, running): Enable the widgets allowed while a
+                                simulation is or is not running.
+
+    get_metrics_text(self): Returns the text summarising the activity of
+                            the executed cycles.
+
+    get_period_text(self): Returns the text reporting the period found by
+                           the last run.
+
+    update_traces(self): Update traces displayed on canvas.
+
+    update_info(self, text,
+                dev=True, col=(0,0,0)): Update info text.
+
+    on_menu(self, event): Event handler for the file menu.
+
+    on_spin_cycle(self, event): Event handler for when the user changes
+                                the number of cycles spin control.
+
+    on_spin_limit(self, event): Event handler for when the user changes
+                                the settle limit spin control.
+
+    on_spin(self, event): Event handler for when the user changes the spin
+                           control value.
+
+    on_run_button(self, event): Event handler for when the user clicks the run
+                                button.
+
+    on_run_finished(self, cycles): Show the results of a run from scratch.
+
+    on_continue_button(self, event): Event handler for when the user clicks
+                                     the continue button.
+
+    on_continue_finished(self, cycles): Show the results of a continued run.
+
+    on_cancel_button(self, event): Event handler for when the user clicks
+                                   the cancel button.
+
+    on_close(self, event): Event handler for when the window is closed.
+
+    on_switches_button(self, event): Event handler for when the user clicks
+                                     the switches button.
+
+    on_monitors_button(self, event): Event handler for when the user clicks
+                                     the monitors button.
+
+    on_connection_button(self, event): Event handler for when the user clicks
+                                        the connections button.
+
+    on_right_button(self, event): Event handler for when the user clicks
+                                  the right button.
+
+    on_left_button(self, event): Event handler for when the user clicks
+                                  the left button.
+
+    on_home_button(self, event): Event handler for when the user clicks
+                                  the home button.
+
+    Non-public methods
+    ------------------
+    _simulate(self, cycles, on_finished): Run the simulation in the worker
+                                          thread.
+
+    _on_progress(self, completed, cycles): Post throttled progress updates
+                                           from the worker thread.
+
+    _on_simulation_done(self, success, on_finished): Finish a run in the GUI
+                                                     thread.
+    """
+
+    def __init__(self, title, names, devices,
+                 network, monitors, error_handler, seed=None,
+                 iteration_limit=None):
+        """Initialise widgets and layout."""
+        super().__init__(parent=None, title=_(title), size=(800, 600))
+
+        # Logic simulator details
+        self.names = names
+        self.devices = devices
+        self.monitors = monitors
+        self.network = network
+        self.error_handler = error_handler
+        self.seed = seed
+        if iteration_limit is not None:
+            self.network.iteration_limit = iteration_limit
+
+        # Configure the menu bar
+        fileMenu = wx.Menu()
+        viewMenu = wx.Menu()
+        colourMenu = wx.Menu()
+        helpMenu = wx.Menu()
+        menuBar = wx.MenuBar()
+        fileMenu.Append(wx.ID_OPEN, _("&Open"))
+        fileMenu.Append(wx.ID_EXIT, _("&Exit"))
+        viewMenu.Append(wx.ID_INFO, _("&Dev Info"))
+        helpMenu.Append(wx.ID_ABOUT, _("&About"))
+        viewMenu.Append(wx.ID_SELECT_COLOR, _("&Colour"), colourMenu)
+        menuBar.Append(fileMenu, _("&File"))
+        menuBar.Append(viewMenu, _("&View"))
+        menuBar.Append(helpMenu, _("&Help"))
+        self.SetMenuBar(menuBar)
+
+        # Configure sub menus for colour options
+        self.monochrome_ID = 999
+        self.red_ID = 998
+        self.magenta_ID = 997
+        self.purple_ID = 996
+        colourMenu.Append(self.monochrome_ID, _("&Monochrome"))
+        colourMenu.Append(self.red_ID, _("&Red"))
+        colourMenu.Append(self.magenta_ID, _("&Magenta"))
+        colourMenu.Append(self.purple_ID, _("&Purple"))
+
+        # Configure the widgets
+        self.cycles = 10
+        self.text_cycle = wx.StaticText(self, wx.ID_ANY, _("Cycles:"))
+        self.spin_cycle = wx.SpinCtrl(self, wx.ID_ANY, str(self.cycles), min=1)
+        # A settle limit of 0 derives the limit from the logic depth
+        self.text_limit = wx.StaticText(self, wx.ID_ANY, _("Settle limit:"))
+        self.spin_limit = wx.SpinCtrl(self, wx.ID_ANY,
+                                      str(self.network.iteration_limit or 0),
+                                      min=0, max=100000)
+        self.run_button = wx.Button(self, wx.ID_ANY, _("Compile"),
+                                    size=(130, 50))
+        self.continue_button = wx.Button(self, wx.ID_ANY,
+                                         _("Continue"), size=(130, 50))
+        self.cancel_button = wx.Button(self, wx.ID_ANY, _("Cancel"),
+                                       size=(130, 50))
+        self.progress_gauge = wx.Gauge(self, wx.ID_ANY, range=100,
+                                       size=(130, 15))
+        self.switches_button = wx.Button(self, wx.ID_ANY,
+                                         _("Edit Switches"), size=(130, 50))
+        self.monitors_button = wx.Button(self, wx.ID_ANY,
+                                         _("Edit Monitors"), size=(130, 50))
+        self.connection_button = wx.Button(self, wx.ID_ANY,
+                                           _("Edit Connections"),
+                                           size=(130, 50))
+        self.right_button = wx.Button(self, wx.ID_ANY, "▶", size=(50, 50))
+        self.left_button = wx.Button(self, wx.ID_ANY, "◀", size=(50, 50))
+        self.home_button = wx.Button(self, wx.ID_ANY, "🏠", size=(50, 50))
+        self.simulation_text = wx.StaticText(self, wx.ID_ANY,
+                                             _("Simulated Signals"))
+        self.simulation_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT,
+                                             wx.FONTSTYLE_NORMAL,
+                                             wx.FONTWEIGHT_BOLD,
+                                             True))
+        self.dev_text = wx.StaticText(self, wx.ID_ANY, "")
+        self.dev_text.SetFont(wx.Font(10, wx.FONTFAMILY_MODERN,
+                                      wx.FONTSTYLE_NORMAL,
+                                      wx.FONTWEIGHT_NORMAL,
+                                      False))
+
+        # Canvas for drawing signals
+        self.canvas = MyGLCanvas(self, wx.Size(300, 1000))
+        self.canvas.SetSizeHints(300, 1100)
+
+        # Bind events to widgets
+        self.Bind(wx.EVT_MENU, self.on_menu)
+        self.spin_cycle.Bind(wx.EVT_SPINCTRL, self.on_spin_cycle)
+        self.spin_limit.Bind(wx.EVT_SPINCTRL, self.on_spin_limit)
+        self.run_button.Bind(wx.EVT_BUTTON, self.on_run_button)
+        self.continue_button.Bind(wx.EVT_BUTTON, self.on_continue_button)
+        self.cancel_button.Bind(wx.EVT_BUTTON, self.on_cancel_button)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.switches_button.Bind(wx.EVT_BUTTON, self.on_switches_button)
+        self.monitors_button.Bind(wx.EVT_BUTTON, self.on_monitors_button)
+        self.connection_button.Bind(wx.EVT_BUTTON, self.on_connection_button)
+        self.right_button.Bind(wx.EVT_BUTTON, self.on_right_button)
+        self.left_button.Bind(wx.EVT_BUTTON, self.on_left_button)
+        self.home_button.Bind(wx.EVT_BUTTON, self.on_home_button)
+
+        # Configure sizers for layout
+        main_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        right_sizer = wx.BoxSizer(wx.VERTICAL)
+        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        arrow_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        main_sizer.Add(left_sizer, 10, wx.EXPAND, 5)
+        main_sizer.Add(right_sizer, 1, wx.ALL, 5)
+
+        left_sizer.Add(self.simulation_text, 1, wx.TOP | wx.ALIGN_CENTER, 2)
+        left_sizer.Add(self.dev_text, 1, wx.BOTTOM | wx.ALIGN_BOTTOM, 2)
+        left_sizer.Add(self.canvas, 50, wx.EXPAND | wx.ALL, 5)
+
+        right_sizer.Add(self.text_cycle, 1,
+                        wx.ALIGN_CENTER | wx.ALIGN_BOTTOM | wx.TOP, 30)
+        right_sizer.Add(self.spin_cycle, 1, wx.ALIGN_CENTER)
+        right_sizer.Add(self.text_limit, 1, wx.ALIGN_CENTER | wx.TOP, 5)
+        right_sizer.Add(self.spin_limit, 1, wx.ALIGN_CENTER)
+        right_sizer.Add(self.run_button, 1, wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(self.continue_button, 1,
+                        wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(self.cancel_button, 1,
+                        wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(self.progress_gauge, 0,
+                        wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(self.switches_button, 1,
+                        wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(self.monitors_button, 1,
+                        wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(self.connection_button, 1,
+                        wx.ALL | wx.ALIGN_CENTER, 5)
+        right_sizer.Add(arrow_sizer, 1,
+                        wx.ALIGN_BOTTOM | wx.ALIGN_CENTER | wx.TOP, 30)
+        right_sizer.Add(self.home_button, 1, wx.ALIGN_CENTER)
+
+        arrow_sizer.Add(self.left_button, 1, wx.ALIGN_LEFT)
+        arrow_sizer.Add(self.right_button, 1, wx.ALIGN_RIGHT)
+
+        # Disable continue button if first run not performed
+        self.continue_button.Enable(False)
+        self.cancel_button.Enable(False)
+
+        # Simulations run in a worker thread, which shows its progress at
+        # most once every frame_interval seconds
+        self.simulation_thread = None
+        self.cancel_requested = False
+        # Switch, monitor and connection windows opened, which may still be
+        # open, and the state of every widget disabled during a run
+        self.popups = []
+        self.enabled_before_run = []
+        self.frame_interval = 0.1
+        self.last_frame = 0
+        self.periods_before_run = 0  # cycles shown before the current run
+
+        self.SetSizeHints(600, 600)
+        self.SetMinSize((600, 600))
+        self.SetSizer(main_sizer)
+
+        # Colours
+        self.colours = [(255, 0, 0), (0, 255, 0)]
+
+        # Boolean determining if simulation has compiled
+        self.compiled = False
+
+        # Disable developer mode (displaying info text) by default
+        self.info_text_true = False
+
+    def run_network(self, cycles, on_finished):
+        """Run the network for the specified number of simulation cycles.
+
+        The simulation runs in a worker thread, so the window stays
+        responsive and the run can be cancelled. When it ends without
+        oscillating, on_finished is called in the GUI thread with the number
+        of cycles actually run.
+        """
+        self.cancel_requested = False
+        self.last_frame = time.monotonic()
+        self.periods_before_run = self.canvas.periods
+        self.progress_gauge.SetValue(0)
+        self.set_running(True)
+        self.simulation_thread = threading.Thread(
+            target=self._simulate, args=(cycles, on_finished), daemon=True)
+        self.simulation_thread.start()
+
+    def _simulate(self, cycles, on_finished):
+        """Run the simulation in the worker thread."""
+        success = False
+        error = None
+        try:
+            success = self.network.execute_cycles(
+                cycles, self.monitors,
+                lambda completed: self._on_progress(completed, cycles))
+        except Exception as exception:
+            # Reported in the GUI thread rather than lost with the thread
+            error = exception
+        # Always hand control back to the GUI, even if the run failed
+        wx.CallAfter(self._on_simulation_done, success, on_finished, error)
+
+    def _on_progress(self, completed, cycles):
+        """Post throttled progress updates from the worker thread.
+
+        Return False if the user has asked to cancel the run.
+        """
+        now = time.monotonic()
+        if now - self.last_frame >= self.frame_interval:
+            self.last_frame = now
+            wx.CallAfter(self.show_progress, completed, cycles)
+        return not self.cancel_requested
+
+    def show_progress(self, completed, cycles):
+        """Show the partial traces and progress of a running simulation."""
+        if self.simulation_thread is None:  # the run has already finished
+            return
+        self.progress_gauge.SetValue(int(100 * completed / max(cycles, 1)))
+        self.canvas.periods = self.periods_before_run + completed
+        self.update_traces()
+        self.canvas.request_render()
+
+    def _on_simulation_done(self, success, on_finished, error=None):
+        """Finish a run in the GUI thread.
+
+        error is the exception that stopped the run, if any.
+        """
+        self.simulation_thread = None
+        self.set_running(False)
+        if error is not None:
+            text = _("Error! Simulation failed: {}").format(error)
+            self.canvas.periods = self.periods_before_run
+            self.update_info(text, False, self.colours[0])
+            return
+        if not success:
+            text = _("Error! Network oscillating. Verify connections.")
+            if self.network.oscillating_devices:
+                loop = [self.names.get_name_string(device_id) for device_id
+                        in self.network.oscillating_devices]
+                text += " " + _("Oscillating loop: {}").format(
+                    ", ".join(loop))
+            self.canvas.periods = self.periods_before_run
+            self.update_info(text, False, self.colours[0])
+            return
+        self.progress_gauge.SetValue(100)
+        on_finished(self.network.cycles_run)
+
+    def set_running(self, running):
+        """Enable the widgets allowed while a simulation is or is not running.
+
+        The network must not change while it is simulated, so everything but
+        the view and the cancel button is disabled during a run, including
+        any open switch, monitor or connection window. Afterwards every
+        widget gets back the state it had before the run.
+        """
+        if running:
+            # A destroyed window is false
+            self.popups = [popup for popup in self.popups if popup]
+            widgets = [self.run_button, self.continue_button,
+                       self.switches_button, self.monitors_button,
+                       self.connection_button, self.spin_cycle,
+                       self.spin_limit] + self.popups
+            self.enabled_before_run = [(widget, widget.IsEnabled())
+                                       for widget in widgets]
+            for widget in widgets:
+                widget.Enable(False)
+        else:
+            for widget, enabled in self.enabled_before_run:
+                if widget:  # a window may have been closed during the run
+                    widget.Enable(enabled)
+            self.enabled_before_run = []
+        self.cancel_button.Enable(running)
+
+    def get_period_text(self):
+        """Return the text reporting the period found by the last run."""
+        if self.network.detected_period is None:
+            return ""
+        return " " + _("Network repeats every {} cycles.").format(
+            self.network.detected_period)
+
+    def get_metrics_text(self):
+        """Return the text summarising the activity of the executed cycles."""
+        summary = self.network.metrics.get_summary()
+        if not summary["executed_cycles"]:
+            return ""
+        return " " + _("Settle iterations: {:.1f}, activity: {:.1%}, "
+                       "D-type captures: {}, clock edges: {}.").format(
+            summary["mean_settle_iterations"], summary["activity_factor"],
+            summary["d_type_captures"], summary["clock_edges"])
+
+    def update_traces(self):
+        """Update traces displayed on canvas.
+
+        The canvas is given the monitor signal lists themselves, not copies,
+        so it only processes the cycles recorded since the last update.
+        """
+        traces = {}
+        for device_id, output_id in self.monitors.monitors_dictionary:
+            name = self.monitors.get_signal_name(device_id, output_id)
+            traces[name] = self.monitors.monitors_dictionary[
+                           (device_id, output_id)]
+        self.canvas.set_traces(traces)
+
+    def update_info(self, text, dev=True, col=(0, 0, 0)):
+        """Update information text."""
+        self.dev_text.SetLabel("")
+        if self.info_text_true and dev:
+            self.dev_text.SetForegroundColour((0, 0, 0))
+            self.dev_text.SetLabel(" > " + text)
+        elif not dev:
+            self.dev_text.SetForegroundColour(col)
+            self.dev_text.SetLabel(" " + text)
+
+    def on_menu(self, event):
+        """Handle the event when the user selects a menu item."""
+        event_id = event.GetId()
+        if event_id == wx.ID_EXIT:
+            self.Close(True)
+        if event_id == wx.ID_ABOUT:
+            wx.MessageBox(_("Logic Simulator, Team 17"),
+                          _("About Logsim"), wx.ICON_INFORMATION | wx.OK)
+        if event_id == wx.ID_OPEN:
+            file_name = _("Open vi file")
+            open_file_dialog = wx.FileDialog(self, file_name, "definition_files/", "",
+                                             wildcard="VI files (*.vi)|*.vi",
+                                             style=wx.FD_OPEN
+                                             + wx.FD_FILE_MUST_EXIST)
+            if open_file_dialog.ShowModal() == wx.ID_CANCEL:
+                self.update_info(_("Open file cancelled."))
+                return     # the user changed idea...
+
+            # Open file, restart program
+            path = open_file_dialog.GetPath()
+            print(_("Opening file="), path)
+            sys.stdout.flush()
+            os.execv(sys.executable, ["python3"] + [sys.argv[0]] + [path])
+        if event_id == wx.ID_INFO:
+            if self.info_text_true:
+                self.dev_text.Hide()
+            else:
+                self.dev_text.Show()
+            self.info_text_true = not self.info_text_true
+            self.update_info(_("Developer mode toggled."))
+        if event_id == self.monochrome_ID:
+            self.canvas.colours = [(0.1, 0.1, 0.1), (0.1, 0.1, 0.1)]
+            self.colours = [(25, 25, 25), (25, 25, 25)]
+            self.update_info(_("Changing colour scheme to Monochrome"))
+        if event_id == self.red_ID:
+            self.canvas.colours = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+            self.colours = [(255, 0, 0), (0, 255, 0)]
+            self.update_info(_("Changing colour scheme to Red"))
+        if event_id == self.magenta_ID:
+            self.canvas.colours = [(0.83, 0.07, 0.35), (0.10, 0.52, 1.0)]
+            self.colours = [(212, 17, 89), (26, 133, 255)]
+            self.update_info(_("Changing colour scheme to Magenta"))
+        if event_id == self.purple_ID:
+            self.canvas.colours = [(0.29, 0.0, 0.57), (0.10, 1.0, 0.10)]
+            self.colours = [(75, 0, 146), (26, 255, 26)]
+            self.update_info(_("Changing colour scheme to Purple"))
+        self.canvas.render()
+
+    def on_spin_cycle(self, event):
+        """Handle the event when the user updates spin control."""
+        spin_value = self.spin_cycle.GetValue()
+        self.cycles = spin_value
+        text = "".join([_("New number of cycles per execution: "),
+                       str(spin_value)])
+        self.canvas.render()
+        self.update_info(text)
+
+    def on_spin_limit(self, event):
+        """Handle the event when the user updates the settle limit."""
+        spin_value = self.spin_limit.GetValue()
+        if spin_value == 0:
+            self.network.iteration_limit = None
+        else:
+            self.network.iteration_limit = spin_value
+        text = "".join([_("New settle iteration limit: "),
+                       str(self.network.get_iteration_limit())])
+        self.canvas.render()
+        self.update_info(text)
+
+    def on_run_button(self, event):
+        """Handle the event when the user clicks the run button."""
+        if not self.compiled:
+            # Disable run button if errors exist
+            if self.error_handler.error_count > 0:
+                self.run_button.Enable(False)
+                error_window = ErrorFrame(self.GetTopLevelParent(),
+                                          wx.DEFAULT_FRAME_STYLE,
+                                          self.error_handler,
+                                          self.run_button)
+                error_window.Show(True)
+                text = _("Errors in definition file. Code cannot be compiled."
+                         "Fix errors, then re-open file.")
+                self.update_info(text, False, self.colours[0])
+                self.run_button.SetLabel(_("Error"))
+            else:
+                text = _("Definition file compiled.")
+                self.run_button.SetLabel(_("Run"))
+                self.compiled = True
+                self.canvas.render()
+                self.update_info(text)
+        else:
+            self.monitors.reset_monitors()
+            self.devices.cold_startup(self.seed)
+            self.network.reset_clocks()
+            self.canvas.periods = 0
+            self.run_network(self.spin_cycle.GetValue(),
+                             self.on_run_finished)
+
+    def on_run_finished(self, cycles):
+        """Show the results of a run from scratch."""
+        self.canvas.periods = cycles
+        self.update_traces()
+        if self.cancel_requested:
+            text = _("Simulation cancelled after {} cycles").format(cycles)
+        else:
+            text = _("Simulation running for {} cycles").format(cycles)
+        self.update_info(text + self.get_period_text() +
+                         self.get_metrics_text())
+        self.canvas.render()
+        self.continue_button.Enable(True)
+        self.on_home_button(None, False)  # Send to home
+
+    def on_continue_button(self, event):
+        """Handle the event when the user clicks the continue button."""
+        self.run_network(self.spin_cycle.GetValue(),
+                         self.on_continue_finished)
+
+    def on_continue_finished(self, cycles):
+        """Show the results of a continued run."""
+        canvas = self.canvas
+        canvas.periods = self.periods_before_run + cycles
+
+        self.update_traces()
+        if self.cancel_requested:
+            translation = _("Continue cancelled after {} cycles. "
+                            "Total: {} cycles.")
+        else:
+            translation = _("Continuing for {} cycles. Total: {} cycles.")
+        text = translation.format(cycles, canvas.periods)
+        text += self.get_period_text() + self.get_metrics_text()
+        canvas.render()
+        self.update_info(text)
+
+    def on_cancel_button(self, event):
+        """Handle the event when the user clicks the cancel button."""
+        self.cancel_requested = True
+        self.update_info(_("Cancelling simulation."))
+
+    def on_close(self, event):
+        """Stop any running simulation before the window closes."""
+        if self.simulation_thread is not None:
+            self.cancel_requested = True
+            self.simulation_thread.join()
+        event.Skip()
+
+    def on_switches_button(self, event):
+        """Handle the event when the user clicks the switches button."""
+        pop = SwitchFrame(self.GetTopLevelParent(), wx.DEFAULT_FRAME_STYLE,
+                          self.switches_button, self.devices, self.canvas,
+                          self.monitors)
+
+        width, height = self.GetSize()
+        pos = self.ClientToScreen(int(width/4), int(height / 4))
+        pop.SetPosition(pos)
+        pop.Show(True)
+        self.popups.append(pop)
+        self.switches_button.Enable(False)
+        text = _("Switches button pressed.")
+        self.canvas.render()
+        self.update_info(text)
+
+    def on_monitors_button(self, event):
+        """Handle the event when the user clicks the monitors button."""
+        pop = MonitorFrame(self.GetTopLevelParent(), wx.DEFAULT_FRAME_STYLE,
+                           self.monitors_button, self.canvas, self.monitors)
+
+        pop.colours = self.colours
+        width, height = self.GetSize()
+        pos = self.ClientToScreen(int(width/4), int(height / 4))
+        pop.SetPosition(pos)
+        pop.Show(True)
+        self.popups.append(pop)
+        self.monitors_button.Enable(False)
+        text = _("Monitors button pressed.")
+        self.canvas.render()
+        self.update_info(text)
+
+    def on_connection_button(self, event):
+        """Handle the event when the user clicks the connections button."""
+        pop = ConnectionFrame(self.GetTopLevelParent(),
+                              wx.DEFAULT_FRAME_STYLE,
+                              self.connection_button,
+                              self.canvas, self.network, self.monitors)
+        pop.colours = self.colours
+        width, height = self.GetSize()
+        pos = self.ClientToScreen(int(width/4), int(height / 4))
+        pop.SetPosition(pos)
+        pop.Show(True)
+        self.popups.append(pop)
+        self.connection_button.Enable(False)
+        text = _("Connection button pressed.")
+        self.canvas.render()
+        self.update_info(text)
+
+    def on_right_button(self, event):
+        """Handle event where right button is pressed."""
+        canvas = self.canvas
+        size = canvas.GetClientSize()
+        if (canvas.pan_x - size.width
+                > - canvas.max_x * canvas.zoom):
+            # Do not move pan more than necessary
+            if (canvas.pan_x - 2 * size.width
+                    > - canvas.max_x * canvas.zoom):
+                canvas.pan_x -= size.width
+            else:
+                canvas.pan_x = (- canvas.max_x * canvas.zoom
+                                + size.width)
+            self.update_info(_("Scrolling right: {}.").format(
+                          canvas.pan_x))
+            canvas.request_render()
+
+    def on_left_button(self, event):
+        """Handle event where left button is pressed."""
+        canvas = self.canvas
+        size = canvas.GetClientSize()
+        if canvas.pan_x < 0:
+            if canvas.pan_x > -size.width:
+                canvas.pan_x = 0
+            else:
+                canvas.pan_x += size.width
+            self.update_info(_("Scrolling left: {}.").format(
+                             canvas.pan_x))
+            canvas.request_render()
+
+    def on_home_button(self, event, show_text=True):
+        """Handle event where home button is pressed."""
+        canvas = self.canvas
+        size = canvas.GetClientSize()
+        canvas.pan_x = 0
+        canvas.pan_y = -(canvas.zoom - 1.0) * size.height
+        if show_text:
+            self.update_info(_("Resetting view"))
+        canvas.request_render()
+
+
+class MyApp(wx.App, InspectionMixin):
+    """Configure main app and its language."""
+
+    def OnInit(self):
+        """Initialise app, set default language."""
+        self.Init()
+
+        lang = wx.Locale.GetSystemLanguage()
+        # If lang not supported, default to english
+        if lang in sup_lang:
+            wx_lang = lang
+        else:
+            wx_lang = wx.LANGUAGE_ENGLISH
+
+        # Create locale
+        self.locale = wx.Locale(wx_lang)
+        if self.locale.IsOk():
+            base_path = os.path.abspath(os.path.dirname(sys.argv[0]))
+            sys.path.append(base_path)
+            self.locale.AddCatalogLookupPathPrefix("locale")
+            self.locale.AddCatalog("logsim")
+        else:
+            self.locale = None
+
+        return True
@@ -1,87 +1,188 @@
-#!/usr/bin/env python3
-"""Parse command line options and arguments for the Logic Simulator.
-
-This script parses options and arguments specified on the command line, and
-runs either the command line user interface or the graphical user interface.
-
-Usage
------
-Show help: logsim.py -h
-Command line user interface: logsim.py -c <file path>
-Graphical user interface: logsim.py <file path>
-"""
-import getopt
-import sys
-from error_handling import ErrorHandler
-
-import wx
-
-from names import Names
-from devices import Devices
-from network import Network
-from monitors import Monitors
-from scanner import Scanner
-from parse import Parser
-from userint import UserInterface
-from gui import Gui, MyApp
-
-
-def main(arg_list):
-    """Parse the command line options and arguments specified in arg_list.
-
-    Run either the command line user interface, the graphical user interface,
-    or display the usage message.
-    """
-    usage_message = ("Usage:\n"
-                     "Show help: logsim.py -h\n"
-                     "Command line user interface: logsim.py -c <file path>\n"
-                     "Graphical user interface: logsim.py <file path>")
-    try:
-        options, arguments = getopt.getopt(arg_list, "hc:")
-    except getopt.GetoptError:
-        print("Error: invalid command line arguments\n")
-        print(usage_message)
-        sys.exit()
-
-    # Initialise instances of the four inner simulator classes
-    names = Names()
-    error_handler = ErrorHandler(names)
-    devices = Devices(names, error_handler)
-    network = Network(names, devices, error_handler)
-    monitors = Monitors(names, devices, network, error_handler)
-
-    for option, path in options:
-        if option == "-h":  # print the usage message
-            print(usage_message)
-            sys.exit()
-        elif option == "-c":  # use the command line user interface
-            scanner = Scanner(path, names)
-            parser = Parser(names, devices, network,
-                            monitors, scanner, error_handler)
-            if parser.parse_network():
-                # Initialise an instance of the userint.UserInterface() class
-                userint = UserInterface(names, devices, network, monitors)
-                userint.command_interface()
-
-    if not options:  # no option given, use the graphical user interface
-
-        if len(arguments) != 1:  # wrong number of arguments
-            print("Error: one file path required\n")
-            print(usage_message)
-            sys.exit()
-
-        [path] = arguments
-        scanner = Scanner(path, names)
-        parser = Parser(names, devices, network,
-                        monitors, scanner, error_handler)
-        if parser.parse_network():
-            # Initialise an instance of the gui.Gui() class
-            app = MyApp(redirect=False)
-            gui = Gui("Logic Simulator", names, devices, network,
-                      monitors, error_handler)
-            gui.Show(True)
-            app.MainLoop()
-
-
-if __name__ == "__main__":
-    main(sys.argv[1:])
+#!/usr/bin/env python3
+"""Parse command line options and arguments for the Logic Simulator.
+
+This script parses options and arguments specified on the command line, and
+runs either the command line user interface or the graphical user interface.
+
+Usage
+-----
+Show help: logsim.py -h
+Command line user interface: logsim.py -c <file path>
+Graphical user interface: logsim.py <file path>
+Reproducible start-up state: logsim.py -s <seed> [-c] <file path>
+Fixed settle iteration limit: logsim.py -i <limit> [-c] <file path>
+Stop parsing after a number of errors: logsim.py -e <limit> [-c] <file path>
+Memory-mapped file scanning: logsim.py -m [-c] <file path>
+Timing report: logsim.py --profile [-c] <file path>
+Peak memory report: logsim.py --profile-memory [-c] <file path>
+cProfile statistics: logsim.py --profile-dump <stats file> [-c] <file path>
+"""
+import cProfile
+import getopt
+import pstats
+import sys
+from error_handling import ErrorHandler
+
+import wx
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+from userint import UserInterface
+from gui import Gui, MyApp
+from profiler import Profiler
+
+
+def main(arg_list):
+    """Parse the command line options and arguments specified in arg_list.
+
+    Run either the command line user interface, the graphical user interface,
+    or display the usage message.
+    """
+    usage_message = ("Usage:\n"
+                     "Show help: logsim.py -h\n"
+                     "Command line user interface: logsim.py -c <file path>\n"
+                     "Graphical user interface: logsim.py <file path>\n"
+                     "Reproducible start-up state: "
+                     "logsim.py -s <seed> [-c] <file path>\n"
+                     "Fixed settle iteration limit: "
+                     "logsim.py -i <limit> [-c] <file path>\n"
+                     "Stop parsing after a number of errors: "
+                     "logsim.py -e <limit> [-c] <file path>\n"
+                     "Memory-mapped file scanning: "
+                     "logsim.py -m [-c] <file path>\n"
+                     "Timing report: logsim.py --profile [-c] <file path>\n"
+                     "Peak memory report: "
+                     "logsim.py --profile-memory [-c] <file path>\n"
+                     "cProfile statistics: "
+                     "logsim.py --profile-dump <stats file> [-c] <file path>")
+    try:
+        options, arguments = getopt.getopt(arg_list, "hc:s:i:e:m",
+                                           ["profile", "profile-memory",
+                                            "profile-dump="])
+    except getopt.GetoptError:
+        print("Error: invalid command line arguments\n")
+        print(usage_message)
+        sys.exit()
+
+    # The seed, iteration limit, error limit and scanning mode must be known
+    # before any network is built and run
+    seed = None
+    iteration_limit = None
+    max_errors = None
+    mapped = False
+    profile = False
+    trace_memory = False
+    profile_path = None
+    for option, value in options:
+        if option == "-s":
+            try:
+                seed = int(value)
+            except ValueError:
+                print("Error: the seed must be an integer\n")
+                print(usage_message)
+                sys.exit()
+        elif option == "-i":
+            try:
+                iteration_limit = int(value)
+            except ValueError:
+                iteration_limit = 0
+            if iteration_limit < 1:
+                print("Error: the iteration limit must be a positive "
+                      "integer\n")
+                print(usage_message)
+                sys.exit()
+        elif option == "-e":
+            try:
+                max_errors = int(value)
+            except ValueError:
+                max_errors = 0
+            if max_errors < 1:
+                print("Error: the error limit must be a positive integer\n")
+                print(usage_message)
+                sys.exit()
+        elif option == "-m":
+            mapped = True
+        elif option == "--profile":
+            profile = True
+        elif option == "--profile-memory":
+            profile = True
+            trace_memory = True
+        elif option == "--profile-dump":
+            profile_path = value
+    options = [(option, value) for option, value in options
+               if option not in ["-s", "-i", "-e", "-m", "--profile",
+                                 "--profile-memory", "--profile-dump"]]
+
+    if profile_path is not None:
+        python_profile = cProfile.Profile()
+        python_profile.enable()
+
+    # Initialise instances of the four inner simulator classes
+    names = Names()
+    error_handler = ErrorHandler(names, max_errors)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+
+    # Profiling replaces methods with timed ones, so is free when not asked for
+    profiler = None
+    if profile:
+        profiler = Profiler(names, devices, trace_memory)
+        profiler.instrument_simulator(devices, network, monitors)
+
+    for option, path in options:
+        if option == "-h":  # print the usage message
+            print(usage_message)
+            sys.exit()
+        elif option == "-c":  # use the command line user interface
+            scanner = Scanner(path, names, mapped)
+            parser = Parser(names, devices, network,
+                            monitors, scanner, error_handler)
+            if profiler is not None:
+                profiler.instrument_parser(scanner, parser)
+            if parser.parse_network():
+                network.elaborate()
+                devices.cold_startup(seed)
+                # Initialise an instance of the userint.UserInterface() class
+                userint = UserInterface(names, devices, network, monitors,
+                                        seed, iteration_limit)
+                userint.command_interface()
+
+    if not options:  # no option given, use the graphical user interface
+
+        if len(arguments) != 1:  # wrong number of arguments
+            print("Error: one file path required\n")
+            print(usage_message)
+            sys.exit()
+
+        [path] = arguments
+        scanner = Scanner(path, names, mapped)
+        parser = Parser(names, devices, network,
+                        monitors, scanner, error_handler)
+        if profiler is not None:
+            profiler.instrument_parser(scanner, parser)
+        if parser.parse_network():
+            network.elaborate()
+            devices.cold_startup(seed)
+            # Initialise an instance of the gui.Gui() class
+            app = MyApp(redirect=False)
+            gui = Gui("Logic Simulator", names, devices, network,
+                      monitors, error_handler, seed, iteration_limit)
+            gui.Show(True)
+            app.MainLoop()
+
+    if profiler is not None:
+        profiler.print_report()
+    if profile_path is not None:
+        python_profile.disable()
+        python_profile.dump_stats(profile_path)
+        print("cProfile statistics written to", profile_path)
+        pstats.Stats(profile_path).sort_stats("cumulative").print_stats(20)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,95 @@
+"""Record how much work the simulation does.
+
+Used in the Logic Simulator project to expose statistics about every
+executed simulation cycle.
+
+Classes
+-------
+Metrics - records per-cycle simulation statistics.
+"""
+from collections import deque
+
+
+class Metrics:
+
+    """Record per-cycle simulation statistics.
+
+    This class keeps, over every cycle that is actually executed, running
+    totals of the number of iterations the network took to settle, the
+    number of device executions, the number of outputs that started to rise
+    or fall, the number of D-types that saw a rising clock and the number of
+    clock edges, along with the largest number of settle iterations. The
+    statistics of the most recent cycles are also kept, up to history of
+    them, so long runs use a fixed amount of memory. Cycles skipped by
+    Network.execute_cycles are not recorded, as no work is done for them.
+
+    Parameters
+    ----------
+    history: number of recent cycles whose statistics are kept.
+
+    Public methods
+    --------------
+    reset(self): Clears all recorded statistics.
+
+    record_cycle(self, cycle, iterations, devices_evaluated=0, transitions=0,
+                 d_type_captures=0, clock_edges=0): Records the statistics
+                                                    of an executed cycle.
+
+    get_summary(self): Returns a dictionary summarising the statistics.
+    """
+
+    def __init__(self, history=1000):
+        """Initialise the statistics totals."""
+        self.history = history
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded statistics."""
+        self.executed_cycles = 0
+        self.settle_iterations = 0
+        self.max_settle_iterations = 0
+        self.devices_evaluated = 0
+        self.transitions = 0
+        self.d_type_captures = 0
+        self.clock_edges = 0
+
+        # (cycle, iterations, devices evaluated, transitions, D-type
+        # captures, clock edges) of the most recent executed cycles
+        self.recent_cycles = deque(maxlen=self.history)
+
+    def record_cycle(self, cycle, iterations, devices_evaluated=0,
+                     transitions=0, d_type_captures=0, clock_edges=0):
+        """Record the statistics of an executed cycle."""
+        self.executed_cycles += 1
+        self.settle_iterations += iterations
+        if iterations > self.max_settle_iterations:
+            self.max_settle_iterations = iterations
+        self.devices_evaluated += devices_evaluated
+        self.transitions += transitions
+        self.d_type_captures += d_type_captures
+        self.clock_edges += clock_edges
+        self.recent_cycles.append((cycle, iterations, devices_evaluated,
+                                   transitions, d_type_captures,
+                                   clock_edges))
+
+    def get_summary(self):
+        """Return a dictionary summarising the recorded statistics.
+
+        The activity factor is the fraction of device executions that made
+        an output start to rise or fall.
+        """
+        executed = self.executed_cycles
+        total = self.settle_iterations
+        evaluated = self.devices_evaluated
+        transitions = self.transitions
+        return {
+            "executed_cycles": executed,
+            "settle_iterations": total,
+            "max_settle_iterations": self.max_settle_iterations,
+            "mean_settle_iterations": total / executed if executed else 0,
+            "devices_evaluated": evaluated,
+            "transitions": transitions,
+            "d_type_captures": self.d_type_captures,
+            "clock_edges": self.clock_edges,
+            "activity_factor": transitions / evaluated if evaluated else 0,
+        }
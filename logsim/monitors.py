@@ -1,187 +1,513 @@
-"""Record and display output signals.
-
-Used in the Logic Simulator project to record and display specified output
-signals.
-
-Classes
--------
-Monitors - records and displays specified output signals.
-
-"""
-import collections
-
-
-class Monitors:
-
-    """Record and display output signals.
-
-    This class contains functions for recording and displaying the signal state
-    of outputs specified by their device and port IDs.
-
-    Parameters
-    ----------
-    names: instance of the names.Names() class.
-    devices: instance of the devices.Devices() class.
-    network: instance of the network.Network() class.
-
-    Public methods
-    --------------
-    make_monitor(self, device_id, output_id): Sets a specified monitor on the
-                                              specified output.
-
-    remove_monitor(self, device_id, output_id): Removes a monitor from the
-                                                specified output.
-
-    get_monitor_signal(self, device_id, output_id): Returns the signal level of
-                                                    the specified monitor.
-
-    record_signals(self): Records the current signal level of all monitors.
-
-    get_signal_names(self): Returns two lists of signal names: monitored and
-                            not monitored.
-
-    reset_monitors(self): Clears the memory of all monitors.
-
-    get_margin(self): Returns the length of the longest monitor's name.
-
-    display_signals(self): Displays signal trace(s) in the text console.
-    """
-
-    def __init__(self, names, devices, network, errorHandler):
-        """Initialise the monitors dictionary and monitor errors."""
-        self.names = names
-        self.network = network
-        self.devices = devices
-        self.errorHandler = errorHandler
-
-        self.monitors_dictionary = collections.OrderedDict()
-
-        [self.NO_ERROR, self.NOT_OUTPUT,
-         self.MONITOR_PRESENT] = self.names.unique_error_codes(3)
-
-        error_message = {
-            self.NO_ERROR: 'NON-USER ERROR',
-            self.NOT_OUTPUT:
-                'The specified device is not an output and '
-                'cannot be monitored',
-            self.MONITOR_PRESENT:
-                'The chosen (device_id, output_id) exists '
-                'in the dictionary',
-        }
-        self.errorHandler.semantic.define_error_messages(error_message)
-
-    def make_monitor(self, device_id, output_id, cycles_completed=0):
-        """Add the specified signal to the monitors dictionary.
-
-        Return NO_ERROR if successful, or the corresponding error if not.
-        """
-        monitor_device = self.devices.get_device(device_id)
-        if monitor_device is None:
-            return self.network.DEVICE_ABSENT
-        elif output_id not in monitor_device.outputs:
-            return self.NOT_OUTPUT
-        elif (device_id, output_id) in self.monitors_dictionary:
-            return self.MONITOR_PRESENT
-        else:
-            # If n simulation cycles have been completed before making this
-            # monitor, then initialise the signal trace with an n-length list
-            # of BLANK signals. Otherwise, initialise the trace with an empty
-            # list.
-            self.monitors_dictionary[(device_id, output_id)] = [
-                self.devices.BLANK] * cycles_completed
-            return self.NO_ERROR
-
-    def remove_monitor(self, device_id, output_id):
-        """Remove the specified signal from the monitors dictionary.
-
-        Return True if successful.
-        """
-        if (device_id, output_id) not in self.monitors_dictionary:
-            return False
-        else:
-            del self.monitors_dictionary[(device_id, output_id)]
-            return True
-
-    def get_monitor_signal(self, device_id, output_id):
-        """Return the signal level of the specified monitor.
-
-        If the monitor does not exist, return None.
-        """
-        if (device_id, output_id) in self.monitors_dictionary:
-            return self.network.get_output_signal(device_id, output_id)
-        else:
-            return None
-
-    def record_signals(self):
-        """Record the current signal level for every monitor.
-
-        This function is called at every simulation cycle.
-        """
-        for device_id, output_id in self.monitors_dictionary:
-            signal_level = self.get_monitor_signal(device_id, output_id)
-            self.monitors_dictionary[(device_id,
-                                      output_id)].append(signal_level)
-
-    def get_signal_names(self):
-        """Return two signal name lists: monitored and not monitored."""
-        non_monitored_signal_list = []
-        monitored_signal_list = []
-        for device_id, output_id in self.monitors_dictionary:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            monitored_signal_list.append(monitor_name)
-
-        for device_id in self.devices.find_devices():
-            device = self.devices.get_device(device_id)
-            for output_id in device.outputs:
-                if (device_id, output_id) not in self.monitors_dictionary:
-                    signal_name = self.devices.get_signal_name(device_id,
-                                                               output_id)
-                    non_monitored_signal_list.append(signal_name)
-
-        return [monitored_signal_list, non_monitored_signal_list]
-
-    def reset_monitors(self):
-        """Clear the memory of all the monitors.
-
-        The list of stored signal levels for each monitor is deleted.
-        """
-        for device_id, output_id in self.monitors_dictionary:
-            self.monitors_dictionary[(device_id, output_id)] = []
-
-    def get_margin(self):
-        """Return the length of the longest monitor's name.
-
-        Return None if no signals are being monitored. This is useful for
-        finding out how much space to leave after each monitor's name before
-        starting to draw the signal trace.
-        """
-        length_list = []  # for storing name lengths
-        for device_id, output_id in self.monitors_dictionary:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            name_length = len(monitor_name)
-            length_list.append(name_length)
-        if length_list:  # if the list is not empty
-            return max(length_list)
-        else:
-            return None
-
-    def display_signals(self):
-        """Display the signal trace(s) in the text console."""
-        margin = self.get_margin()
-        for device_id, output_id in self.monitors_dictionary:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            name_length = len(monitor_name)
-            signal_list = self.monitors_dictionary[(device_id, output_id)]
-            print(monitor_name + (margin - name_length) * " ", end=": ")
-            for signal in signal_list:
-                if signal == self.devices.HIGH:
-                    print("-", end="")
-                if signal == self.devices.LOW:
-                    print("_", end="")
-                if signal == self.devices.RISING:
-                    print("/", end="")
-                if signal == self.devices.FALLING:
-                    print("\\", end="")
-                if signal == self.devices.BLANK:
-                    print(" ", end="")
-            print("\n", end="")
+"""Record and display output signals.
+
+Used in the Logic Simulator project to record and display specified output
+signals.
+
+Classes
+-------
+Monitors - records and displays specified output signals.
+
+"""
+import bisect
+import collections
+import fnmatch
+import re
+
+import numpy
+
+
+class Monitors:
+
+    """Record and display output signals.
+
+    This class contains functions for recording and displaying the signal state
+    of outputs specified by their device and port IDs.
+
+    Parameters
+    ----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    network: instance of the network.Network() class.
+
+    Public methods
+    --------------
+    make_monitor(self, device_id, output_id): Sets a specified monitor on the
+                                              specified output.
+
+    make_monitors(self, signals, cycles_completed=0): Sets monitors on all the
+                                                      specified outputs.
+
+    remove_monitor(self, device_id, output_id): Removes a monitor from the
+                                                specified output.
+
+    remove_monitors(self, signals): Removes the monitors from all the
+                                    specified outputs.
+
+    get_monitor_signal(self, device_id, output_id): Returns the signal level of
+                                                    the specified monitor.
+
+    record_signals(self, cycles=1): Records the current signal level of all
+                                    monitors for a number of cycles.
+
+    repeat_signals(self, period, repeats): Repeats the last period of every
+                                           signal trace.
+
+    index_signals(self): Adds the outputs and inputs of new devices to the
+                         signal index.
+
+    get_signal_name(self, device_id, output_id): Returns the name of the
+                                                 specified output.
+
+    get_signal_ids(self, signal_name): Returns the device and output IDs of
+                                       the named output.
+
+    get_signal_names(self): Returns two lists of signal names: monitored and
+                            not monitored.
+
+    get_input_ids(self, input_name): Returns the device and input IDs of the
+                                     named input.
+
+    get_input_names(self): Returns the names of every input.
+
+    find_signals(self, pattern): Returns the device and output IDs of every
+                                 output whose name matches a glob or range
+                                 pattern.
+
+    find_signal_names(self, pattern): Returns the name of every output that
+                                      matches a glob or range pattern.
+
+    find_input_names(self, pattern): Returns the name of every input that
+                                     matches a glob or range pattern.
+
+    get_completions(self, prefix): Returns the output and input names that
+                                   start with prefix.
+
+    reset_monitors(self): Clears the memory of all monitors.
+
+    get_margin(self): Returns the length of the longest monitor's name.
+
+    display_signals(self): Displays signal trace(s) in the text console.
+
+    Non-public methods
+    ------------------
+    _get_signal_source(self, device_id, output_id): Returns where the signal
+                                                    at an output is read.
+
+    _get_recorders(self): Returns where record_signals reads every monitored
+                          signal and the trace it is recorded in.
+
+    _find_names(self, pattern, ids, sorted_names): Returns the names in ids
+                                                   that match a pattern.
+    """
+
+    def __init__(self, names, devices, network, errorHandler):
+        """Initialise the monitors dictionary and monitor errors."""
+        self.names = names
+        self.network = network
+        self.devices = devices
+        self.errorHandler = errorHandler
+
+        self.monitors_dictionary = collections.OrderedDict()
+
+        # Where record_signals reads the monitored signals, from
+        # _get_recorders, or None if the monitors have changed since
+        self.recorders = None
+
+        # Signal index, filled in by index_signals
+        self.signal_names = {}  # (device_id, output_id): signal name
+        self.signal_ids = {}  # signal name: (device_id, output_id)
+        self.unmonitored = collections.OrderedDict()  # same as signal_names
+        self.indexed_devices = 0  # devices already in the index
+        self.sorted_names = None  # signal names in order, for find_signals
+        self.input_names = {}  # (device_id, input_id): input name
+        self.input_ids = {}  # input name: (device_id, input_id)
+        self.sorted_inputs = None  # input names in order
+
+        [self.NO_ERROR, self.NOT_OUTPUT,
+         self.MONITOR_PRESENT,
+         self.NO_MATCHING_OUTPUT] = self.names.unique_error_codes(4)
+
+        error_message = {
+            self.NO_ERROR: 'NON-USER ERROR',
+            self.NOT_OUTPUT:
+                'The specified device is not an output and '
+                'cannot be monitored',
+            self.MONITOR_PRESENT:
+                'The chosen (device_id, output_id) exists '
+                'in the dictionary',
+            self.NO_MATCHING_OUTPUT:
+                'No output matches the monitor pattern',
+        }
+        self.errorHandler.semantic.define_error_messages(error_message)
+
+    def make_monitor(self, device_id, output_id, cycles_completed=0):
+        """Add the specified signal to the monitors dictionary.
+
+        Return NO_ERROR if successful, or the corresponding error if not.
+        """
+        monitor_device = self.devices.get_device(device_id)
+        if monitor_device is None:
+            return self.network.DEVICE_ABSENT
+        elif output_id not in monitor_device.outputs:
+            return self.NOT_OUTPUT
+        elif (device_id, output_id) in self.monitors_dictionary:
+            return self.MONITOR_PRESENT
+        else:
+            # If n simulation cycles have been completed before making this
+            # monitor, then initialise the signal trace with an n-length list
+            # of BLANK signals. Otherwise, initialise the trace with an empty
+            # list.
+            self.monitors_dictionary[(device_id, output_id)] = [
+                self.devices.BLANK] * cycles_completed
+            self.unmonitored.pop((device_id, output_id), None)
+            self.recorders = None
+            return self.NO_ERROR
+
+    def make_monitors(self, signals, cycles_completed=0):
+        """Add every [device_id, output_id] in signals to the monitors.
+
+        Return NO_ERROR if all the monitors were made. Otherwise return the
+        error for the first signal that could not be monitored; the signals
+        after it are left unmonitored.
+
+        The signal index is not needed, so it is not built: monitoring the
+        outputs named in a definition file does not name every output.
+        """
+        get_device = self.devices.get_device
+        for device_id, output_id in signals:
+            signal = (device_id, output_id)
+            device = get_device(device_id)
+            if device is None or output_id not in device.outputs:
+                # Let make_monitor find out why
+                return self.make_monitor(device_id, output_id,
+                                         cycles_completed)
+            elif signal in self.monitors_dictionary:
+                return self.MONITOR_PRESENT
+            self.monitors_dictionary[signal] = [
+                self.devices.BLANK] * cycles_completed
+            # Outputs not indexed yet are left out of unmonitored when they
+            # are
+            self.unmonitored.pop(signal, None)
+            self.recorders = None
+        return self.NO_ERROR
+
+    def remove_monitor(self, device_id, output_id):
+        """Remove the specified signal from the monitors dictionary.
+
+        Return True if successful.
+        """
+        if (device_id, output_id) not in self.monitors_dictionary:
+            return False
+        else:
+            del self.monitors_dictionary[(device_id, output_id)]
+            self.recorders = None
+            # Outputs not indexed yet join unmonitored when they are
+            if (device_id, output_id) in self.signal_names:
+                self.unmonitored[(device_id, output_id)] = self.signal_names[
+                    (device_id, output_id)]
+            return True
+
+    def remove_monitors(self, signals):
+        """Remove every [device_id, output_id] in signals from the monitors.
+
+        Return True if all the monitors were removed. Otherwise return False
+        at the first signal that is not monitored; the signals after it are
+        left monitored.
+        """
+        for device_id, output_id in signals:
+            signal = (device_id, output_id)
+            if signal not in self.monitors_dictionary:
+                return False
+            del self.monitors_dictionary[signal]
+            self.recorders = None
+            # Outputs not indexed yet join unmonitored when they are
+            if signal in self.signal_names:
+                self.unmonitored[signal] = self.signal_names[signal]
+        return True
+
+    def get_monitor_signal(self, device_id, output_id):
+        """Return the signal level of the specified monitor.
+
+        If the monitor does not exist, return None.
+        """
+        if (device_id, output_id) in self.monitors_dictionary:
+            return self.network.get_output_signal(device_id, output_id)
+        else:
+            return None
+
+    def record_signals(self, cycles=1):
+        """Record the current signal level for every monitor.
+
+        This function is called at every simulation cycle. If the signals are
+        known to stay the same for several cycles, they are recorded for all
+        of them at once.
+        """
+        if self.recorders is None:
+            self.recorders = self._get_recorders()
+        device_signals, bus_signals = self.recorders
+        for outputs, output_id, signal_list in device_signals:
+            signal_level = outputs[output_id]
+            if cycles == 1:
+                signal_list.append(signal_level)
+            else:
+                signal_list.extend([signal_level] * cycles)
+        for bus, row, indices, signal_lists in bus_signals:
+            # Only the monitored signals of the bus row are read
+            levels = bus.outputs[row, indices].tolist()
+            for signal_list, signal_level in zip(signal_lists, levels):
+                if cycles == 1:
+                    signal_list.append(signal_level)
+                else:
+                    signal_list.extend([signal_level] * cycles)
+
+    def _get_recorders(self):
+        """Return where record_signals reads and records every monitor.
+
+        This is a list of (outputs, output_id, trace) for the monitors of
+        devices, whose outputs dictionary is read, and a list of (bus, row,
+        indices, traces) for each bus output row with monitors, where
+        indices is an array of the positions of the monitored devices in
+        the bus and traces their traces in the same order.
+        """
+        device_signals = []
+        bus_rows = {}  # (bus, row): [positions in the bus, traces]
+        for signal, signal_list in self.monitors_dictionary.items():
+            bus, row, index = self._get_signal_source(*signal)
+            if bus is None:
+                # row is the outputs dictionary of the device
+                device_signals.append((row, index, signal_list))
+            else:
+                indices, signal_lists = bus_rows.setdefault((bus, row),
+                                                            ([], []))
+                indices.append(index)
+                signal_lists.append(signal_list)
+        bus_signals = [(bus, row, numpy.array(indices, dtype=numpy.intp),
+                        signal_lists)
+                       for (bus, row), (indices, signal_lists)
+                       in bus_rows.items()]
+        return device_signals, bus_signals
+
+    def _get_signal_source(self, device_id, output_id):
+        """Return where record_signals reads the signal at an output.
+
+        This is (bus, row, index) for a device of a bus, so the signal is
+        read from the bus arrays, or (None, outputs, output_id) for any
+        other device, whose outputs dictionary is read.
+        """
+        device = self.devices.get_device(device_id)
+        bus = getattr(device, "bus", None)
+        if bus is None:
+            return (None, device.outputs, output_id)
+        return (bus, bus.output_rows[output_id], device.index)
+
+    def repeat_signals(self, period, repeats):
+        """Append the last period entries of every trace repeats times.
+
+        This is used when the network is known to repeat the same states
+        with the given period.
+        """
+        for device_id, output_id in self.monitors_dictionary:
+            signal_list = self.monitors_dictionary[(device_id, output_id)]
+            signal_list.extend(signal_list[-period:] * repeats)
+
+    def index_signals(self):
+        """Add the ports of devices made since the last call to the index.
+
+        Devices are only ever appended to the devices list, so only the new
+        ones need naming. The index is built when it is first used, and this
+        is called again whenever it is used in case more devices have been
+        made.
+        """
+        devices_list = self.devices.devices_list
+        if self.indexed_devices == len(devices_list):
+            return
+        for device in devices_list[self.indexed_devices:]:
+            device_name = self.names.get_name_string(device.device_id)
+            for output_id in device.outputs:
+                if output_id is None:
+                    signal_name = device_name
+                else:
+                    signal_name = ".".join(
+                        [device_name, self.names.get_name_string(output_id)])
+                signal = (device.device_id, output_id)
+                self.signal_names[signal] = signal_name
+                self.signal_ids[signal_name] = signal
+                if signal not in self.monitors_dictionary:
+                    self.unmonitored[signal] = signal_name
+            for input_id in device.inputs:
+                input_name = ".".join(
+                    [device_name, self.names.get_name_string(input_id)])
+                self.input_names[(device.device_id, input_id)] = input_name
+                self.input_ids[input_name] = (device.device_id, input_id)
+        self.indexed_devices = len(devices_list)
+        self.sorted_names = None
+        self.sorted_inputs = None
+
+    def get_signal_name(self, device_id, output_id):
+        """Return the name of the specified output, or None if absent."""
+        self.index_signals()
+        return self.signal_names.get((device_id, output_id))
+
+    def get_signal_ids(self, signal_name):
+        """Return [device_id, output_id] of the named output.
+
+        Return [None, None] if there is no output with that name.
+        """
+        self.index_signals()
+        if signal_name not in self.signal_ids:
+            return [None, None]
+        return list(self.signal_ids[signal_name])
+
+    def get_input_ids(self, input_name):
+        """Return [device_id, input_id] of the named input.
+
+        Return [None, None] if there is no input with that name.
+        """
+        self.index_signals()
+        if input_name not in self.input_ids:
+            return [None, None]
+        return list(self.input_ids[input_name])
+
+    def get_input_names(self):
+        """Return the names of every input, in device order."""
+        self.index_signals()
+        return list(self.input_names.values())
+
+    def get_signal_names(self):
+        """Return two signal name lists: monitored and not monitored."""
+        self.index_signals()
+        monitored_signal_list = [self.signal_names[signal]
+                                 for signal in self.monitors_dictionary]
+        non_monitored_signal_list = list(self.unmonitored.values())
+        return [monitored_signal_list, non_monitored_signal_list]
+
+    def find_signals(self, pattern):
+        """Return [device_id, output_id] of every output matching pattern.
+
+        The pattern may use the glob wildcards *, ? and [...], and ranges
+        like d[1 TO 64].Q as in the definition files. Ranges are expanded
+        in index order, and the outputs matching a glob are returned in name
+        order.
+        """
+        return [list(self.signal_ids[signal_name])
+                for signal_name in self.find_signal_names(pattern)]
+
+    def find_signal_names(self, pattern):
+        """Return the name of every output matching pattern.
+
+        The pattern is as for find_signals.
+        """
+        self.index_signals()
+        if self.sorted_names is None:
+            self.sorted_names = sorted(self.signal_ids)
+        return self._find_names(pattern, self.signal_ids, self.sorted_names)
+
+    def find_input_names(self, pattern):
+        """Return the name of every input matching pattern.
+
+        The pattern is as for find_signals.
+        """
+        self.index_signals()
+        if self.sorted_inputs is None:
+            self.sorted_inputs = sorted(self.input_ids)
+        return self._find_names(pattern, self.input_ids, self.sorted_inputs)
+
+    def get_completions(self, prefix):
+        """Return the output and input names starting with prefix, in order.
+
+        The names are found by binary search in the sorted index, so tab
+        completion does not pass over every name.
+        """
+        self.index_signals()
+        if self.sorted_names is None:
+            self.sorted_names = sorted(self.signal_ids)
+        if self.sorted_inputs is None:
+            self.sorted_inputs = sorted(self.input_ids)
+        completions = []
+        for sorted_names in [self.sorted_names, self.sorted_inputs]:
+            start = bisect.bisect_left(sorted_names, prefix)
+            end = bisect.bisect_left(sorted_names, prefix + "\uffff")
+            completions.extend(sorted_names[start:end])
+        return sorted(completions)
+
+    def _find_names(self, pattern, ids, sorted_names):
+        """Return the names in ids that match pattern.
+
+        sorted_names holds the names in ids in order. Only the names starting
+        with the text before the first wildcard are checked, so a pattern
+        like nand* does not look at every name in the network.
+        """
+        index_range = re.search(r"\[\s*(\d+)\s+TO\s+(\d+)\s*\]", pattern)
+        if index_range is not None:
+            matches = []
+            for index in range(int(index_range.group(1)),
+                               int(index_range.group(2)) + 1):
+                matches.extend(self._find_names(
+                    pattern[:index_range.start()] + str(index) +
+                    pattern[index_range.end():], ids, sorted_names))
+            return matches
+        if not any(character in "*?[" for character in pattern):
+            if pattern in ids:
+                return [pattern]
+            return []
+
+        prefix = pattern
+        for i, character in enumerate(pattern):
+            if character in "*?[":
+                prefix = pattern[:i]
+                break
+        start = bisect.bisect_left(sorted_names, prefix)
+        matches = []
+        for name in sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            if fnmatch.fnmatchcase(name, pattern):
+                matches.append(name)
+        return matches
+
+    def reset_monitors(self):
+        """Clear the memory of all the monitors.
+
+        The list of stored signal levels for each monitor is deleted.
+        """
+        for device_id, output_id in self.monitors_dictionary:
+            self.monitors_dictionary[(device_id, output_id)] = []
+        self.recorders = None
+
+    def get_margin(self):
+        """Return the length of the longest monitor's name.
+
+        Return None if no signals are being monitored. This is useful for
+        finding out how much space to leave after each monitor's name before
+        starting to draw the signal trace.
+        """
+        length_list = []  # for storing name lengths
+        for device_id, output_id in self.monitors_dictionary:
+            monitor_name = self.get_signal_name(device_id, output_id)
+            name_length = len(monitor_name)
+            length_list.append(name_length)
+        if length_list:  # if the list is not empty
+            return max(length_list)
+        else:
+            return None
+
+    def display_signals(self):
+        """Display the signal trace(s) in the text console."""
+        margin = self.get_margin()
+        for device_id, output_id in self.monitors_dictionary:
+            monitor_name = self.get_signal_name(device_id, output_id)
+            name_length = len(monitor_name)
+            signal_list = self.monitors_dictionary[(device_id, output_id)]
+            print(monitor_name + (margin - name_length) * " ", end=": ")
+            for signal in signal_list:
+                if signal == self.devices.HIGH:
+                    print("-", end="")
+                if signal == self.devices.LOW:
+                    print("_", end="")
+                if signal == self.devices.RISING:
+                    print("/", end="")
+                if signal == self.devices.FALLING:
+                    print("\\", end="")
+                if signal == self.devices.BLANK:
+                    print(" ", end="")
+            print("\n", end="")
@@ -1,102 +1,225 @@
-"""Map variable names and string names to unique integers.
-
-Used in the Logic Simulator project. Most of the modules in the project
-use this module either directly or indirectly.
-
-Classes
--------
-Names - maps variable names and string names to unique integers.
-"""
-
-
-class Names:
-
-    """Map variable names and string names to unique integers.
-
-    This class deals with storing grammatical keywords and user-defined words,
-    and their corresponding name IDs, which are internal indexing integers. It
-    provides functions for looking up either the name ID or the name string.
-    It also keeps track of the number of error codes defined by other classes,
-    and allocates new, unique error codes on demand.
-
-    Parameters
-    ----------
-    No parameters.
-
-    Public methods
-    -------------
-    unique_error_codes(self, num_error_codes): Returns a list of unique integer
-                                               error codes.
-
-    query(self, name_string): Returns the corresponding name ID for the
-                        name string. Returns None if the string is not present.
-
-    lookup(self, name_string_list): Returns a list of name IDs for each
-                        name string. Adds a name if not already present.
-
-    get_name_string(self, name_id): Returns the corresponding name string for
-                        the name ID. Returns None if the ID is not present.
-    """
-
-    def __init__(self):
-        """
-        self.names: list of declared names.
-        self.error_code_count: total errors founds.
-        seld.not_name: list of keywords that cannot be used as variable names.
-        """
-        self.names = []
-        self.error_code_count = 0
-
-    def unique_error_codes(self, num_error_codes):
-        """Return a list of unique integer error codes."""
-        if not isinstance(num_error_codes, int):
-            raise TypeError("Expected num_error_codes to be an integer.")
-        self.error_code_count += num_error_codes
-        return range(self.error_code_count - num_error_codes,
-                     self.error_code_count)
-
-    def query(self, name_string):
-        """
-        Return the corresponding name ID for name_string.
-        If the name string is not present in the names list, return None.
-        """
-        if name_string in self.names:
-            return self.names.index(name_string)
-        else:
-            # assuming only positive numbers as defined in EBFL
-            return None
-
-    def lookup(self, name_string_list):
-        """
-        Return a list of name IDs for each name string in name_string_list.
-        If the name string is not present in the names list, add it.
-        If name is same as a Keyword or starts with a number raise an error.
-        """
-        ids = []
-        for name in name_string_list:
-            if isinstance(name, str):
-                if name[0].isalpha():
-                    if name not in self.names:
-                        self.names.append(name)
-                        ids.append(len(self.names)-1)
-                    else:
-                        ids.append(self.names.index(name))
-                else:
-                    raise TypeError('This name format is not allowed.')
-            else:
-                raise TypeError('Invalid type of input.')
-        return ids
-
-    def get_name_string(self, name_id):
-        """
-        Return the corresponding name string for name_id.
-        If the name_id is not an index in the names list, return None.
-        """
-        if isinstance(name_id, int):
-            if name_id in range(len(self.names)):
-                return self.names[name_id]
-            else:
-                return None
-        else:
-            raise TypeError('Only integers allowed.')
-            return None
\ No newline at end of file
+"""Map variable names and string names to unique integers.
+
+Used in the Logic Simulator project. Most of the modules in the project
+use this module either directly or indirectly.
+
+Classes
+-------
+Names - maps variable names and string names to unique integers.
+"""
+import bisect
+
+
+class Names:
+
+    """Map variable names and string names to unique integers.
+
+    This class deals with storing grammatical keywords and user-defined words,
+    and their corresponding name IDs, which are internal indexing integers. It
+    provides functions for looking up either the name ID or the name string.
+    It also keeps track of the number of error codes defined by other classes,
+    and allocates new, unique error codes on demand.
+
+    A range of indexed names, such as nand1 to nand100000, is kept as one
+    (base, lo, hi) record with a block of consecutive name IDs. The name
+    strings of a range are only built when they are asked for, and looking
+    up an indexed name finds its ID from the record.
+
+    Parameters
+    ----------
+    No parameters.
+
+    Public methods
+    -------------
+    unique_error_codes(self, num_error_codes): Returns a list of unique integer
+                                               error codes.
+
+    query(self, name_string): Returns the corresponding name ID for the
+                        name string. Returns None if the string is not present.
+
+    lookup(self, name_string_list): Returns a list of name IDs for each
+                        name string. Adds a name if not already present.
+
+    lookup_range(self, base, lo, hi): Returns the name IDs of base followed
+                        by each index from lo to hi. Adds the names as a
+                        range if none of them is present.
+
+    get_name_string(self, name_id): Returns the corresponding name string for
+                        the name ID. Returns None if the ID is not present.
+
+    Non-public methods
+    ------------------
+    _get_name_ids(self): Returns the dictionary from name strings to name IDs.
+
+    _split_index(self, name_string): Returns every (base, index) pair that
+                        the name string could be made from.
+
+    _find_in_ranges(self, name_string): Returns the name ID of a name that
+                        belongs to a range, or None.
+
+    _is_range_free(self, base, lo, hi): Returns True if no name of the range
+                        is already present.
+    """
+
+    def __init__(self):
+        """
+        self.names: list of declared names.
+        self.error_code_count: total errors founds.
+        seld.not_name: list of keywords that cannot be used as variable names.
+        """
+        self.names = []  # None for names in a range, built when asked for
+        self.name_ids = {}  # name string to name ID, so lookups are O(1)
+        self.name_ids_list = self.names  # the list name_ids was built from
+        self.error_code_count = 0
+
+        self.ranges = {}  # base to a list of (lo, hi, first name ID)
+        self.range_starts = []  # first name ID of every range, in order
+        self.range_records = []  # (base, lo) of every range, in order
+        self.range_roots = {}  # base without trailing digits to its bases
+        self.indexed = {}  # base to the indices of names added one by one
+
+    def unique_error_codes(self, num_error_codes):
+        """Return a list of unique integer error codes."""
+        if not isinstance(num_error_codes, int):
+            raise TypeError("Expected num_error_codes to be an integer.")
+        self.error_code_count += num_error_codes
+        return range(self.error_code_count - num_error_codes,
+                     self.error_code_count)
+
+    def query(self, name_string):
+        """
+        Return the corresponding name ID for name_string.
+        If the name string is not present in the names list, return None.
+        """
+        name_ids = self._get_name_ids()
+        if name_string in name_ids:
+            return name_ids[name_string]
+        elif self.ranges and isinstance(name_string, str):
+            return self._find_in_ranges(name_string)
+        else:
+            # assuming only positive numbers as defined in EBFL
+            return None
+
+    def lookup(self, name_string_list):
+        """
+        Return a list of name IDs for each name string in name_string_list.
+        If the name string is not present in the names list, add it.
+        If name is same as a Keyword or starts with a number raise an error.
+        """
+        ids = []
+        name_ids = self._get_name_ids()
+        for name in name_string_list:
+            if isinstance(name, str):
+                if name[0].isalpha():
+                    if name not in name_ids:
+                        name_id = None
+                        if self.ranges:
+                            name_id = self._find_in_ranges(name)
+                        if name_id is None:
+                            name_id = len(self.names)
+                            self.names.append(name)
+                            for base, index in self._split_index(name):
+                                self.indexed.setdefault(base, set()).add(
+                                    index)
+                        name_ids[name] = name_id
+                    ids.append(name_ids[name])
+                else:
+                    raise TypeError('This name format is not allowed.')
+            else:
+                raise TypeError('Invalid type of input.')
+        return ids
+
+    def get_name_string(self, name_id):
+        """
+        Return the corresponding name string for name_id.
+        If the name_id is not an index in the names list, return None.
+        """
+        if isinstance(name_id, int):
+            if name_id in range(len(self.names)):
+                name = self.names[name_id]
+                if name is None:  # build the name from its range
+                    position = bisect.bisect_right(self.range_starts,
+                                                   name_id) - 1
+                    base, lo = self.range_records[position]
+                    name = base + str(lo + name_id -
+                                      self.range_starts[position])
+                return name
+            else:
+                return None
+        else:
+            raise TypeError('Only integers allowed.')
+            return None
+
+    def _get_name_ids(self):
+        """Return the dictionary from name strings to name IDs.
+
+        It is rebuilt if the names list has been replaced.
+        """
+        if self.name_ids_list is not self.names:
+            self.name_ids = {}
+            self.name_ids_list = self.names
+            for name_id, name in enumerate(self.names):
+                if name is not None:
+                    self.name_ids.setdefault(name, name_id)
+        return self.name_ids
+
+    def lookup_range(self, base, lo, hi):
+        """Return the name IDs of base followed by each index from lo to hi.
+
+        If none of the names is present, they are added as one range with
+        consecutive IDs and no name strings. Otherwise they are looked up
+        one by one, so names already present keep their IDs.
+        """
+        if not isinstance(base, str) or not base[:1].isalpha():
+            raise TypeError('This name format is not allowed.')
+        if lo > hi:
+            return []
+        if not self._is_range_free(base, lo, hi):
+            return self.lookup([base + str(index)
+                                for index in range(lo, hi + 1)])
+
+        first_id = len(self.names)
+        self.names.extend([None] * (hi - lo + 1))
+        self.ranges.setdefault(base, []).append((lo, hi, first_id))
+        self.range_starts.append(first_id)
+        self.range_records.append((base, lo))
+        self.range_roots.setdefault(base.rstrip('0123456789'),
+                                    set()).add(base)
+        return range(first_id, first_id + hi - lo + 1)
+
+    def _split_index(self, name_string):
+        """Return every (base, index) pair that name_string could be made of.
+
+        nand12 could be nand with index 12 or nand1 with index 2. An index
+        never has a leading zero, as it is written with str.
+        """
+        digits = len(name_string) - len(name_string.rstrip('0123456789'))
+        pairs = []
+        for length in range(1, digits + 1):
+            index = name_string[-length:]
+            if length == 1 or index[0] != '0':
+                pairs.append((name_string[:-length], int(index)))
+        return pairs
+
+    def _find_in_ranges(self, name_string):
+        """Return the name ID of a name that belongs to a range, or None."""
+        for base, index in self._split_index(name_string):
+            for lo, hi, first_id in self.ranges.get(base, []):
+                if lo <= index <= hi:
+                    return first_id + index - lo
+        return None
+
+    def _is_range_free(self, base, lo, hi):
+        """Return True if no name of the range is already present.
+
+        Ranges whose bases differ only in trailing digits, like d and d1,
+        could share names, so they are never treated as free.
+        """
+        for other_lo, other_hi, _ in self.ranges.get(base, []):
+            if lo <= other_hi and other_lo <= hi:
+                return False
+        for index in self.indexed.get(base, []):
+            if lo <= index <= hi:
+                return False
+        other_bases = self.range_roots.get(base.rstrip('0123456789'), set())
+        return not other_bases - {base}
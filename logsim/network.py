@@ -1,482 +1,1088 @@
-"""Build and execute the network.
-
-Used in the Logic Simulator project to add and connect devices together.
-
-Classes
---------
-Network - builds and executes the network.
-"""
-
-
-class Network:
-
-    """Build and execute the network.
-
-    This class contains many functions required for connecting devices together
-    in the network, getting information about connections, and executing all
-    the devices in the network.
-
-    Parameters
-    ----------
-    devices - instance of the devices.Devices() class.
-
-    Public methods
-    --------------
-    get_connected_output(self, device_id, output_id): Returns the device and
-                                              port id of the connected output.
-
-    get_input_signal(self, device_id, input_id): Returns the signal level at
-                                     the output connected to the given input.
-
-    get_output_signal(self, device_id, output_id): Returns the signal level at
-                                                   the given output.
-
-    make_connection(self, first_device_id, first_port_id, second_device_id,
-                    second_port_id): Connects the first device to the second
-                                     device.
-
-    check_network(self): Checks if all inputs in the network are connected.
-
-    update_signal(self, signal, target): Updates the signal in the direction of
-                                         the target.
-
-    invert_signal(self, signal): Returns the inverse of the signal if the
-                                 signal is HIGH or LOW.
-
-    execute_switch(self, device_id): Simulates a switch press.
-
-    execute_gate(self, device_id, x=None, y=None): Simulates a logic gate and
-                                              updates its output signal value.
-
-    execute_d_type(self, device_id): Simulates a D-type device and updates its
-                                     output signal value.
-
-    execute_clock(self, device_id): Simulates a clock and updates its output
-                                    signal value.
-
-    update_clocks(self): If it is time to do so, sets clock signals to RISING
-                         or FALLING.
-
-    execute_network(self): Executes all the devices in the network for one
-                           simulation cycle.
-    """
-
-    def __init__(self, names, devices, errorHandler):
-        """Initialise network errors and the steady_state variable."""
-        self.names = names
-        self.devices = devices
-        self.errorHandler = errorHandler
-
-        self.syn_errors = [self.NO_ERROR, self.INPUT_TO_INPUT, 
-                        self.OUTPUT_TO_OUTPUT,
-                        self.INPUT_CONNECTED, self.PORT_ABSENT,
-                        self.DEVICE_ABSENT,
-                        self.NOT_INPUT, self.NOT_OUTPUT,
-                        ] = self.names.unique_error_codes(8)
-        self.steady_state = True  # for checking if signals have settled
-
-        self.errorHandler.semantic.create_syn_list(self.syn_errors)
-
-        error_message = {
-            self.NO_ERROR: 'NON-USER ERROR',
-            self.INPUT_TO_INPUT: 'Trying to connect input of a device to another device input.',
-            self.OUTPUT_TO_OUTPUT: 'Trying connect output of a device to another device output.',
-            self.INPUT_CONNECTED: 'Trying to connect a device to an input pin which is already connected to another device.',
-            self.PORT_ABSENT: 'Trying to access an invalid input or output port.',
-            self.DEVICE_ABSENT: 'Trying to access or monitor a device which has not been created.',
-            self.NOT_INPUT: 'The port does not exist or is not an input port',
-            self.NOT_OUTPUT: 'Must specify an output',
-        }
-        self.errorHandler.semantic.define_error_messages(error_message)
-    
-    
-    
-    def add_circuit_input(self, circuit_id, circuit_input_port, device_name_id, device_input_port):
-        print('burleigh', circuit_id)
-        print('ippppppppppppppppp')
-        print(self.names.get_name_string(circuit_id))
-        print(self.names.get_name_string(circuit_input_port), circuit_input_port)
-        print(self.names.get_name_string(device_name_id))
-        print(self.names.get_name_string(device_input_port))
-        
-        device = self.devices.get_device(device_name_id)
-        
-        if device is None:
-            error_type = self.DEVICE_ABSENT
-            print('11')
-        
-        elif device_input_port in device.inputs:
-            error_type = self.NO_ERROR
-            self.devices.circuit_dict[circuit_id].add_circuit_input(circuit_input_port, device_name_id, device_input_port)
-            print('33')
-        else:
-            print('44', self.names.get_name_string(device_name_id))
-            error_type = self.NOT_INPUT
-        
-        return error_type
-    
-    def add_circuit_output(self, circuit_id, circuit_output_port, device_name_id, device_output_port):
-        print('oppppppppppppppppp')
-        print(self.names.get_name_string(circuit_id), circuit_id)
-        print(self.names.get_name_string(circuit_output_port), circuit_output_port)
-        print(self.names.get_name_string(device_name_id), device_name_id)
-        if device_output_port is not None:
-            print(self.names.get_name_string(device_output_port), device_output_port)
-            
-            
-        device = self.devices.get_device(device_name_id)
-        
-        if device is None:
-            error_type = self.DEVICE_ABSENT
-            print('11')
-        
-        elif device_output_port is not None:
-            error_type = self.NOT_OUTPUT
-            print('33')
-        else:
-            error_type = self.NO_ERROR
-            self.devices.circuit_dict[circuit_id].add_circuit_output(circuit_output_port, device_name_id, device_output_port)
-        
-        return error_type
-        
-    
-
-    def get_connected_output(self, device_id, input_id):
-        """Return the output connected to the given input.
-
-        Return None if either of the specified IDs is invalid or the input is
-        unconnected. The output is of the form (device ID, port ID).
-        """
-        device = self.devices.get_device(device_id)
-        if device is not None:
-            if input_id in device.inputs:
-                connected_output = device.inputs[input_id]
-                return connected_output
-        return None
-
-    def get_input_signal(self, device_id, input_id):
-        """Return the signal level at the output connected to the given input.
-
-        Return None if the input is unconnected or the specified IDs are
-        invalid.
-        """
-        connected_output = self.get_connected_output(device_id, input_id)
-        if connected_output is None:  # invalid IDs or unconnected input
-            return None
-        else:
-            (output_device_id, output_port_id) = connected_output
-            return self.get_output_signal(output_device_id, output_port_id)
-
-    def get_output_signal(self, device_id, output_id):
-        """Return the signal level at the given output.
-
-        Return None if either of the specified IDs is invalid.
-        """
-        device = self.devices.get_device(device_id)
-        if device is not None:
-            if output_id in device.outputs:
-                return device.outputs[output_id]
-        return None
-
-    def make_connection(self, first_device_id, first_port_id, second_device_id,
-                        second_port_id):
-        """Connect the first device to the second device.
-
-        Return self.NO_ERROR if successful, or the corresponding error if not.
-        """
-        first_device = self.devices.get_device(first_device_id)
-        second_device = self.devices.get_device(second_device_id)
-
-        if first_device is None or second_device is None:
-            error_type = self.DEVICE_ABSENT
-
-        elif first_port_id in first_device.inputs:
-            if first_device.inputs[first_port_id] is not None:
-                # Input is already in a connection
-                error_type = self.INPUT_CONNECTED
-            elif second_port_id in second_device.inputs:
-                # Both ports are inputs
-                error_type = self.INPUT_TO_INPUT
-            elif second_port_id in second_device.outputs:
-                # Make connection
-                first_device.inputs[first_port_id] = (second_device_id,
-                                                      second_port_id)
-                error_type = self.NO_ERROR
-            else:  # second_port_id is not a valid input or output port
-                error_type = self.PORT_ABSENT
-
-        elif first_port_id in first_device.outputs:
-            if second_port_id in second_device.outputs:
-                # Both ports are outputs
-                error_type = self.OUTPUT_TO_OUTPUT
-            elif second_port_id in second_device.inputs:
-                if second_device.inputs[second_port_id] is not None:
-                    # Input is already in a connection
-                    error_type = self.INPUT_CONNECTED
-                else:
-                    second_device.inputs[second_port_id] = (first_device_id,
-                                                            first_port_id)
-                    error_type = self.NO_ERROR
-            else:
-                error_type = self.PORT_ABSENT
-
-        else:  # first_port_id not a valid input or output port
-            error_type = self.PORT_ABSENT
-
-        return error_type
-
-    def check_network(self):
-        """Return True if all inputs in the network are connected."""
-        for device_id in self.devices.find_devices():
-            device = self.devices.get_device(device_id)
-            for input_id in device.inputs:
-                if self.get_connected_output(device_id, input_id) is None:
-                    return False
-        return True
-
-    def update_signal(self, signal, target):
-        """Update the signal in the direction of the target.
-
-        Return updated signal, and set steady_state to false if the new signal
-        is different from the old signal.
-        """
-        if signal in [self.devices.LOW, self.devices.FALLING]:
-            if target == self.devices.LOW:
-                new_signal = self.devices.LOW
-            else:
-                new_signal = self.devices.RISING
-        elif signal in [self.devices.HIGH, self.devices.RISING]:
-            if target == self.devices.LOW:
-                new_signal = self.devices.FALLING
-            else:
-                new_signal = self.devices.HIGH
-        else:
-            return None
-        if signal != new_signal:
-            self.steady_state = False
-        return new_signal
-
-    def invert_signal(self, signal):
-        """Return the inverse of the signal if the signal is HIGH or LOW.
-
-        Return None if the signal is not HIGH or LOW.
-        """
-        if signal == self.devices.HIGH:
-            return self.devices.LOW
-        elif signal == self.devices.LOW:
-            return self.devices.HIGH
-        else:
-            return None
-
-    def execute_switch(self, device_id):
-        """Simulate a switch.
-
-        The output signal is updated to the switch_state target. Return True
-        if successful.
-        """
-        device = self.devices.get_device(device_id)
-        target = device.switch_state
-        signal = self.get_output_signal(device_id, output_id=None)
-        # Update and store the updated signal
-        updated_signal = self.update_signal(signal, target)
-        if updated_signal is None:  # signal update is unsuccessful
-            return False
-        else:
-            device.outputs[None] = updated_signal
-            return True
-
-    def execute_gate(self, device_id, x=None, y=None):
-        """Simulate a logic gate and update its output signal value.
-
-        The rule is: if all its inputs are x, then its output is y, else its
-        output is the inverse of y.
-        Note: (x,y) pairs for AND, OR, NOR, NAND, XOR are: (HIGH, HIGH), (LOW,
-        LOW), (LOW, HIGH), (HIGH, LOW), (None, None).
-        Return True if successful.
-        """
-        device = self.devices.get_device(device_id)
-        input_signal_list = []
-        for input_id in device.inputs:
-            input_signal = self.get_input_signal(device_id, input_id)
-            if input_signal is None:  # this input is unconnected
-                return False
-            input_signal_list.append(input_signal)
-
-            if device.device_kind != self.devices.XOR and device.device_kind != self.devices.NOT:
-                if input_signal != x:
-                    output_signal = self.invert_signal(y)
-                    break
-                output_signal = y
-
-        if device.device_kind == self.devices.XOR:
-            # Output is high only if both inputs are different
-            if input_signal_list[0] == input_signal_list[1]:  # assume 2 inputs
-                output_signal = self.devices.LOW
-            else:
-                output_signal = self.devices.HIGH
-        elif device.device_kind == self.devices.NOT:
-            output_signal = self.invert_signal(input_signal_list[0]) # assume 1 input
-
-        # Update and store the new signal
-        signal = self.get_output_signal(device_id, None)
-        target = output_signal
-        updated_signal = self.update_signal(signal, target)
-        if updated_signal is None:  # if the update is unsuccessful
-            return False
-        device.outputs[None] = updated_signal
-        return True
-
-    def execute_d_type(self, device_id):
-        """Simulate a D-type device and update its output signal value.
-
-        Return True if successful.
-        """
-        device = self.devices.get_device(device_id)
-
-        for input_id in device.inputs:
-            input_signal = self.get_input_signal(device_id, input_id)
-            if input_signal is None:  # if the input is unconnected
-                return False
-            if input_id == self.devices.CLK_ID:
-                clock_signal = input_signal
-            elif input_id == self.devices.DATA_ID:
-                data_signal = input_signal
-            elif input_id == self.devices.CLEAR_ID:
-                clear_signal = input_signal
-            elif input_id == self.devices.SET_ID:
-                set_signal = input_signal
-
-        # Set D-type memory depending on the input signal
-        if clock_signal == self.devices.RISING:
-            if data_signal in [self.devices.HIGH, self.devices.FALLING]:
-                device.dtype_memory = self.devices.HIGH
-            elif data_signal in [self.devices.LOW, self.devices.RISING]:
-                device.dtype_memory = self.devices.LOW
-        if set_signal == self.devices.HIGH:
-            device.dtype_memory = self.devices.HIGH
-        if clear_signal == self.devices.HIGH:
-            device.dtype_memory = self.devices.LOW
-
-        if self.devices.Q_ID not in device.outputs:
-            if self.devices.QBAR_ID not in device.outputs:
-                return False
-        Q_signal = device.outputs[self.devices.Q_ID]
-        QBAR_signal = device.outputs[self.devices.QBAR_ID]
-
-        # Update the output towards its memory
-        new_Q = self.update_signal(Q_signal, device.dtype_memory)
-        new_QBAR = self.update_signal(QBAR_signal,
-                                      self.invert_signal(device.dtype_memory))
-        if new_Q is None or new_QBAR is None:  # if the update is unsuccessful
-            return False
-        device.outputs[self.devices.Q_ID] = new_Q
-        device.outputs[self.devices.QBAR_ID] = new_QBAR
-
-        return True
-
-    def execute_clock(self, device_id):
-        """Simulate a clock and update its output signal value.
-
-        Return True if successful.
-        """
-        device = self.devices.get_device(device_id)
-        output_signal = device.outputs[None]  # output ID is None
-
-        if output_signal == self.devices.RISING:
-            new_signal = self.update_signal(output_signal, self.devices.HIGH)
-            if new_signal is None:  # update is unsuccessful
-                return False
-            device.outputs[None] = new_signal
-            return True
-
-        elif output_signal == self.devices.FALLING:
-            new_signal = self.update_signal(output_signal, self.devices.LOW)
-            if new_signal is None:  # update is unsuccessful
-                return False
-            device.outputs[None] = new_signal
-            return True
-
-        elif output_signal in [self.devices.HIGH, self.devices.LOW]:
-            return True
-
-        else:
-            return False
-
-    def update_clocks(self):
-        """If it is time to do so, set clock signals to RISING or FALLING."""
-        clock_devices = self.devices.find_devices(self.devices.CLOCK)
-        for device_id in clock_devices:
-            device = self.devices.get_device(device_id)
-            if device.clock_counter == device.clock_half_period:
-                device.clock_counter = 0
-                output_signal = self.get_output_signal(device_id,
-                                                       output_id=None)
-                if output_signal == self.devices.HIGH:
-                    device.outputs[None] = self.devices.FALLING
-                elif output_signal == self.devices.LOW:
-                    device.outputs[None] = self.devices.RISING
-            device.clock_counter += 1
-
-    def execute_network(self):
-        """Execute all the devices in the network for one simulation cycle.
-
-        Return True if successful and the network does not oscillate.
-        """
-        clock_devices = self.devices.find_devices(self.devices.CLOCK)
-        switch_devices = self.devices.find_devices(self.devices.SWITCH)
-        d_type_devices = self.devices.find_devices(self.devices.D_TYPE)
-        and_devices = self.devices.find_devices(self.devices.AND)
-        or_devices = self.devices.find_devices(self.devices.OR)
-        nand_devices = self.devices.find_devices(self.devices.NAND)
-        nor_devices = self.devices.find_devices(self.devices.NOR)
-        xor_devices = self.devices.find_devices(self.devices.XOR)
-        not_devices = self.devices.find_devices(self.devices.NOT)
-
-        # This sets clock signals to RISING or FALLING, where necessary
-        self.update_clocks()
-
-        # Number of iterations to wait for the signals to settle before
-        # declaring the network unstable
-        iteration_limit = 20
-
-        iterations = 0
-        while iterations < iteration_limit:
-            iterations += 1
-            self.steady_state = True
-
-            for device_id in switch_devices:  # execute switch devices
-                if not self.execute_switch(device_id):
-                    return False
-            # Execute D-type devices before clocks to catch the rising edge of
-            # the clock
-            for device_id in d_type_devices:  # execute DTYPE devices
-                if not self.execute_d_type(device_id):
-                    return False
-            for device_id in clock_devices:  # complete clock executions
-                if not self.execute_clock(device_id):
-                    return False
-            for device_id in and_devices:  # execute AND gate devices
-                if not self.execute_gate(device_id, self.devices.HIGH,
-                                         self.devices.HIGH):
-                    return False
-            for device_id in or_devices:  # execute OR gate devices
-                if not self.execute_gate(device_id, self.devices.LOW,
-                                         self.devices.LOW):
-                    return False
-            for device_id in nand_devices:  # execute NAND gate devices
-                if not self.execute_gate(device_id, self.devices.HIGH,
-                                         self.devices.LOW):
-                    return False
-            for device_id in nor_devices:  # execute NOR gate devices
-                if not self.execute_gate(device_id, self.devices.LOW,
-                                         self.devices.HIGH):
-                    return False
-            for device_id in xor_devices:  # execute XOR devices
-                if not self.execute_gate(device_id, None, None):
-                    return False
-            for device_id in not_devices:  # execute NOT devices
-                if not self.execute_gate(device_id, None, None):
-                    return False
-            if self.steady_state:
-                break
-        return self.steady_state
+"""Build and execute the network.
+
+Used in the Logic Simulator project to add and connect devices together.
+
+Classes
+--------
+Network - builds and executes the network.
+"""
+import heapq
+
+import numpy
+
+from metrics import Metrics
+
+
+class Network:
+
+    """Build and execute the network.
+
+    This class contains many functions required for connecting devices together
+    in the network, getting information about connections, and executing all
+    the devices in the network.
+
+    Parameters
+    ----------
+    devices - instance of the devices.Devices() class.
+
+    Public methods
+    --------------
+    get_connected_output(self, device_id, output_id): Returns the device and
+                                              port id of the connected output.
+
+    get_input_signal(self, device_id, input_id): Returns the signal level at
+                                     the output connected to the given input.
+
+    get_output_signal(self, device_id, output_id): Returns the signal level at
+                                                   the given output.
+
+    make_connection(self, first_device_id, first_port_id, second_device_id,
+                    second_port_id): Connects the first device to the second
+                                     device.
+
+    check_network(self): Checks if all inputs in the network are connected.
+
+    update_signal(self, signal, target): Updates the signal in the direction of
+                                         the target.
+
+    invert_signal(self, signal): Returns the inverse of the signal if the
+                                 signal is HIGH or LOW.
+
+    execute_switch(self, device_id): Simulates a switch press.
+
+    execute_gate(self, device_id, x=None, y=None): Simulates a logic gate and
+                                              updates its output signal value.
+
+    execute_d_type(self, device_id): Simulates a D-type device and updates its
+                                     output signal value.
+
+    execute_clock(self, device_id): Simulates a clock and updates its output
+                                    signal value.
+
+    execute_bus(self, bus, x=None, y=None): Simulates every device of a bus
+                                at once and updates their output signals.
+
+    reset_clocks(self): Restarts the cycle count and metrics and schedules
+                        the first edge of every clock.
+
+    get_clock_counter(self, device_id): Returns the number of cycles since the
+                                        last edge of the specified clock.
+
+    update_clocks(self): If it is time to do so, sets clock signals to RISING
+                         or FALLING.
+
+    elaborate(self): Sorts the devices by kind and computes the logic depth.
+
+    get_iteration_limit(self): Returns the number of iterations allowed for
+                               a cycle to settle.
+
+    execute_network(self): Executes all the devices in the network for one
+                           simulation cycle.
+
+    execute_cycles(self, cycles, monitors=None, progress=None): Executes the
+                        network for the specified number of cycles, skipping
+                        idle cycles and repeating periodic states.
+
+    Non-public methods
+    ------------------
+    _execute_sweep(self, device_lists): Executes every device once.
+
+    _can_vectorize(self, bus): Returns True if a bus can be executed as one
+                               array operation.
+
+    _get_bus_inputs(self, bus): Returns the array the bus inputs are gathered
+                                into and where to gather them from.
+
+    _find_oscillating_loop(self, device_lists): Returns the IDs of the
+                        devices in the smallest oscillating loop.
+
+    _get_strong_components(self, successors): Returns the strongly connected
+                        components of a directed graph.
+
+    _get_idle_cycles(self, switches, limit): Returns the number of upcoming
+                        cycles in which no signal can change.
+
+    _get_state(self, devices_list, d_types): Returns the full state of the
+                                             network.
+
+    _skip_cycles(self, skipped): Moves every scheduled clock edge forward by
+                                 the specified number of cycles.
+    """
+
+    def __init__(self, names, devices, errorHandler):
+        """Initialise network errors and the steady_state variable."""
+        self.names = names
+        self.devices = devices
+        self.errorHandler = errorHandler
+
+        self.syn_errors = [self.NO_ERROR, self.INPUT_TO_INPUT, 
+                        self.OUTPUT_TO_OUTPUT,
+                        self.INPUT_CONNECTED, self.PORT_ABSENT,
+                        self.DEVICE_ABSENT,
+                        self.NOT_INPUT, self.NOT_OUTPUT,
+                        ] = self.names.unique_error_codes(8)
+        self.steady_state = True  # for checking if signals have settled
+
+        # Device IDs and buses sorted by kind in execution order, and the
+        # longest chain of devices a change has to ripple through. Both are
+        # computed by elaborate and cleared whenever a connection is made.
+        self.device_lists = None
+        self.logic_depth = 0
+        self.elaborated_devices = 0  # number of devices when elaborated
+
+        # Bus: (connection changes, input signal array, slices, single
+        # inputs), giving where to gather the inputs of every bus executed
+        # by execute_bus. Each entry is rebuilt when the bus connections
+        # change.
+        self.bus_inputs = {}
+        # If False, bus devices are executed one by one like any other
+        # device. This takes effect the next time the network is elaborated.
+        self.vectorize_buses = True
+
+        # New signal for every [signal, target] pair, as given by
+        # update_signal, for updating a whole bus at once
+        devices = self.devices
+        self.signal_updates = numpy.empty((4, 2), dtype=numpy.int8)
+        for signal in [devices.LOW, devices.FALLING]:
+            self.signal_updates[signal, devices.LOW] = devices.LOW
+            self.signal_updates[signal, devices.HIGH] = devices.RISING
+        for signal in [devices.HIGH, devices.RISING]:
+            self.signal_updates[signal, devices.LOW] = devices.FALLING
+            self.signal_updates[signal, devices.HIGH] = devices.HIGH
+
+        # Number of iterations to wait for the signals to settle before
+        # declaring the network unstable. If None, the limit is derived from
+        # the logic depth.
+        self.iteration_limit = None
+        self.metrics = Metrics()  # statistics of every executed cycle
+
+        # Activity counters of the cycle being executed. They are only
+        # incremented on paths where a signal already changes, so counting
+        # adds no tests to the common case.
+        self.transitions = 0  # outputs starting to rise or fall
+        self.d_type_captures = 0  # D-types seeing a rising clock
+        self.clock_edges = 0
+
+        # Clocks are scheduled as a heap of (edge cycle, index, device)
+        # entries, so only the clocks with an edge in a cycle are visited
+        self.cycle_count = 0  # number of simulation cycles executed
+        self.clock_schedule = None
+
+        # Period of the repeating state found by the last execute_cycles,
+        # or None if the network was not seen to repeat
+        self.detected_period = None
+        self.state_history_limit = 10000  # state digests to store
+        self.cycles_run = 0  # cycles completed by the last execute_cycles
+
+        # IDs of the devices in the loop that stopped the last failed cycle
+        # from settling, and the number of sweeps used to find them
+        self.oscillating_devices = []
+        self.diagnostic_sweeps = 4
+
+        self.errorHandler.semantic.create_syn_list(self.syn_errors)
+
+        error_message = {
+            self.NO_ERROR: 'NON-USER ERROR',
+            self.INPUT_TO_INPUT: 'Trying to connect input of a device to another device input.',
+            self.OUTPUT_TO_OUTPUT: 'Trying connect output of a device to another device output.',
+            self.INPUT_CONNECTED: 'Trying to connect a device to an input pin which is already connected to another device.',
+            self.PORT_ABSENT: 'Trying to access an invalid input or output port.',
+            self.DEVICE_ABSENT: 'Trying to access or monitor a device which has not been created.',
+            self.NOT_INPUT: 'The port does not exist or is not an input port',
+            self.NOT_OUTPUT: 'Must specify an output',
+        }
+        self.errorHandler.semantic.define_error_messages(error_message)
+    
+    
+    
+    def add_circuit_input(self, circuit_id, circuit_input_port, device_name_id, device_input_port):
+        print('burleigh', circuit_id)
+        print('ippppppppppppppppp')
+        print(self.names.get_name_string(circuit_id))
+        print(self.names.get_name_string(circuit_input_port), circuit_input_port)
+        print(self.names.get_name_string(device_name_id))
+        if device_input_port is not None:
+            print(self.names.get_name_string(device_input_port))
+        
+        device = self.devices.get_device(device_name_id)
+        
+        if device is None:
+            error_type = self.DEVICE_ABSENT
+            print('11')
+        
+        elif device_input_port in device.inputs:
+            error_type = self.NO_ERROR
+            self.devices.circuit_dict[circuit_id].add_circuit_input(circuit_input_port, device_name_id, device_input_port)
+            print('33')
+        else:
+            print('44', self.names.get_name_string(device_name_id))
+            error_type = self.NOT_INPUT
+        
+        return error_type
+    
+    def add_circuit_output(self, circuit_id, circuit_output_port, device_name_id, device_output_port):
+        print('oppppppppppppppppp')
+        print(self.names.get_name_string(circuit_id), circuit_id)
+        print(self.names.get_name_string(circuit_output_port), circuit_output_port)
+        print(self.names.get_name_string(device_name_id), device_name_id)
+        if device_output_port is not None:
+            print(self.names.get_name_string(device_output_port), device_output_port)
+            
+            
+        device = self.devices.get_device(device_name_id)
+        
+        if device is None:
+            error_type = self.DEVICE_ABSENT
+            print('11')
+        
+        elif device_output_port is not None:
+            error_type = self.NOT_OUTPUT
+            print('33')
+        else:
+            error_type = self.NO_ERROR
+            self.devices.circuit_dict[circuit_id].add_circuit_output(circuit_output_port, device_name_id, device_output_port)
+        
+        return error_type
+        
+    
+
+    def get_connected_output(self, device_id, input_id):
+        """Return the output connected to the given input.
+
+        Return None if either of the specified IDs is invalid or the input is
+        unconnected. The output is of the form (device ID, port ID).
+        """
+        device = self.devices.get_device(device_id)
+        if device is not None:
+            if input_id in device.inputs:
+                connected_output = device.inputs[input_id]
+                return connected_output
+        return None
+
+    def get_input_signal(self, device_id, input_id):
+        """Return the signal level at the output connected to the given input.
+
+        Return None if the input is unconnected or the specified IDs are
+        invalid.
+        """
+        connected_output = self.get_connected_output(device_id, input_id)
+        if connected_output is None:  # invalid IDs or unconnected input
+            return None
+        else:
+            (output_device_id, output_port_id) = connected_output
+            return self.get_output_signal(output_device_id, output_port_id)
+
+    def get_output_signal(self, device_id, output_id):
+        """Return the signal level at the given output.
+
+        Return None if either of the specified IDs is invalid.
+        """
+        device = self.devices.get_device(device_id)
+        if device is not None:
+            if output_id in device.outputs:
+                return device.outputs[output_id]
+        return None
+
+    def make_connection(self, first_device_id, first_port_id, second_device_id,
+                        second_port_id):
+        """Connect the first device to the second device.
+
+        Return self.NO_ERROR if successful, or the corresponding error if not.
+        """
+        first_device = self.devices.get_device(first_device_id)
+        second_device = self.devices.get_device(second_device_id)
+
+        if first_device is None or second_device is None:
+            error_type = self.DEVICE_ABSENT
+
+        elif first_port_id in first_device.inputs:
+            if first_device.inputs[first_port_id] is not None:
+                # Input is already in a connection
+                error_type = self.INPUT_CONNECTED
+            elif second_port_id in second_device.inputs:
+                # Both ports are inputs
+                error_type = self.INPUT_TO_INPUT
+            elif second_port_id in second_device.outputs:
+                # Make connection
+                first_device.inputs[first_port_id] = (second_device_id,
+                                                      second_port_id)
+                error_type = self.NO_ERROR
+            else:  # second_port_id is not a valid input or output port
+                error_type = self.PORT_ABSENT
+
+        elif first_port_id in first_device.outputs:
+            if second_port_id in second_device.outputs:
+                # Both ports are outputs
+                error_type = self.OUTPUT_TO_OUTPUT
+            elif second_port_id in second_device.inputs:
+                if second_device.inputs[second_port_id] is not None:
+                    # Input is already in a connection
+                    error_type = self.INPUT_CONNECTED
+                else:
+                    second_device.inputs[second_port_id] = (first_device_id,
+                                                            first_port_id)
+                    error_type = self.NO_ERROR
+            else:
+                error_type = self.PORT_ABSENT
+
+        else:  # first_port_id not a valid input or output port
+            error_type = self.PORT_ABSENT
+
+        if error_type == self.NO_ERROR:
+            self.device_lists = None  # the logic depth may have changed
+        return error_type
+
+    def check_network(self):
+        """Return True if all inputs in the network are connected."""
+        for device_id in self.devices.find_devices():
+            device = self.devices.get_device(device_id)
+            for input_id in device.inputs:
+                if self.get_connected_output(device_id, input_id) is None:
+                    return False
+        return True
+
+    def update_signal(self, signal, target):
+        """Update the signal in the direction of the target.
+
+        Return updated signal, and set steady_state to false if the new signal
+        is different from the old signal.
+        """
+        if signal in [self.devices.LOW, self.devices.FALLING]:
+            if target == self.devices.LOW:
+                new_signal = self.devices.LOW
+            else:
+                new_signal = self.devices.RISING
+                self.transitions += 1
+        elif signal in [self.devices.HIGH, self.devices.RISING]:
+            if target == self.devices.LOW:
+                new_signal = self.devices.FALLING
+                self.transitions += 1
+            else:
+                new_signal = self.devices.HIGH
+        else:
+            return None
+        if signal != new_signal:
+            self.steady_state = False
+        return new_signal
+
+    def invert_signal(self, signal):
+        """Return the inverse of the signal if the signal is HIGH or LOW.
+
+        Return None if the signal is not HIGH or LOW.
+        """
+        if signal == self.devices.HIGH:
+            return self.devices.LOW
+        elif signal == self.devices.LOW:
+            return self.devices.HIGH
+        else:
+            return None
+
+    def execute_switch(self, device_id):
+        """Simulate a switch.
+
+        The output signal is updated to the switch_state target. Return True
+        if successful.
+        """
+        device = self.devices.get_device(device_id)
+        target = device.switch_state
+        signal = self.get_output_signal(device_id, output_id=None)
+        # Update and store the updated signal
+        updated_signal = self.update_signal(signal, target)
+        if updated_signal is None:  # signal update is unsuccessful
+            return False
+        else:
+            device.outputs[None] = updated_signal
+            return True
+
+    def execute_gate(self, device_id, x=None, y=None):
+        """Simulate a logic gate and update its output signal value.
+
+        The rule is: if all its inputs are x, then its output is y, else its
+        output is the inverse of y.
+        Note: (x,y) pairs for AND, OR, NOR, NAND, XOR are: (HIGH, HIGH), (LOW,
+        LOW), (LOW, HIGH), (HIGH, LOW), (None, None).
+        Return True if successful.
+        """
+        device = self.devices.get_device(device_id)
+        input_signal_list = []
+        for input_id in device.inputs:
+            input_signal = self.get_input_signal(device_id, input_id)
+            if input_signal is None:  # this input is unconnected
+                return False
+            input_signal_list.append(input_signal)
+
+            if device.device_kind != self.devices.XOR and device.device_kind != self.devices.NOT:
+                if input_signal != x:
+                    output_signal = self.invert_signal(y)
+                    break
+                output_signal = y
+
+        if device.device_kind == self.devices.XOR:
+            # Output is high only if both inputs are different
+            if input_signal_list[0] == input_signal_list[1]:  # assume 2 inputs
+                output_signal = self.devices.LOW
+            else:
+                output_signal = self.devices.HIGH
+        elif device.device_kind == self.devices.NOT:
+            output_signal = self.invert_signal(input_signal_list[0]) # assume 1 input
+
+        # Update and store the new signal
+        signal = self.get_output_signal(device_id, None)
+        target = output_signal
+        updated_signal = self.update_signal(signal, target)
+        if updated_signal is None:  # if the update is unsuccessful
+            return False
+        device.outputs[None] = updated_signal
+        return True
+
+    def execute_d_type(self, device_id):
+        """Simulate a D-type device and update its output signal value.
+
+        Return True if successful.
+        """
+        device = self.devices.get_device(device_id)
+
+        for input_id in device.inputs:
+            input_signal = self.get_input_signal(device_id, input_id)
+            if input_signal is None:  # if the input is unconnected
+                return False
+            if input_id == self.devices.CLK_ID:
+                clock_signal = input_signal
+            elif input_id == self.devices.DATA_ID:
+                data_signal = input_signal
+            elif input_id == self.devices.CLEAR_ID:
+                clear_signal = input_signal
+            elif input_id == self.devices.SET_ID:
+                set_signal = input_signal
+
+        # Set D-type memory depending on the input signal
+        if clock_signal == self.devices.RISING:
+            self.d_type_captures += 1
+            if data_signal in [self.devices.HIGH, self.devices.FALLING]:
+                device.dtype_memory = self.devices.HIGH
+            elif data_signal in [self.devices.LOW, self.devices.RISING]:
+                device.dtype_memory = self.devices.LOW
+        if set_signal == self.devices.HIGH:
+            device.dtype_memory = self.devices.HIGH
+        if clear_signal == self.devices.HIGH:
+            device.dtype_memory = self.devices.LOW
+
+        if self.devices.Q_ID not in device.outputs:
+            if self.devices.QBAR_ID not in device.outputs:
+                return False
+        Q_signal = device.outputs[self.devices.Q_ID]
+        QBAR_signal = device.outputs[self.devices.QBAR_ID]
+
+        # Update the output towards its memory
+        new_Q = self.update_signal(Q_signal, device.dtype_memory)
+        new_QBAR = self.update_signal(QBAR_signal,
+                                      self.invert_signal(device.dtype_memory))
+        if new_Q is None or new_QBAR is None:  # if the update is unsuccessful
+            return False
+        device.outputs[self.devices.Q_ID] = new_Q
+        device.outputs[self.devices.QBAR_ID] = new_QBAR
+
+        return True
+
+    def execute_clock(self, device_id):
+        """Simulate a clock and update its output signal value.
+
+        Return True if successful.
+        """
+        device = self.devices.get_device(device_id)
+        output_signal = device.outputs[None]  # output ID is None
+
+        if output_signal == self.devices.RISING:
+            new_signal = self.update_signal(output_signal, self.devices.HIGH)
+            if new_signal is None:  # update is unsuccessful
+                return False
+            device.outputs[None] = new_signal
+            return True
+
+        elif output_signal == self.devices.FALLING:
+            new_signal = self.update_signal(output_signal, self.devices.LOW)
+            if new_signal is None:  # update is unsuccessful
+                return False
+            device.outputs[None] = new_signal
+            return True
+
+        elif output_signal in [self.devices.HIGH, self.devices.LOW]:
+            return True
+
+        else:
+            return False
+
+    def execute_bus(self, bus, x=None, y=None):
+        """Simulate every device of a bus at once and update their outputs.
+
+        The inputs of all the devices are gathered into one array, which is
+        then evaluated with the rules of execute_gate, using the same (x, y)
+        pairs, or of execute_d_type. Return True if successful.
+        """
+        devices = self.devices
+        gathered = self.bus_inputs.get(bus)
+        if gathered is None or gathered[0] != bus.connection_changes:
+            gathered = self._get_bus_inputs(bus)
+            if gathered is None:  # an input is unconnected
+                return False
+            self.bus_inputs[bus] = gathered
+        signals, slices, single_inputs = gathered[1:]
+        for row, start, stop, source, source_row, source_start in slices:
+            signals[row, start:stop] = source[
+                source_row, source_start:source_start + stop - start]
+        for row, start, stop, source, port_id in single_inputs:
+            signals[row, start:stop] = source[port_id]
+
+        if bus.device_kind == devices.D_TYPE:
+            input_rows = bus.input_rows
+            memory = bus.dtype_memory
+            rising = signals[input_rows[devices.CLK_ID]] == devices.RISING
+            captures = numpy.count_nonzero(rising)
+            if captures:
+                self.d_type_captures += int(captures)
+                data = signals[input_rows[devices.DATA_ID]]
+                memory[rising & ((data == devices.HIGH) |
+                                 (data == devices.FALLING))] = devices.HIGH
+                memory[rising & ((data == devices.LOW) |
+                                 (data == devices.RISING))] = devices.LOW
+            memory[signals[input_rows[devices.SET_ID]] ==
+                   devices.HIGH] = devices.HIGH
+            memory[signals[input_rows[devices.CLEAR_ID]] ==
+                   devices.HIGH] = devices.LOW
+            inverse = numpy.where(memory == devices.HIGH, devices.LOW,
+                                  devices.HIGH)
+            targets = [(bus.output_rows[devices.Q_ID], memory),
+                       (bus.output_rows[devices.QBAR_ID], inverse)]
+        else:
+            if bus.device_kind == devices.XOR:
+                # Output is high only if both inputs are different
+                target = numpy.where(signals[0] == signals[1], devices.LOW,
+                                     devices.HIGH)
+            elif bus.device_kind == devices.NOT:
+                # Anything but HIGH leads the output towards HIGH, as the
+                # target None does in update_signal
+                target = numpy.where(signals[0] == devices.HIGH, devices.LOW,
+                                     devices.HIGH)
+            else:
+                target = numpy.where((signals == x).all(axis=0), y,
+                                     self.invert_signal(y))
+            targets = [(0, target)]
+
+        # Update the outputs towards their targets, as update_signal does
+        for row, target in targets:
+            signal = bus.outputs[row]
+            new_signal = self.signal_updates[signal, target]
+            if (new_signal != signal).any():
+                self.steady_state = False
+                self.transitions += int(numpy.count_nonzero(
+                    (new_signal == devices.RISING) |
+                    (new_signal == devices.FALLING)))
+                signal[:] = new_signal
+        return True
+
+    def reset_clocks(self):
+        """Restart the cycle count and schedule the first edge of every clock.
+
+        Each clock is described by its half period and its phase, the
+        clock_counter set at cold start-up. A clock with counter c changes
+        state after half_period - c + 1 cycles, then every half period.
+        The recorded metrics are cleared as well. Call this after every cold
+        start-up.
+        """
+        self.cycle_count = 0
+        self.metrics.reset()
+        self.clock_schedule = []
+        index = 0
+        for device in self.devices.devices_list:
+            if device.device_kind == self.devices.CLOCK:
+                first_edge = (device.clock_half_period -
+                              device.clock_counter + 1)
+                self.clock_schedule.append((first_edge, index, device))
+                index += 1
+        heapq.heapify(self.clock_schedule)
+
+    def get_clock_counter(self, device_id):
+        """Return the number of cycles since the last edge of the clock.
+
+        This is the value the clock counter would have if it was incremented
+        every cycle. Return None if device_id is not a scheduled clock.
+        """
+        if self.clock_schedule is None:
+            self.reset_clocks()
+        for next_edge, index, device in self.clock_schedule:
+            if device.device_id == device_id:
+                return (device.clock_half_period -
+                        (next_edge - self.cycle_count) + 1)
+        return None
+
+    def update_clocks(self):
+        """If it is time to do so, set clock signals to RISING or FALLING."""
+        if self.clock_schedule is None:
+            self.reset_clocks()
+        self.cycle_count += 1
+
+        schedule = self.clock_schedule
+        while schedule and schedule[0][0] == self.cycle_count:
+            edge_cycle, index, device = schedule[0]
+            output_signal = device.outputs[None]
+            if output_signal == self.devices.HIGH:
+                device.outputs[None] = self.devices.FALLING
+            elif output_signal == self.devices.LOW:
+                device.outputs[None] = self.devices.RISING
+            self.clock_edges += 1
+            # Schedule the next edge of this clock
+            heapq.heapreplace(schedule, (edge_cycle + device.clock_half_period,
+                                         index, device))
+
+    def elaborate(self):
+        """Prepare the built network for execution.
+
+        Sort the device IDs by kind in execution order and compute the logic
+        depth: the number of connections along the longest chain of devices,
+        where a feedback loop counts as a chain through all its devices.
+        This is called after the network is built, and again by
+        execute_network if devices or connections have been added since.
+        """
+        # Devices of the buses that can be executed in one go are replaced
+        # by their bus, so each kind becomes a list of runs: lists of device
+        # IDs and buses, in the order the devices were made
+        vector_buses = {}  # device ID: bus
+        for bus in self.devices.buses:
+            if self.vectorize_buses and self._can_vectorize(bus):
+                for device_id in bus.device_ids:
+                    vector_buses[device_id] = bus
+        device_lists = []
+        for device_kind in [self.devices.SWITCH, self.devices.D_TYPE,
+                            self.devices.CLOCK, self.devices.AND,
+                            self.devices.OR, self.devices.NAND,
+                            self.devices.NOR, self.devices.XOR,
+                            self.devices.NOT]:
+            runs = [[]]
+            for device_id in self.devices.find_devices(device_kind):
+                bus = vector_buses.get(device_id)
+                if bus is None:
+                    runs[-1].append(device_id)
+                elif device_id == bus.device_ids[0]:
+                    runs.extend([bus, []])
+            device_lists.append([run for run in runs if run != []])
+        self.device_lists = tuple(device_lists)
+        self.elaborated_devices = len(self.devices.devices_list)
+
+        successors = {device.device_id: []
+                      for device in self.devices.devices_list}
+        for device in self.devices.devices_list:
+            for connected_output in device.inputs.values():
+                if connected_output is not None:
+                    successors[connected_output[0]].append(device.device_id)
+
+        # Components come out of Tarjan's algorithm after every component
+        # they connect to, so the longest chain starting from each can be
+        # found in a single pass
+        component_of = {}
+        chain_length = []
+        for component in self._get_strong_components(successors):
+            longest = 0
+            for device_id in component:
+                for successor in successors[device_id]:
+                    if successor in component_of:
+                        longest = max(longest,
+                                      chain_length[component_of[successor]])
+            for device_id in component:
+                component_of[device_id] = len(chain_length)
+            chain_length.append(len(component) + longest)
+        self.logic_depth = max(chain_length, default=1) - 1
+
+    def get_iteration_limit(self):
+        """Return the number of iterations allowed for a cycle to settle.
+
+        This is iteration_limit if it has been set. Otherwise, every device
+        along the longest chain needs up to two iterations to reach its new
+        level (through RISING or FALLING), plus one iteration to confirm the
+        network has settled.
+        """
+        if self.iteration_limit is not None:
+            return self.iteration_limit
+        if (self.device_lists is None or
+                self.elaborated_devices != len(self.devices.devices_list)):
+            self.elaborate()
+        return 2 * (self.logic_depth + 1) + 1
+
+    def execute_network(self):
+        """Execute all the devices in the network for one simulation cycle.
+
+        Return True if successful and the network does not oscillate.
+        """
+        if (self.device_lists is None or
+                self.elaborated_devices != len(self.devices.devices_list)):
+            self.elaborate()
+        device_lists = self.device_lists
+        iteration_limit = self.get_iteration_limit()
+
+        self.transitions = 0
+        self.d_type_captures = 0
+        self.clock_edges = 0
+        self.oscillating_devices = []
+
+        # This sets clock signals to RISING or FALLING, where necessary
+        self.update_clocks()
+
+        iterations = 0
+        while iterations < iteration_limit:
+            iterations += 1
+            self.steady_state = True
+            if not self._execute_sweep(device_lists):
+                return False
+            if self.steady_state:
+                break
+        # Every sweep executes every device once
+        self.metrics.record_cycle(self.cycle_count, iterations,
+                                  iterations * self.elaborated_devices,
+                                  self.transitions, self.d_type_captures,
+                                  self.clock_edges)
+        if not self.steady_state:
+            # Changes are only tracked once the network has failed to settle,
+            # so stable networks pay nothing for the diagnostics
+            self.oscillating_devices = self._find_oscillating_loop(
+                device_lists)
+        return self.steady_state
+
+    def _execute_sweep(self, device_lists):
+        """Execute every device once, in the order given by device_lists.
+
+        device_lists holds the runs of switch, D-type, clock, AND, OR, NAND,
+        NOR, XOR and NOT devices. A run is either a list of device IDs or a
+        bus, executed at once. Return True if successful.
+        """
+        devices = self.devices
+        # Execute D-type devices before clocks to catch the rising edge of
+        # the clock. The (x, y) pairs are those of execute_gate.
+        executions = [
+            (self.execute_switch, ()), (self.execute_d_type, ()),
+            (self.execute_clock, ()),
+            (self.execute_gate, (devices.HIGH, devices.HIGH)),  # AND
+            (self.execute_gate, (devices.LOW, devices.LOW)),  # OR
+            (self.execute_gate, (devices.HIGH, devices.LOW)),  # NAND
+            (self.execute_gate, (devices.LOW, devices.HIGH)),  # NOR
+            (self.execute_gate, (None, None)),  # XOR
+            (self.execute_gate, (None, None))]  # NOT
+
+        for runs, (execute, levels) in zip(device_lists, executions):
+            for run in runs:
+                if run.__class__ is not list:
+                    if not self.execute_bus(run, *levels):
+                        return False
+                elif levels:
+                    x, y = levels
+                    for device_id in run:
+                        if not execute(device_id, x, y):
+                            return False
+                else:
+                    for device_id in run:
+                        if not execute(device_id):
+                            return False
+        return True
+
+    def _can_vectorize(self, bus):
+        """Return True if the bus can be executed as one array operation.
+
+        Every input must be connected, and no device may be connected to
+        another device of the same bus. Otherwise the result could depend
+        on the order the devices are executed in, and the bus devices are
+        executed one by one like any other device.
+        """
+        connected_devices = bus.connected_devices
+        if bus.size == 0 or (connected_devices == -1).any():
+            return False
+        return not numpy.isin(connected_devices, bus.device_ids).any()
+
+    def _get_bus_inputs(self, bus):
+        """Return where to gather the input signals of a bus from.
+
+        The result is (connection changes, signals, slices, single inputs).
+        signals is the array the inputs are gathered into, with one row per
+        input ID. Inputs connected to consecutive outputs of another bus
+        are gathered as slices of the form (row, start, stop, source bus
+        outputs, source row, source start). Inputs connected to the output
+        of a device outside any bus are single inputs of the form (row,
+        start, stop, outputs, port ID), with consecutive inputs connected
+        to the same output filled from outputs[port ID] at once. Return
+        None if an input is unconnected.
+        """
+        signals = numpy.zeros((len(bus.input_ids), bus.size),
+                              dtype=numpy.int8)
+        slices = []
+        single_inputs = []
+        for row, input_id in enumerate(bus.input_ids):
+            for index in range(bus.size):
+                connected_output = bus.get_connected_output(index, input_id)
+                if connected_output is None:
+                    return None
+                output_device_id, output_port_id = connected_output
+                output_device = self.devices.get_device(output_device_id)
+                source_bus = getattr(output_device, "bus", None)
+                if source_bus is None:
+                    source = output_device.outputs
+                    if single_inputs:
+                        (last_row, start, stop, last_source,
+                         last_port_id) = single_inputs[-1]
+                        if (last_row == row and stop == index and
+                                last_source is source and
+                                last_port_id == output_port_id):
+                            single_inputs[-1] = (row, start, index + 1,
+                                                 source, output_port_id)
+                            continue
+                    single_inputs.append((row, index, index + 1, source,
+                                          output_port_id))
+                    continue
+                source = source_bus.outputs
+                source_row = source_bus.output_rows[output_port_id]
+                if slices:
+                    (last_row, start, stop, last_source, last_source_row,
+                     source_start) = slices[-1]
+                    if (last_row == row and stop == index and
+                            last_source is source and
+                            last_source_row == source_row and
+                            source_start + stop - start ==
+                            output_device.index):
+                        slices[-1] = (row, start, index + 1, source,
+                                      source_row, source_start)
+                        continue
+                slices.append((row, index, index + 1, source, source_row,
+                               output_device.index))
+        return (bus.connection_changes, signals, slices, single_inputs)
+
+    def _find_oscillating_loop(self, device_lists):
+        """Return the IDs of the devices in the smallest oscillating loop.
+
+        A few more sweeps are executed on the unsettled network to find the
+        devices whose outputs keep changing. The loop is the smallest
+        strongly connected component of the connections between them that
+        contains a cycle. If there is none, all the changing devices are
+        returned. The outputs and D-type memories are restored afterwards,
+        so the network is left as the failed cycle left it.
+        """
+        devices_list = self.devices.devices_list
+        bus_device_ids = set([device_id for bus in self.devices.buses
+                              for device_id in bus.device_ids])
+        saved_devices = [(device, dict(device.outputs), device.dtype_memory)
+                         for device in devices_list
+                         if device.device_id not in bus_device_ids]
+        saved_buses = [(bus, bus.outputs.copy(), bus.dtype_memory.copy())
+                       for bus in self.devices.buses]
+        saved_counts = (self.transitions, self.d_type_captures,
+                        self.clock_edges)
+
+        changing = set()
+        for sweep in range(self.diagnostic_sweeps):
+            previous = [list(device.outputs.values())
+                        for device in devices_list]
+            self.steady_state = True
+            if not self._execute_sweep(device_lists):
+                break
+            for device, outputs in zip(devices_list, previous):
+                if list(device.outputs.values()) != outputs:
+                    changing.add(device.device_id)
+        self.steady_state = False
+
+        for device, outputs, memory in saved_devices:
+            device.outputs.update(outputs)
+            device.dtype_memory = memory
+        for bus, outputs, memory in saved_buses:
+            bus.outputs[...] = outputs
+            bus.dtype_memory[...] = memory
+        (self.transitions, self.d_type_captures,
+         self.clock_edges) = saved_counts
+
+        # Connections from one changing device to another
+        successors = {device_id: [] for device_id in changing}
+        for device in devices_list:
+            if device.device_id not in changing:
+                continue
+            for connected_output in device.inputs.values():
+                if connected_output is None:
+                    continue
+                if connected_output[0] in changing:
+                    successors[connected_output[0]].append(device.device_id)
+
+        loops = [component for component
+                 in self._get_strong_components(successors)
+                 if len(component) > 1 or
+                 component[0] in successors[component[0]]]
+        if not loops:
+            loop = changing
+        else:
+            loop = min(loops, key=len)
+        return [device.device_id for device in devices_list
+                if device.device_id in loop]
+
+    def _get_strong_components(self, successors):
+        """Return the strongly connected components of a directed graph.
+
+        successors maps every vertex to the list of vertices it connects to.
+        This is an iterative version of Tarjan's algorithm, so deep networks
+        do not hit the recursion limit.
+        """
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        components = []
+        for root in successors:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(successors[root]))]
+            while work:
+                vertex, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(successors[child])))
+                        break
+                    elif child in on_stack:
+                        lowlink[vertex] = min(lowlink[vertex], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent],
+                                              lowlink[vertex])
+                    if lowlink[vertex] == index[vertex]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == vertex:
+                                break
+                        components.append(component)
+        return components
+
+    def execute_cycles(self, cycles, monitors=None, progress=None):
+        """Execute the network for the specified number of simulation cycles.
+
+        If monitors is given, the monitored signals are recorded after every
+        cycle. Once the network has settled, no signal can change until the
+        next clock edge, so those idle cycles are recorded in one go instead
+        of being executed.
+
+        A digest of the full state of the network is also stored at every
+        clock boundary, so the memory used does not grow with the size of
+        the network. When a digest is seen again, the state is kept and the
+        network is run for one more period to confirm the state really
+        repeats. As the simulation is deterministic, the cycles of that
+        period then repeat forever, so the rest of the run is recorded by
+        repeating them. The period found is kept in detected_period.
+
+        If progress is given, it is called with the number of cycles
+        completed so far after every step of the run, and the run stops
+        early if it returns False. The number of cycles completed is kept in
+        cycles_run.
+
+        Return True if successful and the network does not oscillate.
+        """
+        switches = [device for device in self.devices.devices_list
+                    if device.device_kind == self.devices.SWITCH]
+        bus_device_ids = set([device_id for bus in self.devices.buses
+                              for device_id in bus.device_ids])
+        plain_devices = [device for device in self.devices.devices_list
+                         if device.device_id not in bus_device_ids]
+        d_types = [device for device in plain_devices
+                   if device.device_kind == self.devices.D_TYPE]
+        self.detected_period = None
+        states = {}  # completed cycles at which each state digest was seen
+        candidate = None  # (state, cycles completed, period) to confirm
+        completed = 0
+        self.cycles_run = 0
+        while completed < cycles:
+            if not self.execute_network():
+                return False
+            completed += 1
+            idle_cycles = self._get_idle_cycles(switches, cycles - completed)
+            self.cycle_count += idle_cycles
+            if monitors is not None:
+                monitors.record_signals(1 + idle_cycles)
+            completed += idle_cycles
+
+            # Only look for a repeat at clock boundaries, that is when the
+            # next cycle has a clock edge
+            if (self.detected_period is None and self.clock_schedule and
+                    self.clock_schedule[0][0] == self.cycle_count + 1):
+                state = self._get_state(plain_devices, d_types)
+                if candidate is not None:
+                    candidate_state, seen, period = candidate
+                    if completed - seen < period:
+                        pass  # keep waiting for the period to end
+                    elif completed - seen == period and \
+                            state == candidate_state:
+                        repeats = (cycles - completed) // period
+                        self.detected_period = period
+                        self._skip_cycles(period * repeats)
+                        if monitors is not None:
+                            monitors.repeat_signals(period, repeats)
+                        completed += period * repeats
+                        candidate = None
+                    else:
+                        candidate = None  # the digests only collided
+                if self.detected_period is None and candidate is None:
+                    digest = hash(state)
+                    if digest in states:
+                        candidate = (state, completed,
+                                     completed - states[digest])
+                    elif len(states) < self.state_history_limit:
+                        states[digest] = completed
+
+            self.cycles_run = completed
+            if progress is not None and not progress(completed):
+                break
+        return True
+
+    def _get_idle_cycles(self, switches, limit):
+        """Return the number of upcoming cycles in which no signal can change.
+
+        This assumes the last executed cycle has settled. The network then
+        stays as it is until the next clock edge, unless a switch has been
+        set since. The result is at most limit.
+        """
+        for device in switches:
+            if device.outputs[None] != device.switch_state:
+                return 0
+        if self.clock_schedule:
+            next_edge = self.clock_schedule[0][0]
+            return min(next_edge - self.cycle_count - 1, limit)
+        return limit
+
+    def _get_state(self, devices_list, d_types):
+        """Return the full state of the network as a hashable tuple.
+
+        This is every output signal, every D-type memory and the number of
+        cycles left until the next edge of every clock. Switch states are
+        not included as they cannot change during execute_cycles. The
+        devices in devices_list and d_types are read one by one, while the
+        devices of buses are read from the bus arrays.
+        """
+        outputs = tuple([signal for device in devices_list
+                         for signal in device.outputs.values()])
+        memories = tuple([device.dtype_memory for device in d_types])
+        buses = tuple([bus.outputs.tobytes() + bus.dtype_memory.tobytes()
+                       for bus in self.devices.buses])
+        phases = tuple(sorted([(index, next_edge - self.cycle_count)
+                               for next_edge, index, device
+                               in self.clock_schedule]))
+        return (outputs, memories, buses, phases)
+
+    def _skip_cycles(self, skipped):
+        """Move every scheduled clock edge forward by skipped cycles.
+
+        The cycle count moves by the same amount, so the network is left in
+        the same state as after simulating the skipped cycles.
+        """
+        self.cycle_count += skipped
+        # Shifting every entry by the same amount keeps the heap ordered
+        self.clock_schedule = [(next_edge + skipped, index, device)
+                               for next_edge, index, device
+                               in self.clock_schedule]
@@ -0,0 +1,219 @@
+"""Record where the Logic Simulator spends its time.
+
+Used in the Logic Simulator project to measure the wall time and call
+counts of each phase of a run (scanning, parsing, making devices,
+elaborating, executing and recording monitors) and of each kind of device
+executed, or, in a separate run, the peak memory of each phase.
+
+Classes
+-------
+Profiler - records and reports timings of the simulator phases.
+"""
+import time
+import tracemalloc
+
+
+class Profiler:
+
+    """Record and report timings of the simulator phases.
+
+    This class replaces methods of the simulator objects with timed
+    versions. The replacements are set on the instances only, and only when
+    profiling is asked for, so a normal run pays nothing for it.
+
+    Tracing memory slows every allocation down, which would distort the
+    timings, so it is only done if trace_memory is True. The report of such
+    a run gives the peak memory of each phase, above the memory in use when
+    the phase started, instead of its time.
+
+    Parameters
+    ----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    trace_memory: True to report peak memory instead of timings.
+
+    Public methods
+    --------------
+    instrument(self, obj, method_name, phase): Times every call to a method
+                                               of obj as the given phase.
+
+    instrument_simulator(self, devices, network, monitors): Times the
+                          device, network and monitor phases.
+
+    instrument_parser(self, scanner, parser): Times scanning and parsing.
+
+    instrument_network(self, network): Times the network phases and the
+                                       execution of each kind of device.
+
+    get_rows(self): Returns the recorded statistics as table rows.
+
+    print_report(self): Prints a summary table of the statistics.
+
+    Non-public methods
+    ------------------
+    _record(self, statistics, key, seconds, peak): Adds one call to the
+                                                  statistics of key.
+    """
+
+    def __init__(self, names, devices, trace_memory=False):
+        """Initialise the statistics and start tracing memory if asked."""
+        self.names = names
+        self.devices = devices
+        self.trace_memory = trace_memory
+        # Phase or device kind name: [calls, seconds, peak bytes]
+        self.phases = {}
+        self.device_kinds = {}
+        # Peak memory so far of every phase being traced, innermost last
+        self.peaks = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def instrument(self, obj, method_name, phase):
+        """Time every call to obj.method_name and record it as phase.
+
+        Calls made from inside another timed phase are included in the time
+        and peak memory of both phases.
+        """
+        method = getattr(obj, method_name)
+        phases = self.phases
+        record = self._record
+
+        def timed_method(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            record(phases, phase, time.perf_counter() - start, 0)
+            return result
+
+        peaks = self.peaks
+
+        def traced_method(*args, **kwargs):
+            # Resetting the peak loses that of the enclosing phase, so it is
+            # carried in peaks
+            current, peak = tracemalloc.get_traced_memory()
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+            peaks.append(0)
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+            record(phases, phase, seconds, peak - current)
+            return result
+
+        if self.trace_memory:
+            setattr(obj, method_name, traced_method)
+        else:
+            setattr(obj, method_name, timed_method)
+
+    def instrument_simulator(self, devices, network, monitors):
+        """Time making devices, the network phases and recording monitors."""
+        self.instrument(devices, "make_device", "Devices.make_device")
+        self.instrument(devices, "make_bus", "Devices.make_bus")
+        self.instrument_network(network)
+        self.instrument(monitors, "record_signals", "Monitors.record_signals")
+        self.instrument(monitors, "repeat_signals", "Monitors.repeat_signals")
+
+    def instrument_parser(self, scanner, parser):
+        """Time reading symbols and parsing the definition file."""
+        self.instrument(scanner, "get_symbol", "Scanner.get_symbol")
+        self.instrument(parser, "parse_network", "Parser.parse_network")
+
+    def instrument_network(self, network):
+        """Time the network phases and each kind of device executed.
+
+        A run of cycles is timed as a whole as well as cycle by cycle, since
+        cycles that are skipped or repeated never execute the network.
+        Devices are not timed when tracing memory, as their timings would
+        not be reported.
+        """
+        self.instrument(network, "elaborate", "Network.elaborate")
+        self.instrument(network, "execute_cycles", "Network.execute_cycles")
+        self.instrument(network, "execute_network",
+                        "Network.execute_network")
+        if self.trace_memory:
+            return
+        device_kinds = self.device_kinds
+        record = self._record
+        get_device = self.devices.get_device
+        get_name_string = self.names.get_name_string
+        kind_names = {}  # device kind ID: name, looked up once per kind
+
+        for method_name in ["execute_switch", "execute_d_type",
+                            "execute_clock", "execute_gate"]:
+            method = getattr(network, method_name)
+
+            def timed_method(device_id, *args, method=method):
+                start = time.perf_counter()
+                result = method(device_id, *args)
+                seconds = time.perf_counter() - start
+                kind = get_device(device_id).device_kind
+                if kind not in kind_names:
+                    kind_names[kind] = get_name_string(kind)
+                record(device_kinds, kind_names[kind], seconds, 0)
+                return result
+
+            setattr(network, method_name, timed_method)
+
+        # A bus is timed under the kind of its devices
+        execute_bus = network.execute_bus
+
+        def timed_execute_bus(bus, *args):
+            start = time.perf_counter()
+            result = execute_bus(bus, *args)
+            seconds = time.perf_counter() - start
+            kind = bus.device_kind
+            if kind not in kind_names:
+                kind_names[kind] = get_name_string(kind)
+            record(device_kinds, kind_names[kind], seconds, 0)
+            return result
+
+        network.execute_bus = timed_execute_bus
+
+    def get_rows(self):
+        """Return a list of [name, calls, seconds, peak bytes] table rows.
+
+        The phases come first, followed by the device kinds, slowest first,
+        or with the largest peak first when tracing memory. The peak of a
+        phase is the largest over all its calls.
+        """
+        column = 2 if self.trace_memory else 1
+        rows = []
+        for statistics in [self.phases, self.device_kinds]:
+            for name, [calls, seconds, peak] in sorted(
+                    statistics.items(), key=lambda item: -item[1][column]):
+                rows.append([name, calls, seconds, peak])
+        return rows
+
+    def print_report(self):
+        """Print a summary table of the recorded statistics.
+
+        The table gives the timings, or only the peak memory when tracing
+        memory, as the timings are then distorted.
+        """
+        if self.trace_memory:
+            row = "{:<28}{:>10}{:>14}"
+            print("\n" + row.format("Phase", "Calls", "Peak KiB"))
+            for name, calls, seconds, peak in self.get_rows():
+                print(row.format(name, calls, "{:.1f}".format(peak / 1024)))
+            return
+
+        row = "{:<28}{:>10}{:>12}{:>14}"
+        print("\n" + row.format("Phase", "Calls", "Seconds", "us/call"))
+        for name, calls, seconds, peak in self.get_rows():
+            if name in self.device_kinds:
+                name = "  execute " + name
+            print(row.format(name, calls, "{:.4f}".format(seconds),
+                             "{:.2f}".format(seconds / calls * 1e6)))
+
+    def _record(self, statistics, key, seconds, peak):
+        """Add one call taking seconds and peaking at peak bytes to key."""
+        if key in statistics:
+            entry = statistics[key]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], peak)
+        else:
+            statistics[key] = [1, seconds, peak]
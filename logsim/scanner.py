@@ -1,360 +1,659 @@
-"""Read the circuit definition file and translate the characters into symbols.
-
-Used in the Logic Simulator project to read the characters in the definition
-file and translate them into symbols that are usable by the parser.
-
-Classes
--------
-Scanner - reads definition file and translates characters into symbols.
-Symbol - encapsulates a symbol and stores its properties.
-"""
-from os.path import exists
-
-
-class Symbol:
-    """Encapsulate a symbol and store its properties.
-
-    Parameters
-    ----------
-    No parameters.
-
-    Public methods
-    --------------
-    No public methods.
-    """
-
-    def __init__(self):
-        """Initialise symbol properties."""
-        self.type = None
-        self.id = None
-
-        self.val = None
-
-        self.current_index = None
-        self.line_number = None     
-
-    def get_dict(self):
-        """TODO: remove this?"""
-        return {'type': self.type, 'id': self.id}
-
-
-class Scanner:
-    """Read circuit definition file and translate the characters into symbols.
-
-    Once supplied with the path to a valid definition file, the scanner
-    translates the sequence of characters in the definition file into symbols
-    that the parser can use. It also skips over comments and irrelevant
-    formatting characters, such as spaces and line breaks.
-
-    Parameters
-    ----------
-    path: path to the circuit definition file.
-    names: instance of the names.Names() class.
-
-    Public methods
-    -------------
-    get_symbol(self): Translates the next sequence of characters into a symbol
-                      and returns the symbol.
-    get_line_details(self, line_number=None): Get line number, line and
-        position of the current character.
-
-    Sub-Classes
-    -----------
-    FileHandler: Reads the definition file and extracts names and numbers.
-    """
-
-    def __init__(self, path, names):
-        """Open specified file and initialise reserved words and IDs."""
-
-        self.names = names
-
-        self.symbol_type_list = [
-            self.KEYWORD, self.NUMBER, self.NAME,
-            self.COMMA, self.SEMICOLON, self.EQUALS, self.CONNECTION,
-            self.EOF, self.FULLSTOP,
-            self.OPEN_PARENTHESIS, self.CLOSE_PARENTHESIS,
-            self.OPEN_SQUARE_BRACKET, self.CLOSE_SQUARE_BRACKET,
-            self.TO, self.IN, self.OUT, self.PERIOD,
-            self.OPEN_CURLY_BRACKET, self.CLOSE_CURLY_BRACKET,
-        ] = range(19)
-
-        self.unichar_punctuation = {
-            ',': self.COMMA, ';': self.SEMICOLON, '=': self.EQUALS,
-            '': self.EOF, '.': self.FULLSTOP,
-            '(': self.OPEN_PARENTHESIS, ')': self.CLOSE_PARENTHESIS,
-            '[': self.OPEN_SQUARE_BRACKET, ']': self.CLOSE_SQUARE_BRACKET,
-            '{': self.OPEN_CURLY_BRACKET, '}': self.CLOSE_CURLY_BRACKET,
-        }
-
-
-
-        self.alpha_punctuation = {'TO': self.TO, 'IN': self.IN,
-                                  'OUT': self.OUT, 'PERIOD': self.PERIOD}
-
-        self.keywords_list = ['AND', 'OR', 'NAND', 'NOR', 'XOR', 'DTYPE',
-                              'CONNECT', 'CIRCUIT', 'MONITOR', 'CLOCK',
-                              'SWITCH', 'NOT', 'CIRCUIT', 'INPUT', 'OUTPUT']
-
-        [self.AND_ID, self.OR_ID, self.NAND_ID, self.NOR_ID, self.XOR_ID,
-         self.DTYPE_ID, self.CONNECT_ID, self.CIRCUIT_ID, self.MONITOR_ID,
-         self.CLOCK_ID, self.SWITCH_ID, self.NOT_ID, self.CIRCUIT_ID,
-         self.INPUT_ID, self.OUTPUT_ID,
-         ] = self.names.lookup(self.keywords_list)
-
-        self.fileHandler = Scanner.FileHandler(path)
-
-    def get_symbol(self):
-        """Translate the next sequence of characters into a symbol."""
-        symbol = Symbol()
-        self.fileHandler.skip_formatting()
-
-        if self.fileHandler.current_character.isalpha():
-            name_string = self.fileHandler.get_name()
-
-            symbol.val = name_string
-
-            if name_string in self.keywords_list:
-                symbol.type = self.KEYWORD
-                [symbol.id] = self.names.lookup([name_string])
-                symbol.current_index = self.fileHandler.current_index
-
-            elif name_string in self.alpha_punctuation:
-                symbol.type = self.alpha_punctuation[name_string]
-                symbol.current_index = self.fileHandler.current_index
-            else:
-                symbol.type = self.NAME
-                [symbol.id] = self.names.lookup([name_string])
-                symbol.line_number = self.fileHandler.line_number
-                symbol.current_index = self.fileHandler.current_index
-
-        elif self.fileHandler.current_character.isdigit():
-            symbol.id = self.fileHandler.get_number()
-            symbol.type = self.NUMBER
-            symbol.current_index = self.fileHandler.current_index
-            symbol.val = symbol.id  # only for debugging, remove later
-
-        elif self.fileHandler.current_character in self.unichar_punctuation:
-            symbol.type = self.unichar_punctuation[
-                self.fileHandler.current_character]
-
-            symbol.val = self.fileHandler.current_character
-            symbol.current_index = self.fileHandler.current_index
-
-            self.fileHandler.advance()
-        else:
-            name_str = self.fileHandler.get_2chars()
-
-            if name_str == '->':
-                symbol.type = self.CONNECTION
-            else:
-                symbol.type = None
-            symbol.current_index = self.fileHandler.current_index
-            symbol.val = self.fileHandler.current_character
-
-        return symbol
-
-    def get_line_details(self, line_number=None):
-        """Get line number, line and position of the current character.
-
-        Useful for printing out errors."""
-        if line_number is None:
-            if self.fileHandler.line_number < len(self.fileHandler.lines):
-                return(self.fileHandler.line_number + 1,
-                       self.fileHandler.lines[self.fileHandler.line_number],
-                       self.fileHandler.current_index - 1)
-            else:
-                return(self.fileHandler.line_number,
-                       self.fileHandler.lines[
-                           self.fileHandler.line_number - 1],
-                       self.fileHandler.current_index - 1)
-        else:
-            return line_number + 1, self.fileHandler.lines[line_number], None
-
-    class FileHandler:
-        """Reads the definition file and extracts names and numbers.
-
-        This class contains many helper functions to read and extract data from
-        the definition file. It skips over irrelevant formatting characters,
-        such as spaces and line breaks.
-
-        Parameters
-        ----------
-        path - path to the definition file.
-        skip_spaces(self): Skips spaces such that current character is not
-                           a space
-
-        Public methods
-        --------------
-        advance(self): Reads and returns the next character in the file.
-
-        skip_formatting(self): Skips all comments and whitespaces and return
-                               the next character.
-
-        get_number(self): Returns the number beginning at the current pointer
-                          location.
-
-        get_name(self): Returns the name beginning at current pointer location
-                        in file.
-
-        get_2chars(self): Return the next 2 character.
-
-        close(self): Closes the file.
-
-        Private methods
-        --------------
-        _skip_spaces(self): Skips spaces and returns the next character.
-
-        _skip_comments(self): Skips all comments and returns the next
-                              character.
-
-        _get_next_line(self): Skips the pointer to the next line and returns
-                              the first character.
-        """
-
-        def __init__(self, path):
-            """Open the file specified by the path."""
-            if exists("definition_files/" + path):
-                path = "definition_files/" + path
-            
-            self.file = open(path, 'r')
-
-            self.lines = self.file.readlines()
-            if len(self.lines) > 0:
-                self.lines[-1] += '\n'
-            self.lines.append(' \n')
-
-            self.line_number = 0
-            self.current_index = -1
-
-            self.current_character = None
-            self.advance()
-
-        def advance(self):
-            """ Reads and returns the next character in the file."""
-
-            if self.line_number >= len(self.lines):
-                return ''
-
-            self.current_index += 1
-
-            if self.current_index >= len(self.lines[self.line_number]):
-                self.line_number += 1
-
-
-                self.current_index = 0
-
-            if self.line_number >= len(self.lines):
-                self.current_character = ''
-            else:
-                self.current_character = \
-                    self.lines[self.line_number][self.current_index]
-
-            return self.current_character
-
-        def _skip_spaces(self):
-            """ Skips spaces and returns the next character."""
-            c = self.current_character
-
-            while c.isspace():
-                c = self.advance()
-
-            self.current_character = c
-
-            return c
-
-        def _skip_comments(self):
-            """ Skips all comments and returns the next character."""
-            c = self.current_character
-
-            while c == '#':
-                c = self._get_next_line()
-
-            self.current_character = c
-
-            return c
-
-        def skip_formatting(self):
-            """ Skips all comments and whitespaces and return the next
-            character."""
-            c = self.current_character
-
-            while c.isspace() or c == '#':
-                self._skip_spaces()
-                c = self._skip_comments()
-
-            self.current_character = c
-
-            return c
-
-        def get_number(self):
-            """ Returns the number beginning at the current pointer location.
-            """
-            c = self.current_character
-
-            if not c.isdigit():
-                raise ValueError('Current character expected to be a number.')
-
-            str_number = c
-
-            c = self.advance()
-            while c.isdigit():
-                str_number += c
-                c = self.advance()
-
-            self.current_character = c
-
-            return int(str_number)
-
-        def get_name(self):
-            """ Returns the name beginning at current pointer location in file.
-            """
-
-            c = self.current_character
-
-            if not c.isalpha():
-                raise ValueError('Current character expected '
-                                 'to be a alphabet.')
-
-            name = c        
-
-            c = self.advance()
-
-            while c.isalnum():
-                name += c
-                c = self.advance()
-
-            self.current_character = c
-
-            return name
-
-        def get_2chars(self):
-            """ Return the next 2 character."""
-            c = self.current_character
-
-            str_name = c
-
-            c = self.advance()
-            str_name += c
-
-            c = self.advance()
-            self.current_character = c
-
-            return str_name
-
-        def _get_next_line(self):
-            """ Skips the pointer to the next line and returns the first
-            character."""
-            c = self.current_character
-            while c != '\n' and c != '\r' and c != '':
-                c = self.advance()
-
-            c = self._skip_spaces()
-
-            if c == '':
-                c = None
-
-            return c
-
-        def close(self):
-            """Closes the file."""
-            self.file.close()
+"""Read the circuit definition file and translate the characters into symbols.
+
+Used in the Logic Simulator project to read the characters in the definition
+file and translate them into symbols that are usable by the parser.
+
+Classes
+-------
+Scanner - reads definition file and translates characters into symbols.
+Symbol - encapsulates a symbol and stores its properties.
+"""
+import mmap
+import re
+from os.path import exists, getsize
+
+
+class Symbol:
+    """Encapsulate a symbol and store its properties.
+
+    Parameters
+    ----------
+    No parameters.
+
+    Public methods
+    --------------
+    No public methods.
+    """
+
+    def __init__(self):
+        """Initialise symbol properties."""
+        self.type = None
+        self.id = None
+
+        self.val = None
+
+        self.current_index = None
+        self.line_number = None     
+
+    def get_dict(self):
+        """TODO: remove this?"""
+        return {'type': self.type, 'id': self.id}
+
+
+class Scanner:
+    """Read circuit definition file and translate the characters into symbols.
+
+    Once supplied with the path to a valid definition file, the scanner
+    translates the sequence of characters in the definition file into symbols
+    that the parser can use. It also skips over comments and irrelevant
+    formatting characters, such as spaces and line breaks.
+
+    The file is either read line by line or, if mapped is True,
+    memory-mapped and scanned straight from the mapped bytes. Mapping saves
+    holding the lines of the file in memory, but every symbol is still made
+    by get_symbol, so a large file is scanned only a few percent faster.
+
+    Parameters
+    ----------
+    path: path to the circuit definition file.
+    names: instance of the names.Names() class.
+    mapped: True to memory-map the file rather than read it line by line.
+
+    Public methods
+    -------------
+    get_symbol(self): Translates the next sequence of characters into a symbol
+                      and returns the symbol.
+    get_location(self, line_number=None): Get line number and position of
+        the current character.
+    get_line_details(self, line_number=None): Get line number, line and
+        position of the current character.
+    get_line(self, line_number): Get the text of a line from its number.
+
+    Sub-Classes
+    -----------
+    FileHandler: Reads the definition file and extracts names and numbers.
+
+    MappedFileHandler: FileHandler that scans a memory-mapped file.
+    """
+
+    def __init__(self, path, names, mapped=False):
+        """Open specified file and initialise reserved words and IDs."""
+
+        self.names = names
+
+        self.symbol_type_list = [
+            self.KEYWORD, self.NUMBER, self.NAME,
+            self.COMMA, self.SEMICOLON, self.EQUALS, self.CONNECTION,
+            self.EOF, self.FULLSTOP,
+            self.OPEN_PARENTHESIS, self.CLOSE_PARENTHESIS,
+            self.OPEN_SQUARE_BRACKET, self.CLOSE_SQUARE_BRACKET,
+            self.TO, self.IN, self.OUT, self.PERIOD,
+            self.OPEN_CURLY_BRACKET, self.CLOSE_CURLY_BRACKET,
+            self.STAR,
+        ] = range(20)
+
+        self.unichar_punctuation = {
+            ',': self.COMMA, ';': self.SEMICOLON, '=': self.EQUALS,
+            '': self.EOF, '.': self.FULLSTOP,
+            '(': self.OPEN_PARENTHESIS, ')': self.CLOSE_PARENTHESIS,
+            '[': self.OPEN_SQUARE_BRACKET, ']': self.CLOSE_SQUARE_BRACKET,
+            '{': self.OPEN_CURLY_BRACKET, '}': self.CLOSE_CURLY_BRACKET,
+            '*': self.STAR,
+        }
+
+
+
+        self.alpha_punctuation = {'TO': self.TO, 'IN': self.IN,
+                                  'OUT': self.OUT, 'PERIOD': self.PERIOD}
+
+        self.keywords_list = ['AND', 'OR', 'NAND', 'NOR', 'XOR', 'DTYPE',
+                              'CONNECT', 'CIRCUIT', 'MONITOR', 'CLOCK',
+                              'SWITCH', 'NOT', 'CIRCUIT', 'INPUT', 'OUTPUT']
+
+        [self.AND_ID, self.OR_ID, self.NAND_ID, self.NOR_ID, self.XOR_ID,
+         self.DTYPE_ID, self.CONNECT_ID, self.CIRCUIT_ID, self.MONITOR_ID,
+         self.CLOCK_ID, self.SWITCH_ID, self.NOT_ID, self.CIRCUIT_ID,
+         self.INPUT_ID, self.OUTPUT_ID,
+         ] = self.names.lookup(self.keywords_list)
+
+        if mapped:
+            self.fileHandler = Scanner.MappedFileHandler(path)
+        else:
+            self.fileHandler = Scanner.FileHandler(path)
+
+    def get_symbol(self):
+        """Translate the next sequence of characters into a symbol."""
+        symbol = Symbol()
+        self.fileHandler.skip_formatting()
+
+        if self.fileHandler.current_character.isalpha():
+            name_string = self.fileHandler.get_name()
+
+            symbol.val = name_string
+
+            if name_string in self.keywords_list:
+                symbol.type = self.KEYWORD
+                [symbol.id] = self.names.lookup([name_string])
+                symbol.current_index = self.fileHandler.current_index
+
+            elif name_string in self.alpha_punctuation:
+                symbol.type = self.alpha_punctuation[name_string]
+                symbol.current_index = self.fileHandler.current_index
+            else:
+                symbol.type = self.NAME
+                [symbol.id] = self.names.lookup([name_string])
+                symbol.line_number = self.fileHandler.line_number
+                symbol.current_index = self.fileHandler.current_index
+
+        elif self.fileHandler.current_character.isdigit():
+            symbol.id = self.fileHandler.get_number()
+            symbol.type = self.NUMBER
+            symbol.current_index = self.fileHandler.current_index
+            symbol.val = symbol.id  # only for debugging, remove later
+
+        elif self.fileHandler.current_character in self.unichar_punctuation:
+            symbol.type = self.unichar_punctuation[
+                self.fileHandler.current_character]
+
+            symbol.val = self.fileHandler.current_character
+            symbol.current_index = self.fileHandler.current_index
+
+            self.fileHandler.advance()
+        else:
+            name_str = self.fileHandler.get_2chars()
+
+            if name_str == '->':
+                symbol.type = self.CONNECTION
+            else:
+                symbol.type = None
+            symbol.current_index = self.fileHandler.current_index
+            symbol.val = self.fileHandler.current_character
+
+        return symbol
+
+    def get_location(self, line_number=None):
+        """Get line number and position of the current character.
+
+        Useful for recording errors, as the text of the line is only needed
+        when the errors are displayed."""
+        if line_number is None:
+            if self.fileHandler.current_character != '':
+                return(self.fileHandler.line_number + 1,
+                       self.fileHandler.current_index - 1)
+            else:
+                return(self.fileHandler.line_number,
+                       self.fileHandler.current_index - 1)
+        else:
+            return(line_number + 1, None)
+
+    def get_line_details(self, line_number=None):
+        """Get line number, line and position of the current character.
+
+        Useful for printing out errors."""
+        line_number, position = self.get_location(line_number)
+        return(line_number, self.get_line(line_number), position)
+
+    def get_line(self, line_number):
+        """Get the text of a line, counting lines from 1.
+
+        Used by the error handler to show the line of an error only when
+        the errors are displayed."""
+        return self.fileHandler.get_line(line_number - 1)
+
+    class FileHandler:
+        """Reads the definition file and extracts names and numbers.
+
+        This class contains many helper functions to read and extract data from
+        the definition file. It skips over irrelevant formatting characters,
+        such as spaces and line breaks.
+
+        Only the current line is kept in memory. The position where each line
+        starts in the file is recorded as it is read, so get_line can seek
+        back to any earlier line to show it in an error message.
+
+        Parameters
+        ----------
+        path - path to the definition file.
+        skip_spaces(self): Skips spaces such that current character is not
+                           a space
+
+        Public methods
+        --------------
+        advance(self): Reads and returns the next character in the file.
+
+        skip_formatting(self): Skips all comments and whitespaces and return
+                               the next character.
+
+        get_number(self): Returns the number beginning at the current pointer
+                          location.
+
+        get_name(self): Returns the name beginning at current pointer location
+                        in file.
+
+        get_2chars(self): Return the next 2 character.
+
+        get_line(self, index): Returns the line with the given index, counting
+                               from 0.
+
+        close(self): Closes the file.
+
+        find(path): Returns the path of the definition file.
+
+        Private methods
+        --------------
+        _skip_spaces(self): Skips spaces and returns the next character.
+
+        _skip_comments(self): Skips all comments and returns the next
+                              character.
+
+        _get_next_line(self): Skips the pointer to the next line and returns
+                              the first character.
+
+        _read_line(self): Reads the next line and records where it starts.
+        """
+
+        def __init__(self, path):
+            """Open the file specified by the path."""
+            self.file = open(Scanner.FileHandler.find(path), 'r')
+
+            self.line_offsets = []  # where each line read so far starts
+            self.next_offset = self.file.tell()
+            self.next_line = self.file.readline()
+            self.finished = False  # True once the blank last line is read
+
+            self.line_number = 0
+            self.line = self._read_line()  # None after the end of the file
+            self.current_index = -1
+
+            self.current_character = None
+            self.advance()
+
+        def advance(self):
+            """ Reads and returns the next character in the file."""
+
+            if self.line is None:
+                return ''
+
+            self.current_index += 1
+
+            if self.current_index >= len(self.line):
+                self.line_number += 1
+                self.line = self._read_line()
+
+                self.current_index = 0
+
+            if self.line is None:
+                self.current_character = ''
+            else:
+                self.current_character = self.line[self.current_index]
+
+            return self.current_character
+
+        def _read_line(self):
+            """ Reads the next line and records where it starts.
+
+            The last line of the file always ends in an extra newline and is
+            followed by a blank line, so every symbol is ended before EOF."""
+            line = self.next_line
+            if line == '':
+                if self.finished:
+                    return None
+                self.finished = True
+                return ' \n'
+
+            self.line_offsets.append(self.next_offset)
+            self.next_offset = self.file.tell()
+            self.next_line = self.file.readline()
+            if self.next_line == '':
+                line += '\n'
+            return line
+
+        def get_line(self, index):
+            """ Returns the line with the given index, counting from 0.
+
+            Earlier lines are read again by seeking to where they start."""
+            if index == self.line_number and self.line is not None:
+                return self.line
+            if index >= len(self.line_offsets):
+                return ' \n'  # the blank line after the file
+
+            position = self.file.tell()
+            self.file.seek(self.line_offsets[index])
+            line = self.file.readline()
+            self.file.seek(position)
+            if index == len(self.line_offsets) - 1 and self.next_line == '':
+                line += '\n'
+            return line
+
+        def _skip_spaces(self):
+            """ Skips spaces and returns the next character."""
+            c = self.current_character
+
+            while c.isspace():
+                c = self.advance()
+
+            self.current_character = c
+
+            return c
+
+        def _skip_comments(self):
+            """ Skips all comments and returns the next character."""
+            c = self.current_character
+
+            while c == '#':
+                c = self._get_next_line()
+
+            self.current_character = c
+
+            return c
+
+        def skip_formatting(self):
+            """ Skips all comments and whitespaces and return the next
+            character."""
+            c = self.current_character
+
+            while c.isspace() or c == '#':
+                self._skip_spaces()
+                c = self._skip_comments()
+
+            self.current_character = c
+
+            return c
+
+        def get_number(self):
+            """ Returns the number beginning at the current pointer location.
+            """
+            c = self.current_character
+
+            if not c.isdigit():
+                raise ValueError('Current character expected to be a number.')
+
+            str_number = c
+
+            c = self.advance()
+            while c.isdigit():
+                str_number += c
+                c = self.advance()
+
+            self.current_character = c
+
+            return int(str_number)
+
+        def get_name(self):
+            """ Returns the name beginning at current pointer location in file.
+            """
+
+            c = self.current_character
+
+            if not c.isalpha():
+                raise ValueError('Current character expected '
+                                 'to be a alphabet.')
+
+            name = c        
+
+            c = self.advance()
+
+            while c.isalnum():
+                name += c
+                c = self.advance()
+
+            self.current_character = c
+
+            return name
+
+        def get_2chars(self):
+            """ Return the next 2 character."""
+            c = self.current_character
+
+            str_name = c
+
+            c = self.advance()
+            str_name += c
+
+            c = self.advance()
+            self.current_character = c
+
+            return str_name
+
+        def _get_next_line(self):
+            """ Skips the pointer to the next line and returns the first
+            character."""
+            c = self.current_character
+            while c != '\n' and c != '\r' and c != '':
+                c = self.advance()
+
+            # At the end of the file this is '', like advance returns, so
+            # a file ending in a comment is read up to EOF
+            return self._skip_spaces()
+
+        def close(self):
+            """Closes the file."""
+            self.file.close()
+
+        @staticmethod
+        def find(path):
+            """Returns the path, looking in definition_files first."""
+            if exists("definition_files/" + path):
+                path = "definition_files/" + path
+            return path
+
+    class MappedFileHandler(FileHandler):
+        """Scans a memory-mapped definition file.
+
+        The file is never read into strings. Characters are taken one byte
+        at a time from the mapped buffer, and names are decoded only when
+        they are complete and about to be interned. Line breaks, columns and
+        the blank line after the file are the same as for FileHandler, so
+        the scanner and error messages cannot tell the two apart.
+
+        The definition language is ASCII, so any other byte is scanned as
+        a character that cannot start a symbol. Runs of name characters,
+        digits, spaces and comments are found with regular expressions on
+        the buffer and jumped over, rather than advanced over one at a time.
+
+        Parameters
+        ----------
+        path - path to the definition file.
+
+        Public methods
+        --------------
+        advance(self): Reads and returns the next character in the buffer.
+
+        get_number(self): Returns the number beginning at the current pointer
+                          location.
+
+        get_name(self): Returns the name beginning at current pointer location
+                        in the buffer.
+
+        get_line(self, index): Returns the line with the given index, counting
+                               from 0.
+
+        close(self): Unmaps and closes the file.
+
+        Private methods
+        --------------
+        _skip_spaces(self): Skips spaces and returns the next character.
+
+        _get_next_line(self): Skips the pointer to the next line and returns
+                              the first character.
+
+        _jump(self, pattern): Moves past the run of characters matching
+                              pattern and returns the next character.
+
+        _line_end(self, offset): Returns the offset just past the line that
+                                 starts at offset.
+        """
+
+        # Characters for each byte; non-ASCII bytes are never alphanumeric
+        CHARACTERS = [chr(byte) if byte < 128 else '\ufffd'
+                      for byte in range(256)]
+
+        # Runs that never cross a line break
+        NAME_RUN = re.compile(rb'[A-Za-z0-9]+')
+        DIGIT_RUN = re.compile(rb'[0-9]+')
+        SPACE_RUN = re.compile(rb'[ \t\x0b\x0c\x1c-\x1f]+')
+        COMMENT_RUN = re.compile(rb'[^\r\n]+')
+
+        def __init__(self, path):
+            """Map the file specified by the path."""
+            self.file = open(Scanner.FileHandler.find(path), 'rb')
+            self.size = getsize(self.file.name)
+            if self.size > 0:
+                self.buffer = mmap.mmap(self.file.fileno(), 0,
+                                        access=mmap.ACCESS_READ)
+                # Like FileHandler, the last line ends in an extra newline
+                # and is followed by a blank line
+                self.tail = '\n \n'
+                self.line_offsets = [0]
+            else:
+                self.buffer = b''
+                self.tail = ' \n'
+                self.line_offsets = []
+            self.end = self.size + len(self.tail)
+
+            self.position = 0  # offset of the current character
+            self.width = 0  # bytes in the current character
+            self.line_break = False  # True if it is the last of its line
+
+            self.line_number = 0
+            self.current_index = -1
+
+            self.current_character = None
+            self.advance()
+
+        def advance(self):
+            """ Reads and returns the next character in the buffer."""
+
+            if self.position >= self.end:
+                return ''
+
+            self.current_index += 1
+            self.position += self.width
+
+            if self.line_break:
+                self.line_number += 1
+                self.current_index = 0
+                if self.position < self.size:
+                    self.line_offsets.append(self.position)
+
+            if self.position < self.size:
+                byte = self.buffer[self.position]
+                self.width = 1
+                if byte == 13:  # '\r' or '\r\n' are read as '\n'
+                    if (self.position + 1 < self.size and
+                            self.buffer[self.position + 1] == 10):
+                        self.width = 2
+                    c = '\n'
+                else:
+                    c = self.CHARACTERS[byte]
+                # The last newline of the file shares its line with the
+                # extra newline
+                self.line_break = (c == '\n' and
+                                   self.position + self.width < self.size)
+            elif self.position < self.end:
+                c = self.tail[self.position - self.size]
+                self.width = 1
+                self.line_break = c == '\n'
+            else:
+                c = ''
+
+            self.current_character = c
+
+            return c
+
+        def get_number(self):
+            """ Returns the number beginning at the current pointer location.
+            """
+            c = self.current_character
+
+            if not c.isdigit():
+                raise ValueError('Current character expected to be a number.')
+
+            start = self.position
+            self._jump(self.DIGIT_RUN)
+
+            return int(self.buffer[start:self.position])
+
+        def get_name(self):
+            """ Returns the name beginning at current pointer location in the
+            buffer."""
+            c = self.current_character
+
+            if not c.isalpha():
+                raise ValueError('Current character expected '
+                                 'to be a alphabet.')
+
+            start = self.position
+            self._jump(self.NAME_RUN)
+
+            return self.buffer[start:self.position].decode('ascii')
+
+        def _skip_spaces(self):
+            """ Skips spaces and returns the next character."""
+            c = self.current_character
+
+            while c.isspace():
+                if c == '\n':
+                    c = self.advance()
+                else:
+                    c = self._jump(self.SPACE_RUN)
+
+            return c
+
+        def _get_next_line(self):
+            """ Skips the pointer to the next line and returns the first
+            character."""
+            if self.current_character not in ['\n', '']:
+                self._jump(self.COMMENT_RUN)
+
+            return self._skip_spaces()
+
+        def _jump(self, pattern):
+            """ Moves past the run of characters matching pattern, starting at
+            the current character, and returns the next character."""
+            if self.position >= self.size:  # in the blank line after the file
+                return self.advance()
+
+            run = pattern.match(self.buffer, self.position)
+            if run is None:
+                return self.advance()
+
+            # Move onto the last character of the run, then past it
+            length = run.end() - self.position
+            self.position += length - 1
+            self.current_index += length - 1
+            self.width = 1
+            self.line_break = False
+            return self.advance()
+
+        def get_line(self, index):
+            """ Returns the line with the given index, counting from 0."""
+            if index >= len(self.line_offsets):
+                return ' \n'  # the blank line after the file
+
+            start = self.line_offsets[index]
+            end = self._line_end(start)
+            line = self.buffer[start:end].decode('utf-8', 'replace')
+            line = line.replace('\r\n', '\n').replace('\r', '\n')
+            if end == self.size:
+                line += '\n'
+            return line
+
+        def _line_end(self, offset):
+            """ Returns the offset just past the line that starts at offset.
+            """
+            end = self.size
+            for newline in [b'\n', b'\r']:
+                found = self.buffer.find(newline, offset, end)
+                if found != -1:
+                    end = found + 1
+            if (end < self.size and self.buffer[end - 1] == 13 and
+                    self.buffer[end] == 10):
+                end += 1
+            return end
+
+        def close(self):
+            """Unmaps and closes the file."""
+            if self.size > 0:
+                self.buffer.close()
+            self.file.close()
@@ -0,0 +1,24 @@
+"""Test the scanner and parser fuzzing harness."""
+import pytest
+
+from benchmarks import fuzz
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_fuzz_within_bounds(seed, tmpdir):
+    """Test if random malformed files are parsed within the bounds."""
+    results = fuzz.fuzz(100, seed, fuzz.TIME_PER_SYMBOL, str(tmpdir))
+    assert [result for result in results if result["status"] != "ok"] == []
+
+
+@pytest.mark.parametrize("text", ["}", "};};", "INPUT a = b;", "OUTPUT",
+                                  "CIRCUIT 99 { NOT n; }",
+                                  "CIRCUIT c { NOR n(IN = 2); OUTPUT q; }"])
+def test_error_recovery(text, tmpdir):
+    """Test if statements that used to hang or crash the parser are
+    reported as errors."""
+    path = tmpdir.join("bad.vi")
+    path.write(text)
+    result = fuzz.check_file(str(path), fuzz.TIME_PER_SYMBOL)
+    assert result["status"] == "ok"
+    assert 0 < result["errors"] <= result["symbols"]
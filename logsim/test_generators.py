@@ -0,0 +1,82 @@
+"""Test the benchmark circuit generators."""
+import pytest
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+from error_handling import ErrorHandler
+from benchmarks import generators
+
+
+@pytest.mark.parametrize("text, device_count", [
+    (generators.ripple_adder(4), 29),
+    (generators.shift_register(5), 8),
+    (generators.random_dag(20, seed=3), 23),
+    (generators.nand_latches(2), 23),
+    (generators.not_chain(10), 11),
+])
+def test_generated_circuits(text, device_count, tmpdir):
+    """Test if every generated circuit parses and runs without errors."""
+    path = tmpdir.join("circuit.vi")
+    path.write(text)
+
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    scanner = Scanner(str(path), names)
+    parser = Parser(names, devices, network, monitors, scanner,
+                    error_handler)
+
+    assert parser.parse_network()
+    assert len(devices.devices_list) == device_count
+    devices.cold_startup(0)
+    network.reset_clocks()
+    assert network.execute_cycles(20, monitors)
+
+
+def test_random_netlist_ranges(tmpdir):
+    """Test if the ranges of a random netlist are made as buses."""
+    path = tmpdir.join("ranges.vi")
+    path.write(generators.random_netlist(10, seed=1, buses=5, width=8))
+
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    scanner = Scanner(str(path), names)
+    parser = Parser(names, devices, network, monitors, scanner,
+                    error_handler)
+
+    assert parser.parse_network()
+    assert len(devices.buses) == 5
+    assert len(devices.devices_list) == 10 + sum(
+        [bus.size for bus in devices.buses])
+
+
+def test_ripple_adder_sum(tmpdir):
+    """Test if the ripple adder adds all ones to a carry in of one."""
+    path = tmpdir.join("adder.vi")
+    path.write(generators.ripple_adder(3))
+
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    scanner = Scanner(str(path), names)
+    parser = Parser(names, devices, network, monitors, scanner,
+                    error_handler)
+    assert parser.parse_network()
+
+    network.execute_network()
+    [S1, S2, S3, C3] = names.lookup(["s1", "s2", "s3", "c3"])
+    # 111 + 000 + 1 = 1000
+    assert [network.get_output_signal(device_id, None)
+            for device_id in [S1, S2, S3, C3]] == [devices.LOW, devices.LOW,
+                                                   devices.LOW, devices.HIGH]
@@ -0,0 +1,44 @@
+"""Test the golden-trace engine comparison harness."""
+import pytest
+
+from benchmarks import generators
+from benchmarks import golden
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3, 4])
+def test_execute_cycles_matches_reference(seed, tmpdir):
+    """Test if execute_cycles matches the reference on random netlists."""
+    path = tmpdir.join("random.vi")
+    path.write(generators.random_netlist(20, seed=seed))
+    result = golden.compare_engines(str(path), golden.run_execute_cycles,
+                                    100, seed)
+    assert result["status"] == "match"
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3, 4])
+def test_vectorized_matches_reference(seed, tmpdir):
+    """Test if executing buses at once matches executing their devices."""
+    path = tmpdir.join("ranges.vi")
+    path.write(generators.random_netlist(20, seed=seed, buses=4, width=16))
+    result = golden.compare_engines(str(path), golden.run_vectorized, 100,
+                                    seed)
+    assert result["status"] == "match"
+
+
+def test_mismatch_reported(tmpdir):
+    """Test if an engine that differs from the reference is caught."""
+    path = tmpdir.join("register.vi")
+    path.write(generators.shift_register(4))
+
+    def lagging_engine(network, monitors, cycles):
+        """Record every cycle one cycle late."""
+        network.execute_network()
+        for _ in range(cycles):
+            if not network.execute_network():
+                return False
+            monitors.record_signals()
+        return True
+
+    result = golden.compare_engines(str(path), lagging_engine, 20, 0)
+    assert result["status"] == "mismatch"
+    assert result["first_difference"]["cycle"] < 20
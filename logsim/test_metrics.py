@@ -0,0 +1,47 @@
+"""Test the metrics module."""
+from metrics import Metrics
+
+
+def test_record_cycle():
+    """Test if executed cycles are recorded and summarised correctly."""
+    metrics = Metrics()
+    assert metrics.get_summary() == {"executed_cycles": 0,
+                                     "settle_iterations": 0,
+                                     "max_settle_iterations": 0,
+                                     "mean_settle_iterations": 0,
+                                     "devices_evaluated": 0,
+                                     "transitions": 0,
+                                     "d_type_captures": 0,
+                                     "clock_edges": 0,
+                                     "activity_factor": 0}
+    metrics.record_cycle(1, 4, 40, 6, 1, 2)
+    metrics.record_cycle(5, 2, 20, 0, 0, 1)
+    assert list(metrics.recent_cycles) == [(1, 4, 40, 6, 1, 2),
+                                           (5, 2, 20, 0, 0, 1)]
+    assert metrics.get_summary() == {"executed_cycles": 2,
+                                     "settle_iterations": 6,
+                                     "max_settle_iterations": 4,
+                                     "mean_settle_iterations": 3,
+                                     "devices_evaluated": 60,
+                                     "transitions": 6,
+                                     "d_type_captures": 1,
+                                     "clock_edges": 3,
+                                     "activity_factor": 0.1}
+
+    metrics.reset()
+    assert list(metrics.recent_cycles) == []
+    assert metrics.get_summary()["executed_cycles"] == 0
+
+
+def test_recent_cycles():
+    """Test if only the most recent cycles are kept, but all are counted."""
+    metrics = Metrics(history=3)
+    for cycle in range(10):
+        metrics.record_cycle(cycle, cycle % 4 + 1, 10, 1)
+    assert [record[0] for record in metrics.recent_cycles] == [7, 8, 9]
+    summary = metrics.get_summary()
+    assert summary["executed_cycles"] == 10
+    assert summary["settle_iterations"] == 23
+    assert summary["max_settle_iterations"] == 4
+    assert summary["devices_evaluated"] == 100
+    assert summary["activity_factor"] == 0.1
@@ -1,71 +1,100 @@
-"""Test the names module."""
-import pytest
-
-from names import Names
-
-
-@pytest.fixture
-def new_names():
-    """Return a new names instance."""
-    return Names()
-
-
-@pytest.fixture
-def old_names():
-    """Return a names instance with preallocated error count and names list."""
-    names = Names()
-    names.error_code_count = 3
-    names.names = ["nand1", "or4", "xor"]
-    #names.lookup(["nand1", "or4", "xor"])
-    return names
-
-
-def test_unique_error_codes(new_names, old_names):
-    """Test if unique_error_codes method returns correct range() object."""
-    with pytest.raises(TypeError):
-        new_names.unique_error_codes(3.1)
-
-    # Test returned range
-    assert old_names.unique_error_codes(4) == range(3, 7)
-
-
-def test_query_exceptions(new_names):
-    """Test if query method raises correct errors."""
-    with pytest.raises(TypeError):
-        new_names.query(34.5)
-    with pytest.raises(TypeError):
-        new_names.query("2ab")  # not a "name" in EBFL
-
-
-@pytest.mark.parametrize("name_id, name_string", [
-    (0, "nand1"),
-    (1, "or4"),
-    (2, "xor"),
-    (None, "and3")
-])
-def test_query(new_names, old_names, name_id, name_string):
-    """Test if query method returns corresponding name ID."""
-    assert old_names.query(name_string) == name_id
-
-
-def test_lookup_exceptions(new_names):
-    """Test if proper TypeError raised in lookup()."""
-    with pytest.raises(TypeError):
-        new_names.lookup(["and1", "2or"])
-    with pytest.raises(TypeError):
-        new_names.lookup(["and1", 3.14])
-
-
-def test_lookup(old_names):
-    """Test if lookup method returns correct ID list."""
-    assert old_names.lookup(["or4", "nand1", "and2", "xor"]) == [1, 0, 3, 2]
-
-
-def test_get_name_string(old_names):
-    """Test if get_name_string returns correct name"""
-    with pytest.raises(TypeError):
-        old_names.get_name_string(2.4)
-
-    # Verify correct name is returned
-    assert old_names.get_name_string(2) == "xor"
-    assert old_names.get_name_string(3) is None
+"""Test the names module."""
+import pytest
+
+from names import Names
+
+
+@pytest.fixture
+def new_names():
+    """Return a new names instance."""
+    return Names()
+
+
+@pytest.fixture
+def old_names():
+    """Return a names instance with preallocated error count and names list."""
+    names = Names()
+    names.error_code_count = 3
+    names.names = ["nand1", "or4", "xor"]
+    #names.lookup(["nand1", "or4", "xor"])
+    return names
+
+
+def test_unique_error_codes(new_names, old_names):
+    """Test if unique_error_codes method returns correct range() object."""
+    with pytest.raises(TypeError):
+        new_names.unique_error_codes(3.1)
+
+    # Test returned range
+    assert old_names.unique_error_codes(4) == range(3, 7)
+
+
+def test_query_exceptions(new_names):
+    """Test if query method raises correct errors."""
+    with pytest.raises(TypeError):
+        new_names.query(34.5)
+    with pytest.raises(TypeError):
+        new_names.query("2ab")  # not a "name" in EBFL
+
+
+@pytest.mark.parametrize("name_id, name_string", [
+    (0, "nand1"),
+    (1, "or4"),
+    (2, "xor"),
+    (None, "and3")
+])
+def test_query(new_names, old_names, name_id, name_string):
+    """Test if query method returns corresponding name ID."""
+    assert old_names.query(name_string) == name_id
+
+
+def test_lookup_exceptions(new_names):
+    """Test if proper TypeError raised in lookup()."""
+    with pytest.raises(TypeError):
+        new_names.lookup(["and1", "2or"])
+    with pytest.raises(TypeError):
+        new_names.lookup(["and1", 3.14])
+
+
+def test_lookup(old_names):
+    """Test if lookup method returns correct ID list."""
+    assert old_names.lookup(["or4", "nand1", "and2", "xor"]) == [1, 0, 3, 2]
+
+
+def test_get_name_string(old_names):
+    """Test if get_name_string returns correct name"""
+    with pytest.raises(TypeError):
+        old_names.get_name_string(2.4)
+
+    # Verify correct name is returned
+    assert old_names.get_name_string(2) == "xor"
+    assert old_names.get_name_string(3) is None
+
+
+def test_lookup_range(new_names):
+    """Test if a range gets consecutive IDs and builds its names lazily."""
+    [nand_id] = new_names.lookup(["nand"])
+    ids = new_names.lookup_range("nand", 1, 100000)
+    assert list(ids[:2]) == [nand_id + 1, nand_id + 2]
+    assert len(new_names.names) == 100001
+    assert new_names.name_ids == {"nand": nand_id}
+
+    assert new_names.get_name_string(ids[4]) == "nand5"
+    assert new_names.lookup(["nand100000", "nand5"]) == [ids[-1], ids[4]]
+    assert new_names.query("nand77") == ids[76]
+    assert new_names.query("nand0") is None
+    assert new_names.query("nand05") is None
+
+
+def test_lookup_range_overlap(new_names):
+    """Test if names already present keep their IDs in a range."""
+    [d3_id] = new_names.lookup(["d3"])
+    assert new_names.lookup_range("d", 1, 4)[2] == d3_id
+
+    ids = new_names.lookup_range("d", 5, 6)
+    assert new_names.lookup_range("d", 6, 7)[0] == ids[1]
+
+    # d1 followed by 2 is the same name as d followed by 12
+    [d12_id] = new_names.lookup_range("d1", 2, 2)
+    assert new_names.lookup_range("d", 12, 12) == [d12_id]
+    assert new_names.get_name_string(d12_id) == "d12"
@@ -1,350 +1,691 @@
-"""Test the network module."""
-import pytest
-
-from names import Names
-from devices import Devices
-from network import Network
-
-
-@pytest.fixture
-def new_network():
-    """Return a new instance of the Network class."""
-    new_names = Names()
-    new_devices = Devices(new_names)
-    return Network(new_names, new_devices)
-
-
-@pytest.fixture
-def network_with_devices():
-    """Return a Network class instance with three devices in the network."""
-    new_names = Names()
-    new_devices = Devices(new_names)
-    new_network = Network(new_names, new_devices)
-
-    [SW1_ID, SW2_ID, OR1_ID] = new_names.lookup(["Sw1", "Sw2", "Or1"])
-
-    # Add devices
-    new_devices.make_device(SW1_ID, new_devices.SWITCH, 0)
-    new_devices.make_device(SW2_ID, new_devices.SWITCH, 0)
-    new_devices.make_device(OR1_ID, new_devices.OR, 2)
-
-    return new_network
-
-
-def test_get_connected_output(network_with_devices):
-    """Test if the output connected to a given input port is correct."""
-    network = network_with_devices
-    devices = network.devices
-    names = devices.names
-
-    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
-                                                     "I2"])
-    # Inputs are unconnected, get_connected_output should return None
-    assert network.get_connected_output(OR1_ID, I1) is None
-    assert network.get_connected_output(OR1_ID, I2) is None
-
-    # Make connections
-    network.make_connection(SW1_ID, None, OR1_ID, I1)
-    network.make_connection(SW2_ID, None, OR1_ID, I2)
-
-    assert network.get_connected_output(OR1_ID, I1) == (SW1_ID, None)
-    assert network.get_connected_output(OR1_ID, I2) == (SW2_ID, None)
-
-    # Not a valid port for Sw1, get_connected_output should return None
-    assert network.get_connected_output(SW1_ID, I2) is None
-
-
-def test_get_input_signal(network_with_devices):
-    """Test if the signal at a given input port is correct"""
-    network = network_with_devices
-    devices = network.devices
-    names = devices.names
-
-    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
-                                                     "I2"])
-    # Inputs are unconnected, get_input_signal should return None
-    assert network.get_input_signal(OR1_ID, I1) is None
-    assert network.get_input_signal(OR1_ID, I2) is None
-
-    # Make connections
-    network.make_connection(SW1_ID, None, OR1_ID, I1)
-    network.make_connection(SW2_ID, None, OR1_ID, I2)
-
-    # Set Sw2 output to HIGH
-    switch2 = devices.get_device(SW2_ID)
-    switch2.outputs[None] = devices.HIGH
-
-    assert network.get_input_signal(OR1_ID, I1) == devices.LOW
-    assert network.get_input_signal(OR1_ID, I2) == devices.HIGH
-
-
-def test_get_output_signal(network_with_devices):
-    """Test if the signal level at the given output is correct."""
-    network = network_with_devices
-    devices = network.devices
-    names = devices.names
-
-    [OR1_ID] = names.lookup(["Or1"])
-
-    assert network.get_output_signal(OR1_ID, None) == devices.LOW
-
-    # Set Or1 output to HIGH
-    or1 = devices.get_device(OR1_ID)
-    or1.outputs[None] = devices.HIGH
-
-    assert network.get_output_signal(OR1_ID, None) == devices.HIGH
-
-
-def test_check_network(network_with_devices):
-    """Test if the signal at a given input port is correct."""
-    network = network_with_devices
-    devices = network.devices
-    names = devices.names
-
-    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
-                                                     "I2"])
-
-    # Inputs are unconnected, check_network() should return False
-    assert not network.check_network()
-
-    # Make connections
-    network.make_connection(SW1_ID, None, OR1_ID, I1)
-    network.make_connection(SW2_ID, None, OR1_ID, I2)
-
-    # Inputs are now connected, check_network() should return True
-    assert network.check_network()
-
-
-def test_make_connection(network_with_devices):
-    """Test if the make_connection function correctly connects devices."""
-    network = network_with_devices
-    devices = network.devices
-    names = devices.names
-
-    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
-                                                     "I2"])
-
-    or1 = devices.get_device(OR1_ID)
-
-    # or1 inputs are initially unconnected
-    assert or1.inputs == {I1: None,
-                          I2: None}
-
-    # Make connections
-    network.make_connection(SW1_ID, None, OR1_ID, I1)
-    network.make_connection(SW2_ID, None, OR1_ID, I2)
-
-    # or1 inputs should now be connected
-    assert or1.inputs == {I1: (SW1_ID, None),
-                          I2: (SW2_ID, None)}
-
-
-@pytest.mark.parametrize("function_args, error", [
-    # I1 is not a valid device id
-    ("(I1, I1, OR1_ID, I2)", "network.DEVICE_ABSENT"),
-
-    ("(OR1_ID, I2, OR1_ID, I2)", "network.INPUT_TO_INPUT"),
-
-    ("(SW1_ID, None, OR1_ID, None)", "network.OUTPUT_TO_OUTPUT"),
-
-    # Switch device does not have port I1, so give PORT_ABSENT_ERROR
-    ("(SW1_ID, I1, OR1_ID, I2)", "network.PORT_ABSENT"),
-
-    # Output first
-    ("(SW2_ID, None, OR1_ID, I2)", "network.NO_ERROR"),
-
-    # Input first
-    ("(OR1_ID, I2, SW2_ID, None)", "network.NO_ERROR"),
-
-    # Note: Or1.I1 will have been connected earlier in the function
-    ("(SW1_ID, None, OR1_ID, I1)", "network.INPUT_CONNECTED"),
-])
-def test_make_connection_gives_error(network_with_devices,
-                                     function_args, error):
-    """Test if the make_connection function returns the correct errors."""
-    network = network_with_devices
-    devices = network.devices
-    names = devices.names
-
-    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
-                                                     "I2"])
-
-    # Connect Or1.I1 to Sw1
-    network.make_connection(SW1_ID, None, OR1_ID, I1)
-
-    # left_expression is of the form: network.make_connection(...)
-    left_expression = eval("".join(["network.make_connection", function_args]))
-    right_expression = eval(error)
-    assert left_expression == right_expression
-
-
-def test_execute_xor(new_network):
-    """Test if execute_network returns the correct output for XOR gates."""
-    network = new_network
-    devices = network.devices
-    names = devices.names
-
-    [SW1_ID, SW2_ID, XOR1_ID, I1, I2] = names.lookup(
-        ["Sw1", "Sw2", "Xor1", "I1", "I2"])
-
-    # Make devices
-    devices.make_device(XOR1_ID, devices.XOR)
-    devices.make_device(SW1_ID, devices.SWITCH, 0)
-    devices.make_device(SW2_ID, devices.SWITCH, 0)
-
-    # Make connections
-    network.make_connection(SW1_ID, None, XOR1_ID, I1)
-    network.make_connection(SW2_ID, None, XOR1_ID, I2)
-
-    network.execute_network()
-    assert new_network.get_output_signal(XOR1_ID, None) == devices.LOW
-
-    # Set Sw1 to HIGH
-    devices.set_switch(SW1_ID, devices.HIGH)
-    network.execute_network()
-    assert network.get_output_signal(XOR1_ID, None) == devices.HIGH
-
-    # Set Sw2 to HIGH
-    devices.set_switch(SW2_ID, devices.HIGH)
-    network.execute_network()
-    assert network.get_output_signal(XOR1_ID, None) == devices.LOW
-
-
-@pytest.mark.parametrize("gate_id, switch_outputs, gate_output, gate_kind", [
-    ("AND1_ID", ["LOW", "HIGH", "LOW"], "LOW", "devices.AND"),
-    ("AND1_ID", ["HIGH", "HIGH", "HIGH"], "HIGH", "devices.AND"),
-    ("NAND1_ID", ["HIGH", "HIGH", "HIGH"], "LOW", "devices.NAND"),
-    ("NAND1_ID", ["HIGH", "HIGH", "LOW"], "HIGH", "devices.NAND"),
-    ("OR1_ID", ["LOW", "LOW", "LOW"], "LOW", "devices.OR"),
-    ("OR1_ID", ["LOW", "HIGH", "HIGH"], "HIGH", "devices.OR"),
-    ("NOR1_ID", ["HIGH", "LOW", "HIGH"], "LOW", "devices.NOR"),
-    ("NOR1_ID", ["LOW", "LOW", "LOW"], "HIGH", "devices.NOR"),
-])
-def test_execute_non_xor_gates(new_network, gate_id, switch_outputs,
-                               gate_output, gate_kind):
-    """Test if execute_network returns the correct output for non-XOR gates."""
-    network = new_network
-    devices = network.devices
-    names = devices.names
-
-    [AND1_ID, OR1_ID, NAND1_ID, NOR1_ID, SW1_ID, SW2_ID, SW3_ID, I1, I2,
-     I3] = names.lookup(["And1", "Or1", "Nand1", "Nor1", "Sw1", "Sw2", "Sw3",
-                         "I1", "I2", "I3"])
-
-    LOW = devices.LOW
-    HIGH = devices.HIGH
-
-    # Make devices
-    gate_id = eval(gate_id)
-    gate_kind = eval(gate_kind)
-    devices.make_device(gate_id, gate_kind, 3)
-    devices.make_device(SW1_ID, devices.SWITCH, 0)
-    devices.make_device(SW2_ID, devices.SWITCH, 0)
-    devices.make_device(SW3_ID, devices.SWITCH, 0)
-
-    # Make connections
-    network.make_connection(SW1_ID, None, gate_id, I1)
-    network.make_connection(SW2_ID, None, gate_id, I2)
-    network.make_connection(SW3_ID, None, gate_id, I3)
-
-    # Set switches
-    switches = [SW1_ID, SW2_ID, SW3_ID]
-    for i, switch_output in enumerate(switch_outputs):
-        devices.set_switch(switches[i], eval(switch_output))
-
-    network.execute_network()
-    assert network.get_output_signal(gate_id, None) == eval(gate_output)
-
-
-def test_execute_non_gates(new_network):
-    """Test if execute_network returns the correct output for non-gate devices.
-
-    Tests switches, D-types and clocks.
-    """
-    network = new_network
-    devices = network.devices
-    names = devices.names
-
-    LOW = devices.LOW
-    HIGH = devices.HIGH
-
-    # Make different devices
-    [SW1_ID, SW2_ID, SW3_ID, CL_ID, D_ID] = names.lookup(["Sw1", "Sw2", "Sw3",
-                                                          "Clock1", "D1"])
-    devices.make_device(SW1_ID, devices.SWITCH, 1)
-    devices.make_device(SW2_ID, devices.SWITCH, 0)
-    devices.make_device(SW3_ID, devices.SWITCH, 0)
-    devices.make_device(CL_ID, devices.CLOCK, 1)
-    devices.make_device(D_ID, devices.D_TYPE)
-
-    # Make connections
-    network.make_connection(SW1_ID, None, D_ID, devices.DATA_ID)
-    network.make_connection(CL_ID, None, D_ID, devices.CLK_ID)
-    network.make_connection(SW2_ID, None, D_ID, devices.SET_ID)
-    network.make_connection(SW3_ID, None, D_ID, devices.CLEAR_ID)
-
-    # Get device outputs, the expression is in a string here so that it
-    # can be re-evaluated again after executing devices
-    sw1_output = "network.get_output_signal(SW1_ID, None)"
-    sw2_output = "network.get_output_signal(SW2_ID, None)"
-    sw3_output = "network.get_output_signal(SW3_ID, None)"
-    clock_output = "network.get_output_signal(CL_ID, None)"
-    dtype_Q = "network.get_output_signal(D_ID, devices.Q_ID)"
-    dtype_QBAR = "network.get_output_signal(D_ID, devices.QBAR_ID)"
-
-    # Execute devices until the clock is LOW at the start of its
-    # period
-    clock_device = devices.get_device(CL_ID)
-    network.execute_network()
-    while clock_device.clock_counter != 1 or eval(clock_output) != LOW:
-        network.execute_network()
-
-    # The clock is not rising yet, Q could be (randomly) HIGH or LOW
-    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
-            eval(clock_output)] == [HIGH, LOW, LOW, LOW]
-
-    assert eval(dtype_Q) in [HIGH, LOW]
-    assert eval(dtype_QBAR) == network.invert_signal(eval(dtype_Q))
-
-    network.execute_network()  # the clock has risen
-    # While sw1(DATA) is high, Q has now changed to HIGH
-    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
-            eval(clock_output), eval(dtype_Q), eval(dtype_QBAR)] == [
-                HIGH, LOW, LOW, HIGH, HIGH, LOW]
-
-    devices.set_switch(SW1_ID, LOW)  # Sw1 is connected to DATA
-    devices.set_switch(SW2_ID, HIGH)  # Sw2 is connected to SET
-    network.execute_network()  # the clock is not rising yet
-    network.execute_network()  # the clock has risen
-    # Even if sw1(DATA) is LOW, and the clock is rising,
-    # sw2(SET) is HIGH, so Q is HIGH
-    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
-            eval(clock_output), eval(dtype_Q), eval(dtype_QBAR)] == [
-                LOW, HIGH, LOW, HIGH, HIGH, LOW]
-
-    devices.set_switch(SW1_ID, HIGH)  # Sw1 is connected to DATA
-    devices.set_switch(SW2_ID, LOW)  # Sw2 is connected to SET
-    devices.set_switch(SW3_ID, HIGH)  # Sw3 is connected to CLEAR
-    network.execute_network()  # the clock is not rising yet
-    network.execute_network()  # the clock has risen
-    # Even if sw1(DATA) is HIGH, and the clock is rising,
-    # sw3(CLEAR) is HIGH, so Q is LOW
-    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
-            eval(clock_output), eval(dtype_Q), eval(dtype_QBAR)] == [
-                HIGH, LOW, HIGH, HIGH, LOW, HIGH]
-
-
-def test_oscillating_network(new_network):
-    """Test if the execute_network returns False for oscillating networks."""
-    network = new_network
-    devices = network.devices
-    names = devices.names
-
-    [NOR1, I1] = names.lookup(["Nor1", "I1"])
-    # Make NOR gate
-    devices.make_device(NOR1, devices.NOR, 1)
-
-    # Connect the NOR gate to itself
-    network.make_connection(NOR1, None, NOR1, I1)
-
-    assert not network.execute_network()
+"""Test the network module."""
+import tracemalloc
+
+import pytest
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from error_handling import ErrorHandler
+
+
+@pytest.fixture
+def new_objects():
+    """Return new Names, ErrorHandler, Devices, Network and Monitors."""
+    return make_objects()
+
+
+def make_objects():
+    """Return new Names, ErrorHandler, Devices, Network and Monitors."""
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    return names, error_handler, devices, network, monitors
+
+
+@pytest.fixture
+def new_network():
+    """Return a new instance of the Network class."""
+    new_names = Names()
+    new_devices = Devices(new_names)
+    return Network(new_names, new_devices)
+
+
+@pytest.fixture
+def network_with_devices():
+    """Return a Network class instance with three devices in the network."""
+    new_names = Names()
+    new_devices = Devices(new_names)
+    new_network = Network(new_names, new_devices)
+
+    [SW1_ID, SW2_ID, OR1_ID] = new_names.lookup(["Sw1", "Sw2", "Or1"])
+
+    # Add devices
+    new_devices.make_device(SW1_ID, new_devices.SWITCH, 0)
+    new_devices.make_device(SW2_ID, new_devices.SWITCH, 0)
+    new_devices.make_device(OR1_ID, new_devices.OR, 2)
+
+    return new_network
+
+
+def test_get_connected_output(network_with_devices):
+    """Test if the output connected to a given input port is correct."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
+                                                     "I2"])
+    # Inputs are unconnected, get_connected_output should return None
+    assert network.get_connected_output(OR1_ID, I1) is None
+    assert network.get_connected_output(OR1_ID, I2) is None
+
+    # Make connections
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+    network.make_connection(SW2_ID, None, OR1_ID, I2)
+
+    assert network.get_connected_output(OR1_ID, I1) == (SW1_ID, None)
+    assert network.get_connected_output(OR1_ID, I2) == (SW2_ID, None)
+
+    # Not a valid port for Sw1, get_connected_output should return None
+    assert network.get_connected_output(SW1_ID, I2) is None
+
+
+def test_get_input_signal(network_with_devices):
+    """Test if the signal at a given input port is correct"""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
+                                                     "I2"])
+    # Inputs are unconnected, get_input_signal should return None
+    assert network.get_input_signal(OR1_ID, I1) is None
+    assert network.get_input_signal(OR1_ID, I2) is None
+
+    # Make connections
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+    network.make_connection(SW2_ID, None, OR1_ID, I2)
+
+    # Set Sw2 output to HIGH
+    switch2 = devices.get_device(SW2_ID)
+    switch2.outputs[None] = devices.HIGH
+
+    assert network.get_input_signal(OR1_ID, I1) == devices.LOW
+    assert network.get_input_signal(OR1_ID, I2) == devices.HIGH
+
+
+def test_get_output_signal(network_with_devices):
+    """Test if the signal level at the given output is correct."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [OR1_ID] = names.lookup(["Or1"])
+
+    assert network.get_output_signal(OR1_ID, None) == devices.LOW
+
+    # Set Or1 output to HIGH
+    or1 = devices.get_device(OR1_ID)
+    or1.outputs[None] = devices.HIGH
+
+    assert network.get_output_signal(OR1_ID, None) == devices.HIGH
+
+
+def test_check_network(network_with_devices):
+    """Test if the signal at a given input port is correct."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
+                                                     "I2"])
+
+    # Inputs are unconnected, check_network() should return False
+    assert not network.check_network()
+
+    # Make connections
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+    network.make_connection(SW2_ID, None, OR1_ID, I2)
+
+    # Inputs are now connected, check_network() should return True
+    assert network.check_network()
+
+
+def test_make_connection(network_with_devices):
+    """Test if the make_connection function correctly connects devices."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
+                                                     "I2"])
+
+    or1 = devices.get_device(OR1_ID)
+
+    # or1 inputs are initially unconnected
+    assert or1.inputs == {I1: None,
+                          I2: None}
+
+    # Make connections
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+    network.make_connection(SW2_ID, None, OR1_ID, I2)
+
+    # or1 inputs should now be connected
+    assert or1.inputs == {I1: (SW1_ID, None),
+                          I2: (SW2_ID, None)}
+
+
+@pytest.mark.parametrize("function_args, error", [
+    # I1 is not a valid device id
+    ("(I1, I1, OR1_ID, I2)", "network.DEVICE_ABSENT"),
+
+    ("(OR1_ID, I2, OR1_ID, I2)", "network.INPUT_TO_INPUT"),
+
+    ("(SW1_ID, None, OR1_ID, None)", "network.OUTPUT_TO_OUTPUT"),
+
+    # Switch device does not have port I1, so give PORT_ABSENT_ERROR
+    ("(SW1_ID, I1, OR1_ID, I2)", "network.PORT_ABSENT"),
+
+    # Output first
+    ("(SW2_ID, None, OR1_ID, I2)", "network.NO_ERROR"),
+
+    # Input first
+    ("(OR1_ID, I2, SW2_ID, None)", "network.NO_ERROR"),
+
+    # Note: Or1.I1 will have been connected earlier in the function
+    ("(SW1_ID, None, OR1_ID, I1)", "network.INPUT_CONNECTED"),
+])
+def test_make_connection_gives_error(network_with_devices,
+                                     function_args, error):
+    """Test if the make_connection function returns the correct errors."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, I1, I2] = names.lookup(["Sw1", "Sw2", "Or1", "I1",
+                                                     "I2"])
+
+    # Connect Or1.I1 to Sw1
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+
+    # left_expression is of the form: network.make_connection(...)
+    left_expression = eval("".join(["network.make_connection", function_args]))
+    right_expression = eval(error)
+    assert left_expression == right_expression
+
+
+def test_execute_xor(new_network):
+    """Test if execute_network returns the correct output for XOR gates."""
+    network = new_network
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, XOR1_ID, I1, I2] = names.lookup(
+        ["Sw1", "Sw2", "Xor1", "I1", "I2"])
+
+    # Make devices
+    devices.make_device(XOR1_ID, devices.XOR)
+    devices.make_device(SW1_ID, devices.SWITCH, 0)
+    devices.make_device(SW2_ID, devices.SWITCH, 0)
+
+    # Make connections
+    network.make_connection(SW1_ID, None, XOR1_ID, I1)
+    network.make_connection(SW2_ID, None, XOR1_ID, I2)
+
+    network.execute_network()
+    assert new_network.get_output_signal(XOR1_ID, None) == devices.LOW
+
+    # Set Sw1 to HIGH
+    devices.set_switch(SW1_ID, devices.HIGH)
+    network.execute_network()
+    assert network.get_output_signal(XOR1_ID, None) == devices.HIGH
+
+    # Set Sw2 to HIGH
+    devices.set_switch(SW2_ID, devices.HIGH)
+    network.execute_network()
+    assert network.get_output_signal(XOR1_ID, None) == devices.LOW
+
+
+@pytest.mark.parametrize("gate_id, switch_outputs, gate_output, gate_kind", [
+    ("AND1_ID", ["LOW", "HIGH", "LOW"], "LOW", "devices.AND"),
+    ("AND1_ID", ["HIGH", "HIGH", "HIGH"], "HIGH", "devices.AND"),
+    ("NAND1_ID", ["HIGH", "HIGH", "HIGH"], "LOW", "devices.NAND"),
+    ("NAND1_ID", ["HIGH", "HIGH", "LOW"], "HIGH", "devices.NAND"),
+    ("OR1_ID", ["LOW", "LOW", "LOW"], "LOW", "devices.OR"),
+    ("OR1_ID", ["LOW", "HIGH", "HIGH"], "HIGH", "devices.OR"),
+    ("NOR1_ID", ["HIGH", "LOW", "HIGH"], "LOW", "devices.NOR"),
+    ("NOR1_ID", ["LOW", "LOW", "LOW"], "HIGH", "devices.NOR"),
+])
+def test_execute_non_xor_gates(new_network, gate_id, switch_outputs,
+                               gate_output, gate_kind):
+    """Test if execute_network returns the correct output for non-XOR gates."""
+    network = new_network
+    devices = network.devices
+    names = devices.names
+
+    [AND1_ID, OR1_ID, NAND1_ID, NOR1_ID, SW1_ID, SW2_ID, SW3_ID, I1, I2,
+     I3] = names.lookup(["And1", "Or1", "Nand1", "Nor1", "Sw1", "Sw2", "Sw3",
+                         "I1", "I2", "I3"])
+
+    LOW = devices.LOW
+    HIGH = devices.HIGH
+
+    # Make devices
+    gate_id = eval(gate_id)
+    gate_kind = eval(gate_kind)
+    devices.make_device(gate_id, gate_kind, 3)
+    devices.make_device(SW1_ID, devices.SWITCH, 0)
+    devices.make_device(SW2_ID, devices.SWITCH, 0)
+    devices.make_device(SW3_ID, devices.SWITCH, 0)
+
+    # Make connections
+    network.make_connection(SW1_ID, None, gate_id, I1)
+    network.make_connection(SW2_ID, None, gate_id, I2)
+    network.make_connection(SW3_ID, None, gate_id, I3)
+
+    # Set switches
+    switches = [SW1_ID, SW2_ID, SW3_ID]
+    for i, switch_output in enumerate(switch_outputs):
+        devices.set_switch(switches[i], eval(switch_output))
+
+    network.execute_network()
+    assert network.get_output_signal(gate_id, None) == eval(gate_output)
+
+
+def test_execute_non_gates(new_network):
+    """Test if execute_network returns the correct output for non-gate devices.
+
+    Tests switches, D-types and clocks.
+    """
+    network = new_network
+    devices = network.devices
+    names = devices.names
+
+    LOW = devices.LOW
+    HIGH = devices.HIGH
+
+    # Make different devices
+    [SW1_ID, SW2_ID, SW3_ID, CL_ID, D_ID] = names.lookup(["Sw1", "Sw2", "Sw3",
+                                                          "Clock1", "D1"])
+    devices.make_device(SW1_ID, devices.SWITCH, 1)
+    devices.make_device(SW2_ID, devices.SWITCH, 0)
+    devices.make_device(SW3_ID, devices.SWITCH, 0)
+    devices.make_device(CL_ID, devices.CLOCK, 1)
+    devices.make_device(D_ID, devices.D_TYPE)
+
+    # Make connections
+    network.make_connection(SW1_ID, None, D_ID, devices.DATA_ID)
+    network.make_connection(CL_ID, None, D_ID, devices.CLK_ID)
+    network.make_connection(SW2_ID, None, D_ID, devices.SET_ID)
+    network.make_connection(SW3_ID, None, D_ID, devices.CLEAR_ID)
+
+    # Get device outputs, the expression is in a string here so that it
+    # can be re-evaluated again after executing devices
+    sw1_output = "network.get_output_signal(SW1_ID, None)"
+    sw2_output = "network.get_output_signal(SW2_ID, None)"
+    sw3_output = "network.get_output_signal(SW3_ID, None)"
+    clock_output = "network.get_output_signal(CL_ID, None)"
+    dtype_Q = "network.get_output_signal(D_ID, devices.Q_ID)"
+    dtype_QBAR = "network.get_output_signal(D_ID, devices.QBAR_ID)"
+
+    # Execute devices until the clock is LOW at the start of its
+    # period
+    network.execute_network()
+    while (network.get_clock_counter(CL_ID) != 1 or
+           eval(clock_output) != LOW):
+        network.execute_network()
+
+    # The clock is not rising yet, Q could be (randomly) HIGH or LOW
+    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
+            eval(clock_output)] == [HIGH, LOW, LOW, LOW]
+
+    assert eval(dtype_Q) in [HIGH, LOW]
+    assert eval(dtype_QBAR) == network.invert_signal(eval(dtype_Q))
+
+    network.execute_network()  # the clock has risen
+    # While sw1(DATA) is high, Q has now changed to HIGH
+    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
+            eval(clock_output), eval(dtype_Q), eval(dtype_QBAR)] == [
+                HIGH, LOW, LOW, HIGH, HIGH, LOW]
+
+    devices.set_switch(SW1_ID, LOW)  # Sw1 is connected to DATA
+    devices.set_switch(SW2_ID, HIGH)  # Sw2 is connected to SET
+    network.execute_network()  # the clock is not rising yet
+    network.execute_network()  # the clock has risen
+    # Even if sw1(DATA) is LOW, and the clock is rising,
+    # sw2(SET) is HIGH, so Q is HIGH
+    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
+            eval(clock_output), eval(dtype_Q), eval(dtype_QBAR)] == [
+                LOW, HIGH, LOW, HIGH, HIGH, LOW]
+
+    devices.set_switch(SW1_ID, HIGH)  # Sw1 is connected to DATA
+    devices.set_switch(SW2_ID, LOW)  # Sw2 is connected to SET
+    devices.set_switch(SW3_ID, HIGH)  # Sw3 is connected to CLEAR
+    network.execute_network()  # the clock is not rising yet
+    network.execute_network()  # the clock has risen
+    # Even if sw1(DATA) is HIGH, and the clock is rising,
+    # sw3(CLEAR) is HIGH, so Q is LOW
+    assert [eval(sw1_output), eval(sw2_output), eval(sw3_output),
+            eval(clock_output), eval(dtype_Q), eval(dtype_QBAR)] == [
+                HIGH, LOW, HIGH, HIGH, LOW, HIGH]
+
+
+def test_oscillating_network(new_network):
+    """Test if the execute_network returns False for oscillating networks."""
+    network = new_network
+    devices = network.devices
+    names = devices.names
+
+    [NOR1, I1] = names.lookup(["Nor1", "I1"])
+    # Make NOR gate
+    devices.make_device(NOR1, devices.NOR, 1)
+
+    # Connect the NOR gate to itself
+    network.make_connection(NOR1, None, NOR1, I1)
+
+    assert not network.execute_network()
+
+
+def make_clocked_network(seed):
+    """Return a network and monitors for a slow clock driving a D-type.
+
+    The D-type output is inverted and fed back into its data input, so Q
+    toggles on every rising clock edge.
+    """
+    [names, error_handler, devices, network,
+     monitors] = make_objects()
+
+    [SW1_ID, CL_ID, D_ID, NOT1_ID, I1] = names.lookup(["Sw1", "Clock1", "D1",
+                                                       "Not1", "I1"])
+    devices.make_device(SW1_ID, devices.SWITCH, 0)
+    devices.make_device(CL_ID, devices.CLOCK, 7)
+    devices.make_device(D_ID, devices.D_TYPE)
+    devices.make_device(NOT1_ID, devices.NOT)
+
+    network.make_connection(CL_ID, None, D_ID, devices.CLK_ID)
+    network.make_connection(SW1_ID, None, D_ID, devices.SET_ID)
+    network.make_connection(SW1_ID, None, D_ID, devices.CLEAR_ID)
+    network.make_connection(D_ID, devices.Q_ID, NOT1_ID, I1)
+    network.make_connection(NOT1_ID, None, D_ID, devices.DATA_ID)
+
+    monitors.make_monitor(CL_ID, None)
+    monitors.make_monitor(D_ID, devices.Q_ID)
+
+    devices.cold_startup(seed)
+    network.reset_clocks()
+    return network, monitors
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_execute_cycles(seed):
+    """Test if execute_cycles matches executing the network cycle by cycle."""
+    network, monitors = make_clocked_network(seed)
+    for _ in range(100):
+        assert network.execute_network()
+        monitors.record_signals()
+    expected_signals = dict(monitors.monitors_dictionary)
+
+    network, monitors = make_clocked_network(seed)
+    executed_cycles = []
+    execute_network = network.execute_network
+
+    def counting_execute_network():
+        executed_cycles.append(network.cycle_count)
+        return execute_network()
+
+    network.execute_network = counting_execute_network
+    assert network.execute_cycles(60, monitors)
+    assert network.execute_cycles(40, monitors)
+
+    assert monitors.monitors_dictionary == expected_signals
+    assert network.cycle_count == 100
+    # Only the cycles on and just after a clock edge need executing
+    assert len(executed_cycles) < 40
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_execute_cycles_steady_state(seed):
+    """Test if execute_cycles repeats periodic states exactly."""
+    network, monitors = make_clocked_network(seed)
+    for _ in range(1000):
+        assert network.execute_network()
+        monitors.record_signals()
+    expected_signals = dict(monitors.monitors_dictionary)
+
+    network, monitors = make_clocked_network(seed)
+    executed_cycles = []
+    execute_network = network.execute_network
+
+    def counting_execute_network():
+        executed_cycles.append(network.cycle_count)
+        return execute_network()
+
+    network.execute_network = counting_execute_network
+    assert network.execute_cycles(1000, monitors)
+
+    assert monitors.monitors_dictionary == expected_signals
+    assert network.cycle_count == 1000
+    # Q toggles on every rising edge, so the state repeats every two clock
+    # periods
+    assert network.detected_period == 28
+    assert len(executed_cycles) < 20
+
+
+def test_execute_cycles_state_memory(new_objects):
+    """Test if the stored states stay small for a large acyclic network."""
+    [names, error_handler, devices, network,
+     monitors] = new_objects
+
+    # Clock1 gives a clock boundary in every cycle, while Clock2 and Clock3
+    # stop the state from repeating during the run
+    clock_ids = names.lookup(["Clock1", "Clock2", "Clock3"])
+    for clock_id, half_period in zip(clock_ids, [1, 97, 101]):
+        devices.make_device(clock_id, devices.CLOCK, half_period)
+    [I1] = names.lookup(["I1"])
+    for index in range(400):
+        [NOT_ID] = names.lookup(["Not" + str(index)])
+        devices.make_device(NOT_ID, devices.NOT)
+        network.make_connection(clock_ids[0], None, NOT_ID, I1)
+
+    tracemalloc.start()
+    try:
+        assert network.execute_cycles(300)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert network.detected_period is None
+    # Storing all 300 full states would take over a megabyte
+    assert peak < 200000
+
+
+def test_oscillating_loop(new_objects):
+    """Test if the smallest oscillating loop is found by device names."""
+    [names, error_handler, devices, network,
+     monitors] = new_objects
+
+    [SW1_ID, NAND1_ID, NOT1_ID, NOT2_ID, NOT3_ID, OR1_ID, I1,
+     I2] = names.lookup(["Sw1", "Nand1", "Not1", "Not2", "Not3", "Or1", "I1",
+                         "I2"])
+    devices.make_device(SW1_ID, devices.SWITCH, 1)
+    devices.make_device(NAND1_ID, devices.NAND, 2)
+    devices.make_device(NOT1_ID, devices.NOT)
+    devices.make_device(NOT2_ID, devices.NOT)
+    devices.make_device(NOT3_ID, devices.NOT)
+    devices.make_device(OR1_ID, devices.OR, 2)
+
+    # Nand1, Not1 and Not2 form a ring oscillator while Sw1 is HIGH. Not3 and
+    # Or1 are driven by the ring but are not part of it.
+    network.make_connection(SW1_ID, None, NAND1_ID, I1)
+    network.make_connection(NOT2_ID, None, NAND1_ID, I2)
+    network.make_connection(NAND1_ID, None, NOT1_ID, I1)
+    network.make_connection(NOT1_ID, None, NOT2_ID, I1)
+    network.make_connection(NOT2_ID, None, NOT3_ID, I1)
+    network.make_connection(NOT3_ID, None, OR1_ID, I1)
+    network.make_connection(SW1_ID, None, OR1_ID, I2)
+
+    assert network.oscillating_devices == []
+    network.diagnostic_sweeps = 0
+    assert not network.execute_network()
+    failed_outputs = [dict(device.outputs)
+                      for device in devices.devices_list]
+
+    # Starting again from LOW outputs, the diagnostic sweeps leave the
+    # outputs as the failed cycle left them
+    for device in devices.devices_list:
+        device.outputs.update(dict.fromkeys(device.outputs, devices.LOW))
+    network.cycle_count = 0
+    network.diagnostic_sweeps = 4
+    assert not network.execute_network()
+    assert network.oscillating_devices == [NAND1_ID, NOT1_ID, NOT2_ID]
+    assert [dict(device.outputs)
+            for device in devices.devices_list] == failed_outputs
+
+    # A cycle that settles clears the loop found before
+    devices.set_switch(SW1_ID, 0)
+    assert network.execute_network()
+    assert network.oscillating_devices == []
+
+
+def test_iteration_limit(new_objects):
+    """Test if the settle iteration limit follows the logic depth."""
+    [names, error_handler, devices, network,
+     monitors] = new_objects
+
+    [SW1_ID, NOT1_ID, NOT2_ID, NOT3_ID, I1] = names.lookup(
+        ["Sw1", "Not1", "Not2", "Not3", "I1"])
+    devices.make_device(SW1_ID, devices.SWITCH, 1)
+    devices.make_device(NOT1_ID, devices.NOT)
+    devices.make_device(NOT2_ID, devices.NOT)
+    devices.make_device(NOT3_ID, devices.NOT)
+    network.make_connection(SW1_ID, None, NOT1_ID, I1)
+    network.make_connection(NOT1_ID, None, NOT2_ID, I1)
+    network.make_connection(NOT2_ID, None, NOT3_ID, I1)
+
+    network.elaborate()
+    assert network.logic_depth == 3
+    assert network.get_iteration_limit() == 9
+    assert network.execute_network()
+    assert network.metrics.recent_cycles[-1][1] <= 9
+
+    # The limit can be overridden, even below what the network needs
+    network.iteration_limit = 2
+    devices.set_switch(SW1_ID, 0)
+    assert not network.execute_network()
+    assert network.metrics.recent_cycles[-1][1] == 2
+
+    network.iteration_limit = None
+    assert network.execute_network()
+    assert network.metrics.get_summary()["executed_cycles"] == 3
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_cycle_metrics(seed):
+    """Test if the activity of every executed cycle is counted."""
+    network, monitors = make_clocked_network(seed)
+    for _ in range(14):  # let the start-up state settle
+        assert network.execute_network()
+    network.metrics.reset()
+
+    # One clock period: a rising and a falling edge
+    for _ in range(14):
+        assert network.execute_network()
+    summary = network.metrics.get_summary()
+    assert summary["clock_edges"] == 2
+    assert summary["d_type_captures"] == 1
+    # Q, QBAR and the NOT gate output each change once
+    assert summary["transitions"] == 3
+    # Sw1, Clock1, D1 and Not1 run in every sweep
+    assert summary["devices_evaluated"] == 4 * summary["settle_iterations"]
+
+
+def test_execute_cycles_progress():
+    """Test if execute_cycles reports its progress and can be stopped."""
+    network, monitors = make_clocked_network(1)
+    network.state_history_limit = 0  # execute every clock edge
+    reports = []
+
+    def progress(completed):
+        reports.append(completed)
+        return completed < 30
+
+    assert network.execute_cycles(100, monitors, progress)
+    assert reports == sorted(reports)
+    assert reports[-1] >= 30
+    assert reports[-2] < 30
+    assert network.cycles_run == reports[-1]
+    for signal_list in monitors.monitors_dictionary.values():
+        assert len(signal_list) == network.cycles_run
+
+
+def make_bus_network(use_bus, feedback=False):
+    """Return a network and monitors for a counter-like register of D-types.
+
+    Every D-type is clocked by one clock and its data comes from an XOR of
+    its own QBAR with a NOT of a switch, or from the QBAR of the previous
+    D-type if feedback is True. The NOTs, XORs and D-types are ranges of
+    four devices, made as buses if use_bus is True and one by one if not.
+    """
+    [names, error_handler, devices, network,
+     monitors] = make_objects()
+
+    [CL_ID, Z_ID, I1, I2] = names.lookup(["Clock1", "Zero", "I1", "I2"])
+    switch_ids = names.lookup(["Sw" + str(index) for index in range(4)])
+    not_ids = names.lookup(["Not" + str(index) for index in range(4)])
+    xor_ids = names.lookup(["Xor" + str(index) for index in range(4)])
+    d_ids = names.lookup(["D" + str(index) for index in range(4)])
+    devices.make_device(CL_ID, devices.CLOCK, 2)
+    devices.make_device(Z_ID, devices.SWITCH, 0)
+    for index, switch_id in enumerate(switch_ids):
+        devices.make_device(switch_id, devices.SWITCH, index % 2)
+    for device_ids, kind in [(not_ids, devices.NOT), (xor_ids, devices.XOR),
+                             (d_ids, devices.D_TYPE)]:
+        if use_bus:
+            devices.make_bus(device_ids, kind)
+        else:
+            for device_id in device_ids:
+                devices.make_device(device_id, kind)
+
+    for index in range(4):
+        network.make_connection(switch_ids[index], None, not_ids[index], I1)
+        network.make_connection(not_ids[index], None, xor_ids[index], I1)
+        network.make_connection(d_ids[index], devices.QBAR_ID,
+                                xor_ids[index], I2)
+        if feedback:
+            network.make_connection(d_ids[index - 1], devices.QBAR_ID,
+                                    d_ids[index], devices.DATA_ID)
+        else:
+            network.make_connection(xor_ids[index], None, d_ids[index],
+                                    devices.DATA_ID)
+        network.make_connection(CL_ID, None, d_ids[index], devices.CLK_ID)
+        network.make_connection(Z_ID, None, d_ids[index], devices.SET_ID)
+        network.make_connection(Z_ID, None, d_ids[index], devices.CLEAR_ID)
+        monitors.make_monitor(d_ids[index], devices.Q_ID)
+        monitors.make_monitor(xor_ids[index], None)
+
+    devices.cold_startup(5)
+    network.reset_clocks()
+    return network, monitors
+
+
+@pytest.mark.parametrize("feedback, vectorized", [(False, 3), (True, 2)])
+def test_execute_bus(feedback, vectorized):
+    """Test if buses give the same signals as devices made one by one."""
+    bus_network, bus_monitors = make_bus_network(True, feedback)
+    network, monitors = make_bus_network(False, feedback)
+    for cycle in range(20):
+        assert bus_network.execute_network()
+        assert network.execute_network()
+        bus_monitors.record_signals()
+        monitors.record_signals()
+    assert bus_monitors.monitors_dictionary == monitors.monitors_dictionary
+    assert (bus_network.metrics.get_summary() ==
+            network.metrics.get_summary())
+
+    # Buses feeding themselves are executed device by device
+    buses = [run for runs in bus_network.device_lists for run in runs
+             if not isinstance(run, list)]
+    assert len(buses) == vectorized
+
+    # The bus signals read follow the monitors being changed
+    for cycles, pattern in [(20, "Xor1"), (25, "D2.QBAR")]:
+        for each_monitors in [bus_monitors, monitors]:
+            [[device_id, output_id]] = each_monitors.find_signals(pattern)
+            if pattern == "Xor1":
+                assert each_monitors.remove_monitor(device_id, output_id)
+            else:
+                assert (each_monitors.make_monitor(device_id, output_id,
+                                                   cycles) ==
+                        each_monitors.NO_ERROR)
+        for cycle in range(5):
+            assert bus_network.execute_network()
+            assert network.execute_network()
+            bus_monitors.record_signals()
+            monitors.record_signals()
+        assert (bus_monitors.monitors_dictionary ==
+                monitors.monitors_dictionary)
+    for signal_list in bus_monitors.monitors_dictionary.values():
+        assert len(signal_list) == 30
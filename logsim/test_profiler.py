@@ -0,0 +1,91 @@
+"""Test the profiler module."""
+import tracemalloc
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from error_handling import ErrorHandler
+from profiler import Profiler
+
+
+def test_profiler_counts_calls():
+    """Test if the profiler counts phase calls and executed device kinds."""
+    names = Names()
+    error_handler = ErrorHandler(names)
+    devices = Devices(names, error_handler)
+    network = Network(names, devices, error_handler)
+    monitors = Monitors(names, devices, network, error_handler)
+    profiler = Profiler(names, devices)
+    assert not tracemalloc.is_tracing()
+    profiler.instrument_simulator(devices, network, monitors)
+
+    [SW1_ID, NOT1_ID, I1] = names.lookup(["Sw1", "Not1", "I1"])
+    devices.make_device(SW1_ID, devices.SWITCH, 1)
+    devices.make_device(NOT1_ID, devices.NOT)
+    network.make_connection(SW1_ID, None, NOT1_ID, I1)
+    monitors.make_monitor(NOT1_ID, None)
+
+    for _ in range(3):
+        assert network.execute_network()
+        monitors.record_signals()
+    assert monitors.monitors_dictionary[(NOT1_ID, None)] == [devices.LOW] * 3
+
+    calls = {name: calls for name, calls, seconds, allocated
+             in profiler.get_rows()}
+    assert calls["Devices.make_device"] == 2
+    assert calls["Network.execute_network"] == 3
+    assert calls["Monitors.record_signals"] == 3
+    assert calls["Network.elaborate"] == 1
+    assert "Network.execute_cycles" not in calls
+    # Each cycle takes two sweeps: one to settle and one to see it settled
+    assert calls["SWITCH"] == calls["NOT"] == 6
+
+    # With a clock, the period of the network is found in the first cycles
+    # and the rest are repeated
+    [CL_ID] = names.lookup(["Clock1"])
+    devices.make_device(CL_ID, devices.CLOCK, 2)
+    monitors.make_monitor(CL_ID, None, 3)
+    network.reset_clocks()
+    assert network.execute_cycles(50, monitors)
+    calls = {name: calls for name, calls, seconds, allocated
+             in profiler.get_rows()}
+    assert calls["Network.execute_cycles"] == 1
+    assert calls["Monitors.repeat_signals"] == 1
+    assert calls["Network.execute_network"] < 50
+
+
+class Allocator:
+
+    """Allocate a list of the given length, optionally inside another call."""
+
+    def allocate(self, length):
+        """Allocate a list of length items and drop it."""
+        return len([0] * length)
+
+    def allocate_twice(self, length):
+        """Allocate a list of length items, then one of half that length."""
+        return self.allocate(length) + self.allocate(length // 2)
+
+
+def test_profiler_traces_memory():
+    """Test if the profiler reports the peak memory of nested phases."""
+    names = Names()
+    devices = Devices(names, ErrorHandler(names))
+    profiler = Profiler(names, devices, trace_memory=True)
+    allocator = Allocator()
+    profiler.instrument(allocator, "allocate", "allocate")
+    profiler.instrument(allocator, "allocate_twice", "allocate_twice")
+    try:
+        assert tracemalloc.is_tracing()
+        assert allocator.allocate_twice(100000) == 150000
+    finally:
+        tracemalloc.stop()
+
+    peaks = {name: peak for name, calls, seconds, peak
+             in profiler.get_rows()}
+    # A list of 100000 items takes 800000 bytes, which is freed before the
+    # second list is allocated
+    assert 800000 <= peaks["allocate"] < 900000
+    assert 800000 <= peaks["allocate_twice"] < 900000
+    assert peaks["allocate_twice"] >= peaks["allocate"]
@@ -1,331 +1,493 @@
-"""Implement the interactive command line user interface.
-
-Used in the Logic Simulator project to enable the user to enter commands
-to run the simulation or adjust the network properties.
-
-Classes:`
---------
-UserInterface - reads and parses user commands.
-"""
-
-
-class UserInterface:
-
-    """Read and parse user commands.
-
-    This class allows the user to enter certain commands.
-    These commands enable the user to run or continue the simulation for a
-    number of cycles, set switches, add or zap monitors, show help, or quit
-    the program.
-
-    Parameters
-    -----------
-    names: instance of the names.Names() class.
-    devices: instance of the devices.Devices() class.
-    network: instance of the network.Network() class.
-    monitors: instance of the monitors.Monitors() class.
-
-    Public methods:
-    ---------------
-    command_interface(self): Reads in the commands and calls the corresponding
-                             functions.
-
-    get_line(self): Prints a prompt for the user and updates the user entry.
-
-    read_command(self): Returns the first non-whitespace character.
-
-    get_character(self): Moves the cursor forward by one character in the user
-                         entry.
-
-    skip_spaces(self): Skips whitespace characters until a non-whitespace
-                       character is reached.
-
-    read_string(self): Returns the next alphanumeric string.
-
-    read_name(self): Returns the name ID of the current string.
-
-    read_signal_name(self): Returns the device and port IDs of the current
-                            signal name.
-
-    read_number(self, lower_bound, upper_bound): Returns the current number.
-
-    help_command(self): Prints a list of valid commands.
-
-    switch_command(self): Sets the specified switch to the specified signal
-                          level.
-
-    monitor_command(self): Sets the specified monitor.
-
-    zap_command(self): Removes the specified monitor.
-
-    run_network(self, cycles): Runs the network for the specified number of
-                               simulation cycles.
-
-    run_command(self): Runs the simulation from scratch.
-
-    continue_command(self): Continues a previously run simulation.
-    """
-
-    def __init__(self, names, devices, network, monitors):
-        """Initialise variables."""
-        self.names = names
-        self.devices = devices
-        self.monitors = monitors
-        self.network = network
-
-        self.cycles_completed = 0  # number of simulation cycles completed
-
-        self.character = ""  # current character
-        self.line = ""  # current string entered by the user
-        self.cursor = 0  # cursor position
-
-    def command_interface(self):
-        """Read the command entered and call the corresponding function."""
-        print("Logic Simulator: interactive command line user interface.\n"
-              "Enter 'h' for help.")
-        self.get_line()  # get the user entry
-        command = self.read_command()  # read the first character
-        while command != "q":
-            if command == "h":
-                self.help_command()
-            elif command == "s":
-                self.switch_command()
-            elif command == "a":
-                self.add_con()
-            elif command == "e":
-                self.remove_con()
-            elif command == "m":
-                self.monitor_command()
-            elif command == "z":
-                self.zap_command()
-            elif command == "r":
-                self.run_command()
-            elif command == "c":
-                self.continue_command()
-            else:
-                print("Invalid command. Enter 'h' for help.")
-            self.get_line()  # get the user entry
-            command = self.read_command()  # read the first character
-
-    def get_line(self):
-        """Print prompt for the user and update the user entry."""
-        self.cursor = 0
-        self.line = input("#: ")
-        while self.line == "":  # if the user enters a blank line
-            self.line = input("#: ")
-
-    def read_command(self):
-        """Return the first non-whitespace character."""
-        self.skip_spaces()
-        return self.character
-
-    def get_character(self):
-        """Move the cursor forward by one character in the user entry."""
-        if self.cursor < len(self.line):
-            self.character = self.line[self.cursor]
-            self.cursor += 1
-        else:  # end of the line
-            self.character = ""
-
-    def skip_spaces(self):
-        """Skip whitespace until a non-whitespace character is reached."""
-        self.get_character()
-        while self.character.isspace():
-            self.get_character()
-
-    def read_string(self):
-        """Return the next alphanumeric string."""
-        self.skip_spaces()
-        name_string = ""
-        if not self.character.isalpha():  # the string must start with a letter
-            print("Error! Expected a name.")
-            return None
-        while self.character.isalnum():
-            name_string = "".join([name_string, self.character])
-            self.get_character()
-        return name_string
-
-    def read_name(self):
-        """Return the name ID of the current string if valid.
-
-        Return None if the current string is not a valid name string.
-        """
-        name_string = self.read_string()
-        if name_string is None:
-            return None
-        else:
-            name_id = self.names.query(name_string)
-        if name_id is None:
-            print("Error! Unknown name.")
-        return name_id
-
-    def read_signal_name(self):
-        """Return the device and port IDs of the current signal name.
-
-        Return None if either is invalid.
-        """
-        device_id = self.read_name()
-        if device_id is None:
-            return None
-        elif self.character == ".":
-            port_id = self.read_name()
-            if port_id is None:
-                return None
-        else:
-            port_id = None
-        return [device_id, port_id]
-
-    def read_number(self, lower_bound, upper_bound):
-        """Return the current number.
-
-        Return None if no number is provided or if it falls outside the valid
-        range.
-        """
-        self.skip_spaces()
-        number_string = ""
-        if not self.character.isdigit():
-            print("Error! Expected a number.")
-            return None
-        while self.character.isdigit():
-            number_string = "".join([number_string, self.character])
-            self.get_character()
-        number = int(number_string)
-
-        if upper_bound is not None:
-            if number > upper_bound:
-                print("Number out of range.")
-                return None
-
-        if lower_bound is not None:
-            if number < lower_bound:
-                print("Number out of range.")
-                return None
-
-        return number
-
-    def help_command(self):
-        """Print a list of valid commands."""
-        print("User commands:")
-        print("r N       - run the simulation for N cycles")
-        print("c N       - continue the simulation for N cycles")
-        print("s X N     - set switch X to N (0 or 1)")
-        print("m X       - set a monitor on signal X")
-        print("z X       - zap the monitor on signal X")
-        print("h         - help (this command)")
-        print("q         - quit the program")
-
-    def switch_command(self):
-        """Set the specified switch to the specified signal level."""
-        switch_id = self.read_name()
-        if switch_id is not None:
-            switch_state = self.read_number(0, 1)
-            if switch_state is not None:
-                if self.devices.set_switch(switch_id, switch_state):
-                    print("Successfully set switch.")
-                else:
-                    print("Error! Invalid switch.")
-
-
-
-
-    def add_con(self):
-        [device_id1, port_id1] = self.read_signal_name()
-        if device_id1:
-            if port_id1 == None:
-                [device_id2, port_id2] = self.read_signal_name()
-                if device_id2:
-                    device = self.devices.get_device(device_id2)
-                    if port_id2 in device.inputs.keys():
-                        self.network.make_connection(
-                        device_id1,
-                        port_id1,
-                        device_id2,
-                        port_id2)
-                    else:
-                        print('The input port used is invalid.')
-                else:
-                    print('Invalid input device.')
-            else:
-                print('Trying to connect input port of device ', self.names.get_name_string(device_id1))
-        else:
-            print('Invali output device.')
-    
-    
-    def remove_con(self):
-        [device_id1, port_id1] = self.read_signal_name()
-        if port_id1 == None:
-            [device_id2, port_id2] = self.read_signal_name()
-            if device_id2:
-                device = self.devices.get_device(device_id2)
-                if port_id2 in device.inputs.keys():
-                    device.inputs[port_id2] = None
-                else:
-                    print('The input port used is invalid.')
-            else:
-                print('There is no input device')
-        else:
-            device = self.devices.get_device(device_id1)
-            if port_id1 in device.inputs.keys():
-                device.inputs[port_id1] = None
-
-            else:
-                print('There is not input-input connection')
-
-    def monitor_command(self):
-        """Set the specified monitor."""
-        monitor = self.read_signal_name()
-        if monitor is not None:
-            [device, port] = monitor
-            monitor_error = self.monitors.make_monitor(device, port,
-                                                       self.cycles_completed)
-            if monitor_error == self.monitors.NO_ERROR:
-                print("Successfully made monitor.")
-            else:
-                print("Error! Could not make monitor.")
-
-    def zap_command(self):
-        """Remove the specified monitor."""
-        monitor = self.read_signal_name()
-        if monitor is not None:
-            [device, port] = monitor
-            if self.monitors.remove_monitor(device, port):
-                print("Successfully zapped monitor")
-            else:
-                print("Error! Could not zap monitor.")
-
-    def run_network(self, cycles):
-        """Run the network for the specified number of simulation cycles.
-
-        Return True if successful.
-        """
-        for _ in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
-            else:
-                print("Error! Network oscillating.")
-                return False
-        self.monitors.display_signals()
-        return True
-
-    def run_command(self):
-        """Run the simulation from scratch."""
-        self.cycles_completed = 0
-        cycles = self.read_number(0, None)
-
-        if cycles is not None:  # if the number of cycles provided is valid
-            self.monitors.reset_monitors()
-            print("".join(["Running for ", str(cycles), " cycles"]))
-            self.devices.cold_startup()
-            if self.run_network(cycles):
-                self.cycles_completed += cycles
-
-    def continue_command(self):
-        """Continue a previously run simulation."""
-        cycles = self.read_number(0, None)
-        if cycles is not None:  # if the number of cycles provided is valid
-            if self.cycles_completed == 0:
-                print("Error! Nothing to continue. Run first.")
-            elif self.run_network(cycles):
-                self.cycles_completed += cycles
-                print(" ".join(["Continuing for", str(cycles), "cycles.",
-                                "Total:", str(self.cycles_completed)]))
+"""Implement the interactive command line user interface.
+
+Used in the Logic Simulator project to enable the user to enter commands
+to run the simulation or adjust the network properties.
+
+Classes:`
+--------
+UserInterface - reads and parses user commands.
+"""
+
+try:
+    import readline  # tab completion, not available on every platform
+except ImportError:
+    readline = None
+
+
+class UserInterface:
+
+    """Read and parse user commands.
+
+    This class allows the user to enter certain commands.
+    These commands enable the user to run or continue the simulation for a
+    number of cycles, set switches, add or zap monitors, show help, or quit
+    the program. Monitors can be added or zapped on every signal matching a
+    glob pattern such as nand*, and signal names can be completed with tab.
+
+    Parameters
+    -----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    network: instance of the network.Network() class.
+    monitors: instance of the monitors.Monitors() class.
+    seed: seed for the cold start-up of D-types and clocks, or None for a
+          different random start-up on every run.
+    iteration_limit: number of iterations allowed for a cycle to settle, or
+                     None to derive it from the logic depth.
+
+    Public methods:
+    ---------------
+    command_interface(self): Reads in the commands and calls the corresponding
+                             functions.
+
+    get_line(self): Prints a prompt for the user and updates the user entry.
+
+    read_command(self): Returns the first non-whitespace character.
+
+    get_character(self): Moves the cursor forward by one character in the user
+                         entry.
+
+    skip_spaces(self): Skips whitespace characters until a non-whitespace
+                       character is reached.
+
+    read_string(self): Returns the next alphanumeric string.
+
+    read_name(self): Returns the name ID of the current string.
+
+    read_signal_name(self): Returns the device and port IDs of the current
+                            signal name.
+
+    read_signal_pattern(self): Returns the device and port IDs of every
+                               signal matching the current name or pattern.
+
+    read_number(self, lower_bound, upper_bound): Returns the current number.
+
+    get_completions(self, prefix): Returns the signal and input names
+                                   starting with prefix.
+
+    complete(self, text, state): Returns the state-th completion of text, for
+                                 readline.
+
+    help_command(self): Prints a list of valid commands.
+
+    switch_command(self): Sets the specified switch to the specified signal
+                          level.
+
+    monitor_command(self): Sets the specified monitor.
+
+    zap_command(self): Removes the specified monitor.
+
+    limit_command(self): Sets the number of iterations allowed for a cycle to
+                         settle.
+
+    metrics_command(self): Prints the statistics of the executed cycles.
+
+    run_network(self, cycles): Runs the network for the specified number of
+                               simulation cycles.
+
+    run_command(self): Runs the simulation from scratch.
+
+    continue_command(self): Continues a previously run simulation.
+    """
+
+    def __init__(self, names, devices, network, monitors, seed=None,
+                 iteration_limit=None):
+        """Initialise variables."""
+        self.names = names
+        self.devices = devices
+        self.monitors = monitors
+        self.network = network
+        self.seed = seed
+        if iteration_limit is not None:
+            self.network.iteration_limit = iteration_limit
+
+        self.cycles_completed = 0  # number of simulation cycles completed
+
+        self.character = ""  # current character
+        self.line = ""  # current string entered by the user
+        self.cursor = 0  # cursor position
+
+        self.completions = []  # completions of the text being completed
+
+    def command_interface(self):
+        """Read the command entered and call the corresponding function."""
+        print("Logic Simulator: interactive command line user interface.\n"
+              "Enter 'h' for help.")
+        if readline is not None:
+            readline.set_completer(self.complete)
+            readline.set_completer_delims(" \t")
+            readline.parse_and_bind("tab: complete")
+        self.get_line()  # get the user entry
+        command = self.read_command()  # read the first character
+        while command != "q":
+            if command == "h":
+                self.help_command()
+            elif command == "s":
+                self.switch_command()
+            elif command == "a":
+                self.add_con()
+            elif command == "e":
+                self.remove_con()
+            elif command == "m":
+                self.monitor_command()
+            elif command == "z":
+                self.zap_command()
+            elif command == "r":
+                self.run_command()
+            elif command == "c":
+                self.continue_command()
+            elif command == "l":
+                self.limit_command()
+            elif command == "i":
+                self.metrics_command()
+            else:
+                print("Invalid command. Enter 'h' for help.")
+            self.get_line()  # get the user entry
+            command = self.read_command()  # read the first character
+
+    def get_line(self):
+        """Print prompt for the user and update the user entry."""
+        self.cursor = 0
+        self.line = input("#: ")
+        while self.line == "":  # if the user enters a blank line
+            self.line = input("#: ")
+
+    def read_command(self):
+        """Return the first non-whitespace character."""
+        self.skip_spaces()
+        return self.character
+
+    def get_character(self):
+        """Move the cursor forward by one character in the user entry."""
+        if self.cursor < len(self.line):
+            self.character = self.line[self.cursor]
+            self.cursor += 1
+        else:  # end of the line
+            self.character = ""
+
+    def skip_spaces(self):
+        """Skip whitespace until a non-whitespace character is reached."""
+        self.get_character()
+        while self.character.isspace():
+            self.get_character()
+
+    def read_string(self):
+        """Return the next alphanumeric string."""
+        self.skip_spaces()
+        name_string = ""
+        if not self.character.isalpha():  # the string must start with a letter
+            print("Error! Expected a name.")
+            return None
+        while self.character.isalnum():
+            name_string = "".join([name_string, self.character])
+            self.get_character()
+        return name_string
+
+    def read_name(self):
+        """Return the name ID of the current string if valid.
+
+        Return None if the current string is not a valid name string.
+        """
+        name_string = self.read_string()
+        if name_string is None:
+            return None
+        else:
+            name_id = self.names.query(name_string)
+        if name_id is None:
+            print("Error! Unknown name.")
+        return name_id
+
+    def read_signal_name(self):
+        """Return the device and port IDs of the current signal name.
+
+        Return None if either is invalid.
+        """
+        device_id = self.read_name()
+        if device_id is None:
+            return None
+        elif self.character == ".":
+            port_id = self.read_name()
+            if port_id is None:
+                return None
+        else:
+            port_id = None
+        return [device_id, port_id]
+
+    def read_signal_pattern(self):
+        """Return [device_id, port_id] of every signal matching the entry.
+
+        The entry is either a signal name, giving a single signal, or a
+        pattern such as nand*, d?.Q or d[1 TO 64].Q, giving every matching
+        output. Return None if the name is invalid or nothing matches the
+        pattern.
+        """
+        self.skip_spaces()
+        if self.character == "":
+            print("Error! Expected a name.")
+            return None
+        start = self.cursor - 1  # position of the current character
+        end = start
+        while end < len(self.line) and (self.line[end].isalnum() or
+                                        self.line[end] in ".*?["):
+            if self.line[end] == "[":  # a range may contain spaces
+                close = self.line.find("]", end)
+                end = len(self.line) if close == -1 else close
+            end += 1
+        pattern = self.line[start:end]
+        if not any(character in "*?[" for character in pattern):
+            self.cursor = start
+            signal = self.read_signal_name()
+            if signal is None:
+                return None
+            return [signal]
+
+        self.cursor = end
+        self.get_character()
+        signals = self.monitors.find_signals(pattern)
+        if not signals:
+            print("Error! No signal matches " + pattern + ".")
+            return None
+        return signals
+
+    def read_number(self, lower_bound, upper_bound):
+        """Return the current number.
+
+        Return None if no number is provided or if it falls outside the valid
+        range.
+        """
+        self.skip_spaces()
+        number_string = ""
+        if not self.character.isdigit():
+            print("Error! Expected a number.")
+            return None
+        while self.character.isdigit():
+            number_string = "".join([number_string, self.character])
+            self.get_character()
+        number = int(number_string)
+
+        if upper_bound is not None:
+            if number > upper_bound:
+                print("Number out of range.")
+                return None
+
+        if lower_bound is not None:
+            if number < lower_bound:
+                print("Number out of range.")
+                return None
+
+        return number
+
+    def get_completions(self, prefix):
+        """Return the signal and input names starting with prefix.
+
+        The names come from the signal index of the monitors.
+        """
+        return self.monitors.get_completions(prefix)
+
+    def complete(self, text, state):
+        """Return the state-th completion of text, or None if no more.
+
+        This is the completer function called by readline when the user
+        presses tab. Commands are single letters, so only the words after
+        the first are completed.
+        """
+        if state == 0:
+            if readline.get_begidx() == 0:
+                self.completions = []
+            else:
+                self.completions = self.get_completions(text)
+        if state < len(self.completions):
+            return self.completions[state]
+        return None
+
+    def help_command(self):
+        """Print a list of valid commands."""
+        print("User commands:")
+        print("r N       - run the simulation for N cycles")
+        print("c N       - continue the simulation for N cycles")
+        print("s X N     - set switch X to N (0 or 1)")
+        print("m X       - set a monitor on signal X")
+        print("z X       - zap the monitor on signal X")
+        print("            (X may be a pattern such as nand* or d[1 TO 8].Q)")
+        print("l N       - allow N iterations to settle (0 for automatic)")
+        print("i         - show statistics of the executed cycles")
+        print("h         - help (this command)")
+        print("q         - quit the program")
+
+    def switch_command(self):
+        """Set the specified switch to the specified signal level."""
+        switch_id = self.read_name()
+        if switch_id is not None:
+            switch_state = self.read_number(0, 1)
+            if switch_state is not None:
+                if self.devices.set_switch(switch_id, switch_state):
+                    print("Successfully set switch.")
+                else:
+                    print("Error! Invalid switch.")
+
+
+
+
+    def add_con(self):
+        [device_id1, port_id1] = self.read_signal_name()
+        if device_id1:
+            if port_id1 == None:
+                [device_id2, port_id2] = self.read_signal_name()
+                if device_id2:
+                    device = self.devices.get_device(device_id2)
+                    if port_id2 in device.inputs.keys():
+                        self.network.make_connection(
+                        device_id1,
+                        port_id1,
+                        device_id2,
+                        port_id2)
+                    else:
+                        print('The input port used is invalid.')
+                else:
+                    print('Invalid input device.')
+            else:
+                print('Trying to connect input port of device ', self.names.get_name_string(device_id1))
+        else:
+            print('Invali output device.')
+    
+    
+    def remove_con(self):
+        [device_id1, port_id1] = self.read_signal_name()
+        if port_id1 == None:
+            [device_id2, port_id2] = self.read_signal_name()
+            if device_id2:
+                device = self.devices.get_device(device_id2)
+                if port_id2 in device.inputs.keys():
+                    device.inputs[port_id2] = None
+                else:
+                    print('The input port used is invalid.')
+            else:
+                print('There is no input device')
+        else:
+            device = self.devices.get_device(device_id1)
+            if port_id1 in device.inputs.keys():
+                device.inputs[port_id1] = None
+
+            else:
+                print('There is not input-input connection')
+
+    def monitor_command(self):
+        """Set the specified monitor, or one on every matching signal."""
+        monitors = self.read_signal_pattern()
+        if monitors is None:
+            return
+        if len(monitors) == 1:
+            [device, port] = monitors[0]
+            monitor_error = self.monitors.make_monitor(device, port,
+                                                       self.cycles_completed)
+            if monitor_error == self.monitors.NO_ERROR:
+                print("Successfully made monitor.")
+            else:
+                print("Error! Could not make monitor.")
+            return
+
+        # A pattern may cover signals monitored already
+        signals = [signal for signal in monitors
+                   if tuple(signal) not in self.monitors.monitors_dictionary]
+        monitor_error = self.monitors.make_monitors(signals,
+                                                    self.cycles_completed)
+        if monitor_error == self.monitors.NO_ERROR:
+            print(" ".join(["Successfully made", str(len(signals)), "of",
+                            str(len(monitors)), "monitors."]))
+        else:
+            print("Error! Could not make monitors.")
+
+    def zap_command(self):
+        """Remove the specified monitor, or those on every matching signal."""
+        monitors = self.read_signal_pattern()
+        if monitors is None:
+            return
+        if len(monitors) == 1:
+            [device, port] = monitors[0]
+            if self.monitors.remove_monitor(device, port):
+                print("Successfully zapped monitor")
+            else:
+                print("Error! Could not zap monitor.")
+            return
+
+        # A pattern may cover signals that are not monitored
+        signals = [signal for signal in monitors
+                   if tuple(signal) in self.monitors.monitors_dictionary]
+        if self.monitors.remove_monitors(signals):
+            print(" ".join(["Successfully zapped", str(len(signals)), "of",
+                            str(len(monitors)), "monitors."]))
+        else:
+            print("Error! Could not zap monitors.")
+
+    def limit_command(self):
+        """Set the number of iterations allowed for a cycle to settle.
+
+        A limit of 0 derives the limit from the logic depth of the network.
+        """
+        limit = self.read_number(0, None)
+        if limit is not None:
+            if limit == 0:
+                self.network.iteration_limit = None
+            else:
+                self.network.iteration_limit = limit
+            print(" ".join(["Settle iteration limit:",
+                            str(self.network.get_iteration_limit())]))
+
+    def metrics_command(self):
+        """Print the statistics of the cycles executed since the last run."""
+        summary = self.network.metrics.get_summary()
+        print(" ".join(["Executed cycles:", str(summary["executed_cycles"]),
+                        "(idle and repeated cycles are skipped)"]))
+        print(" ".join(["Settle iterations: mean",
+                        "{:.2f}".format(summary["mean_settle_iterations"]),
+                        "max", str(summary["max_settle_iterations"])]))
+        print(" ".join(["Devices evaluated:",
+                        str(summary["devices_evaluated"])]))
+        print(" ".join(["Signal transitions:", str(summary["transitions"]),
+                        "(activity factor",
+                        "{:.3f})".format(summary["activity_factor"])]))
+        print(" ".join(["D-type captures:",
+                        str(summary["d_type_captures"])]))
+        print(" ".join(["Clock edges:", str(summary["clock_edges"])]))
+
+    def run_network(self, cycles):
+        """Run the network for the specified number of simulation cycles.
+
+        Return True if successful.
+        """
+        if not self.network.execute_cycles(cycles, self.monitors):
+            print("Error! Network oscillating.")
+            if self.network.oscillating_devices:
+                loop = [self.names.get_name_string(device_id) for device_id
+                        in self.network.oscillating_devices]
+                print("".join(["Oscillating loop: ", ", ".join(loop)]))
+            return False
+        if self.network.detected_period is not None:
+            print(" ".join(["Network repeats every",
+                            str(self.network.detected_period), "cycles."]))
+        self.monitors.display_signals()
+        return True
+
+    def run_command(self):
+        """Run the simulation from scratch."""
+        self.cycles_completed = 0
+        cycles = self.read_number(0, None)
+
+        if cycles is not None:  # if the number of cycles provided is valid
+            self.monitors.reset_monitors()
+            print("".join(["Running for ", str(cycles), " cycles"]))
+            self.devices.cold_startup(self.seed)
+            self.network.reset_clocks()
+            if self.run_network(cycles):
+                self.cycles_completed += cycles
+
+    def continue_command(self):
+        """Continue a previously run simulation."""
+        cycles = self.read_number(0, None)
+        if cycles is not None:  # if the number of cycles provided is valid
+            if self.cycles_completed == 0:
+                print("Error! Nothing to continue. Run first.")
+            elif self.run_network(cycles):
+                self.cycles_completed += cycles
+                print(" ".join(["Continuing for", str(cycles), "cycles.",
+                                "Total:", str(self.cycles_completed)]))